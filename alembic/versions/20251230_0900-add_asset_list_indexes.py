@@ -0,0 +1,56 @@
+"""Add tenant-scoped list indexes on sites and chargers
+
+Revision ID: add_asset_list_indexes
+Revises: add_notification_tables
+Create Date: 2025-12-30 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_asset_list_indexes'
+down_revision = 'add_notification_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # list_sites / list_chargers filter by tenant (and optionally site) and
+    # page with a (name, id) keyset. Each index ends in (name, id) so a page
+    # is a range scan from the cursor that stops after LIMIT + 1 rows with
+    # no sort; tenant-wide charger listings need their own (tenant_id, name,
+    # id) index because the site-scoped one is not in name order across
+    # sites. Built CONCURRENTLY to avoid blocking writes on populated tables,
+    # which requires running outside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sites_tenant_name_id', 'sites', ['tenant_id', 'name', 'id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_chargers_tenant_name_id', 'chargers', ['tenant_id', 'name', 'id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_chargers_tenant_site_name_id', 'chargers',
+            ['tenant_id', 'site_id', 'name', 'id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chargers_tenant_site_name_id', table_name='chargers',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_chargers_tenant_name_id', table_name='chargers',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_sites_tenant_name_id', table_name='sites',
+            postgresql_concurrently=True
+        )
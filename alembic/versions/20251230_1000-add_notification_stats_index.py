@@ -0,0 +1,33 @@
+"""Add covering index for notification statistics
+
+Revision ID: add_notification_stats_index
+Revises: add_asset_list_indexes
+Create Date: 2025-12-30 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_notification_stats_index'
+down_revision = 'add_asset_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # get_notification_statistics groups the tenant's logs in a created_at
+    # window by status, channel and event_type. One (tenant_id, created_at)
+    # index carrying all three columns serves every GROUP BY as an
+    # index-only range scan. CONCURRENTLY is not supported on partitioned
+    # tables; the index cascades to every partition.
+    op.create_index(
+        'ix_notification_logs_tenant_created_stats', 'notification_logs',
+        ['tenant_id', 'created_at'],
+        postgresql_include=['status', 'channel', 'event_type']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_logs_tenant_created_stats', table_name='notification_logs')
@@ -0,0 +1,55 @@
+"""Add per-tenant daily notification counters
+
+Revision ID: add_notification_counters
+Revises: add_notification_stats_index
+Create Date: 2025-12-30 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_notification_counters'
+down_revision = 'add_notification_stats_index'
+branch_labels = None
+depends_on = None
+
+
+# Enum values in declaration order: the smallint code stored in
+# notification_logs is the 1-based position in these lists.
+DIMENSIONS = {
+    'status': ['pending', 'sent', 'delivered', 'failed', 'cancelled'],
+    'channel': ['email', 'sms', 'in_app'],
+    'event_type': [
+        'ticket_created', 'ticket_assigned', 'ticket_status_changed', 'ticket_comment_added',
+        'sla_breach', 'sla_warning', 'worklog_added', 'assignment_due',
+    ],
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'notification_counters',
+        sa.Column('tenant_id', sa.String(), sa.ForeignKey('tenants.id'), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('dimension', sa.String(16), nullable=False),
+        sa.Column('key', sa.String(32), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('tenant_id', 'day', 'dimension', 'key'),
+    )
+
+    # Backfill from the existing log history, one pass per dimension
+    for dimension, values in DIMENSIONS.items():
+        cases = ' '.join(f"WHEN {code} THEN '{value}'" for code, value in enumerate(values, start=1))
+        op.execute(
+            f"INSERT INTO notification_counters (tenant_id, day, dimension, key, count) "
+            f"SELECT tenant_id, CAST(created_at AS DATE), '{dimension}', "
+            f"CASE {dimension} {cases} END, count(*) "
+            f"FROM notification_logs "
+            f"GROUP BY tenant_id, CAST(created_at AS DATE), {dimension}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('notification_counters')
@@ -0,0 +1,48 @@
+"""Add ticket_daily_rollup materialized view for reports
+
+Revision ID: add_ticket_daily_rollup
+Revises: add_notification_counters
+Create Date: 2025-12-30 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_ticket_daily_rollup'
+down_revision = 'add_notification_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Report endpoints sum these rows instead of scanning tickets. Closed
+    # tickets contribute their opened -> closed seconds for the average
+    # resolution time.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW ticket_daily_rollup AS
+        SELECT
+            tenant_id,
+            CAST(created_at AS DATE) AS day,
+            current_status,
+            priority,
+            category,
+            count(*) AS ticket_count,
+            count(*) FILTER (WHERE sla_breached) AS breached_count,
+            count(closed_at) AS closed_count,
+            sum(extract(epoch FROM closed_at - opened_at)) AS resolution_seconds
+        FROM tickets
+        GROUP BY tenant_id, CAST(created_at AS DATE), current_status, priority, category
+        """
+    )
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_ticket_daily_rollup', 'ticket_daily_rollup',
+        ['tenant_id', 'day', 'current_status', 'priority', 'category'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS ticket_daily_rollup")
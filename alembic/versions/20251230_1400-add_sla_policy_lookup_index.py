@@ -0,0 +1,38 @@
+"""Add partial index for active SLA policy lookups
+
+Revision ID: add_sla_policy_lookup_index
+Revises: add_ticket_report_index
+Create Date: 2025-12-30 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_sla_policy_lookup_index'
+down_revision = 'add_ticket_report_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Policy creation and per-ticket SLA calculation look up the active
+    # policy by (tenant_id, category, priority). Only active policies are
+    # ever matched, so a partial index keeps it small. Built CONCURRENTLY to
+    # avoid blocking policy writes, which requires running outside a
+    # transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sla_policies_active_lookup', 'sla_policies', ['tenant_id', 'category', 'priority'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_sla_policies_active_lookup', table_name='sla_policies',
+            postgresql_concurrently=True
+        )
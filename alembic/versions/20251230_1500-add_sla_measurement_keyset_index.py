@@ -0,0 +1,38 @@
+"""Add keyset pagination index for SLA measurements
+
+Revision ID: add_sla_measurement_keyset_index
+Revises: add_sla_policy_lookup_index
+Create Date: 2025-12-30 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_sla_measurement_keyset_index'
+down_revision = 'add_sla_policy_lookup_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # /sla/measurements pages are ordered by (created_at DESC, id DESC) and
+    # continue from a (created_at, id) cursor, so the index serves both the
+    # order and the row-value comparison. Built CONCURRENTLY to avoid
+    # blocking measurement writes, which requires running outside a
+    # transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sla_measurements_created_id', 'sla_measurements',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_sla_measurements_created_id', table_name='sla_measurements',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,48 @@
+"""Add sla_daily_rollup materialized view for SLA statistics
+
+Revision ID: add_sla_daily_rollup
+Revises: add_sla_measurement_keyset_index
+Create Date: 2025-12-30 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_sla_daily_rollup'
+down_revision = 'add_sla_measurement_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # /sla/statistics sums these rows instead of joining every ticket in the
+    # period to its measurements. One row per tenant and ticket open date;
+    # tickets without a measurement count towards ticket_count only.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW sla_daily_rollup AS
+        SELECT
+            t.tenant_id,
+            CAST(t.opened_at AS DATE) AS day,
+            count(DISTINCT t.id) AS ticket_count,
+            count(m.id) AS measurement_count,
+            count(m.id) FILTER (WHERE m.status = 'BREACHED') AS breached_count,
+            count(m.id) FILTER (WHERE m.status = 'MET') AS met_count,
+            count(m.id) FILTER (WHERE m.status = 'ACTIVE') AS active_count,
+            count(m.id) FILTER (WHERE m.status = 'CANCELLED') AS cancelled_count
+        FROM tickets t
+        LEFT JOIN sla_measurements m ON m.ticket_id = t.id
+        GROUP BY t.tenant_id, CAST(t.opened_at AS DATE)
+        """
+    )
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_sla_daily_rollup', 'sla_daily_rollup',
+        ['tenant_id', 'day'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS sla_daily_rollup")
@@ -0,0 +1,51 @@
+"""Add composite indexes for ticket, status history and worklog lists
+
+Revision ID: add_ticket_list_indexes
+Revises: add_sla_daily_rollup
+Create Date: 2025-12-30 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_ticket_list_indexes'
+down_revision = 'add_sla_daily_rollup'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+INDEXES = [
+    # GET /tickets filtered by status: equality on tenant and status, then
+    # the created_at DESC order, so a page is read straight off the index.
+    # Unfiltered lists already use ix_tickets_tenant_created_cov.
+    (
+        'ix_tickets_tenant_status_created', 'tickets',
+        ['tenant_id', 'current_status', sa.text('created_at DESC')]
+    ),
+    # Ticket status history and worklog lists, newest first per ticket
+    (
+        'ix_ticket_status_history_ticket_changed', 'ticket_status_history',
+        ['ticket_id', sa.text('changed_at DESC')]
+    ),
+    (
+        'ix_worklogs_ticket_created', 'worklogs',
+        ['ticket_id', sa.text('created_at DESC')]
+    ),
+]
+
+
+def upgrade() -> None:
+    # Built CONCURRENTLY to avoid blocking writes, which requires running
+    # outside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,27 @@
+"""Add resend request time to notification logs
+
+Revision ID: add_notification_resend_requested_at
+Revises: add_ticket_list_indexes
+Create Date: 2025-12-30 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_notification_resend_requested_at'
+down_revision = 'add_ticket_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # When a resend was queued, so an entry left PENDING by a lost
+    # background task can be resent again after a grace period. Nullable
+    # with no default, so adding it to the partitioned table rewrites nothing.
+    op.add_column('notification_logs', sa.Column('resend_requested_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('notification_logs', 'resend_requested_at')
@@ -1,62 +1,98 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import List, Optional
+from sqlalchemy import select, and_, lambda_stmt, tuple_
+from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, tenant_filter, tenant_params
 from app.api.v1.auth import get_current_user
 from app.models.user import User
 from app.models.asset import Site, Charger
-from app.schemas.asset import SiteResponse, ChargerResponse, ChargerDetail
+from app.schemas.asset import (
+    AssetPageCursor, SiteListResponse, ChargerListResponse, ChargerDetail
+)
 
 router = APIRouter()
 
 
-@router.get("/sites", response_model=List[SiteResponse])
+def _check_cursor(after_name: Optional[str], after_id: Optional[str]) -> bool:
+    """Validate keyset cursor params; returns True when a cursor was given."""
+    if (after_name is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_name and after_id must be provided together"
+        )
+    return after_name is not None
+
+
+def _next_cursor(rows: list, limit: int) -> Optional[AssetPageCursor]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    return AssetPageCursor(after_name=rows[-1].name, after_id=rows[-1].id)
+
+
+@router.get("/sites", response_model=SiteListResponse)
 async def list_sites(
     is_active: Optional[bool] = Query(None),
-    skip: int = Query(0, ge=0),
+    after_name: Optional[str] = Query(None),
+    after_id: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List sites."""
-    query = select(Site).where(Site.tenant_id == current_user.tenant_id)
+    """List sites, keyset-paginated on (name, id)."""
+    has_cursor = _check_cursor(after_name, after_id)
+
+    # lambda_stmt caches the compiled SQL per statement shape; closure
+    # values are extracted as bound parameters on each call and the tenant
+    # comes from the request-scoped tenant_params().
+    query = lambda_stmt(lambda: select(Site).where(tenant_filter(Site)))
 
     if is_active is not None:
-        query = query.where(Site.is_active == is_active)
+        query += lambda s: s.where(Site.is_active == is_active)
+    if has_cursor:
+        query += lambda s: s.where(tuple_(Site.name, Site.id) > tuple_(after_name, after_id))
 
-    query = query.order_by(Site.name).offset(skip).limit(limit)
+    # Fetch one extra row to know whether another page exists.
+    query += lambda s: s.order_by(Site.name, Site.id).limit(limit + 1)
 
-    result = await db.execute(query)
-    sites = result.scalars().all()
+    result = await db.execute(query, tenant_params())
+    sites = list(result.scalars().all())
+    next_cursor = _next_cursor(sites, limit)
 
-    return sites
+    return SiteListResponse(items=sites, next_cursor=next_cursor)
 
 
-@router.get("/chargers", response_model=List[ChargerResponse])
+@router.get("/chargers", response_model=ChargerListResponse)
 async def list_chargers(
     site_id: Optional[str] = Query(None),
     is_active: Optional[bool] = Query(None),
-    skip: int = Query(0, ge=0),
+    after_name: Optional[str] = Query(None),
+    after_id: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List chargers."""
-    query = select(Charger).where(Charger.tenant_id == current_user.tenant_id)
+    """List chargers, keyset-paginated on (name, id)."""
+    has_cursor = _check_cursor(after_name, after_id)
+
+    query = lambda_stmt(lambda: select(Charger).where(tenant_filter(Charger)))
 
     if site_id:
-        query = query.where(Charger.site_id == site_id)
+        query += lambda s: s.where(Charger.site_id == site_id)
     if is_active is not None:
-        query = query.where(Charger.is_active == is_active)
+        query += lambda s: s.where(Charger.is_active == is_active)
+    if has_cursor:
+        query += lambda s: s.where(tuple_(Charger.name, Charger.id) > tuple_(after_name, after_id))
 
-    query = query.order_by(Charger.name).offset(skip).limit(limit)
+    query += lambda s: s.order_by(Charger.name, Charger.id).limit(limit + 1)
 
-    result = await db.execute(query)
-    chargers = result.scalars().all()
+    result = await db.execute(query, tenant_params())
+    chargers = list(result.scalars().all())
+    next_cursor = _next_cursor(chargers, limit)
 
-    return chargers
+    return ChargerListResponse(items=chargers, next_cursor=next_cursor)
 
 
 @router.get("/chargers/{charger_id}", response_model=ChargerDetail)
@@ -67,12 +103,13 @@ async def get_charger(
 ):
     """Get charger details."""
     result = await db.execute(
-        select(Charger).where(
+        lambda_stmt(lambda: select(Charger).where(
             and_(
                 Charger.id == charger_id,
-                Charger.tenant_id == current_user.tenant_id
+                tenant_filter(Charger)
             )
-        )
+        )),
+        tenant_params()
     )
     charger = result.scalar_one_or_none()
 
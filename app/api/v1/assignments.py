@@ -1,15 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert, literal
 from datetime import datetime
+import uuid
 
-from app.core.database import get_db
+from app.core.database import get_db, tenant_filter, tenant_params
 from app.api.v1.auth import get_current_user
 from app.models.user import User
 from app.models.ticket import Ticket
 from app.models.assignment import Assignment
 from app.schemas.assignment import AssignmentCreate, AssignmentResponse
-from app.services.event_publisher import event_publisher
+from app.services.event_publisher import assignment_event_queue
 
 router = APIRouter()
 
@@ -18,45 +19,44 @@ router = APIRouter()
 async def assign_ticket(
     ticket_id: str,
     assignment_data: AssignmentCreate,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Assign ticket to user or vendor."""
-    # Verify ticket exists
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
+    # Insert straight from a tenant-scoped SELECT on the ticket, so the
+    # existence/tenant check and the INSERT are one round trip: an unknown
+    # or foreign ticket selects no row and nothing is inserted.
+    values = {
+        "id": str(uuid.uuid4()),
+        "ticket_id": ticket_id,
+        "assigned_by": current_user.id,
+        "assigned_at": datetime.utcnow(),
+        **assignment_data.model_dump()
+    }
+    columns = Assignment.__table__.c
+    source = select(
+        *[literal(value, columns[name].type) for name, value in values.items()]
+    ).where(
+        and_(
+            Ticket.id == ticket_id,
+            tenant_filter(Ticket)
         )
+    ).params(tenant_params())
+
+    result = await db.scalars(
+        insert(Assignment).from_select(list(values), source).returning(Assignment)
     )
-    ticket = result.scalar_one_or_none()
+    assignment = result.one_or_none()
 
-    if not ticket:
+    if not assignment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
         )
 
-    # Create assignment
-    assignment = Assignment(
-        ticket_id=ticket_id,
-        assigned_by=current_user.id,
-        **assignment_data.model_dump()
-    )
-
-    db.add(assignment)
     await db.commit()
-    await db.refresh(assignment)
-
-    # Publish SSE event for assignment
-    background_tasks.add_task(
-        event_publisher.publish_assignment,
-        assignment,
-        ticket,
-        current_user.id
-    )
+
+    # Publish SSE event for assignment (loaded and sent by the queue worker)
+    assignment_event_queue.enqueue(assignment, ticket_id, current_user.id)
 
     return assignment
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, lambda_stmt, literal
 from typing import List
+from functools import lru_cache
+import asyncio
 import boto3
 from botocore.config import Config
 
-from app.core.database import get_db
+from app.core.database import get_db, tenant_filter, tenant_params
 from app.core.config import settings
 from app.api.v1.auth import get_current_user
 from app.models.user import User
@@ -16,14 +18,21 @@ from app.schemas.attachment import AttachmentCreate, AttachmentResponse, Presign
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_s3_client():
-    """Get S3 client."""
+    """
+    Get the process-wide S3 client.
+
+    Building a boto3 client loads botocore service models, which costs far
+    more than signing a URL, so one client is created lazily and reused.
+    botocore clients are thread-safe.
+    """
     return boto3.client(
         's3',
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         region_name=settings.AWS_REGION,
-        config=Config(signature_version='s3v4')
+        config=Config(signature_version='s3v4', max_pool_connections=64)
     )
 
 
@@ -41,17 +50,21 @@ async def generate_presigned_url(
     timestamp = datetime.utcnow().strftime('%Y%m%d')
     file_key = f"attachments/{current_user.tenant_id}/{timestamp}/{uuid.uuid4()}/{file_name}"
 
-    # Generate presigned URL
-    s3_client = get_s3_client()
-    presigned_url = s3_client.generate_presigned_url(
-        'put_object',
-        Params={
-            'Bucket': settings.S3_BUCKET_NAME,
-            'Key': file_key,
-            'ContentType': mime_type
-        },
-        ExpiresIn=3600  # 1 hour
-    )
+    # Generate presigned URL. Signing is synchronous HMAC work in botocore,
+    # so run it in the default executor to keep the event loop free.
+    def presign_sync():
+        return get_s3_client().generate_presigned_url(
+            'put_object',
+            Params={
+                'Bucket': settings.S3_BUCKET_NAME,
+                'Key': file_key,
+                'ContentType': mime_type
+            },
+            ExpiresIn=3600  # 1 hour
+        )
+
+    loop = asyncio.get_running_loop()
+    presigned_url = await loop.run_in_executor(None, presign_sync)
 
     return {
         "upload_url": presigned_url,
@@ -67,18 +80,18 @@ async def create_attachment(
     db: AsyncSession = Depends(get_db)
 ):
     """Register attachment metadata after upload."""
-    # Verify ticket exists
-    result = await db.execute(
-        select(Ticket).where(
+    # Verify ticket exists (existence only; no ticket columns are needed)
+    ticket_exists = await db.scalar(
+        lambda_stmt(lambda: select(literal(1)).where(
             and_(
                 Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
+                tenant_filter(Ticket)
             )
-        )
+        )),
+        tenant_params()
     )
-    ticket = result.scalar_one_or_none()
 
-    if not ticket:
+    if not ticket_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
@@ -106,29 +119,28 @@ async def list_attachments(
     db: AsyncSession = Depends(get_db)
 ):
     """List attachments for ticket."""
-    # Verify ticket exists
+    # Verify ticket and fetch attachments in one round trip: the outer join
+    # yields no rows for an unknown ticket and a single (id, None) row for a
+    # ticket without attachments.
     result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
+        lambda_stmt(lambda: select(Ticket.id, Attachment)
+            .outerjoin(Attachment, Attachment.ticket_id == Ticket.id)
+            .where(
+                and_(
+                    Ticket.id == ticket_id,
+                    tenant_filter(Ticket)
+                )
             )
-        )
+            .order_by(Attachment.created_at.desc())
+        ),
+        tenant_params()
     )
-    ticket = result.scalar_one_or_none()
+    rows = result.all()
 
-    if not ticket:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
         )
 
-    # Get attachments
-    result = await db.execute(
-        select(Attachment)
-        .where(Attachment.ticket_id == ticket_id)
-        .order_by(Attachment.created_at.desc())
-    )
-    attachments = result.scalars().all()
-
-    return attachments
+    return [attachment for _, attachment in rows if attachment is not None]
@@ -3,11 +3,12 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import timedelta
+from typing import FrozenSet
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, current_tenant_id
 from app.core.security import verify_password, create_access_token, decode_access_token
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.schemas.auth import Token, UserResponse
 
 router = APIRouter()
@@ -45,9 +46,29 @@ async def get_current_user(
             detail="User account is inactive"
         )
 
+    current_tenant_id.set(user.tenant_id)
+
     return user
 
 
+def require_roles(roles: FrozenSet[UserRole], detail: str = "Not enough permissions"):
+    """
+    Dependency factory that admits only users whose role is in `roles`.
+
+    Returns the authenticated user, so handlers can use it in place of
+    get_current_user.
+    """
+    async def check_role(current_user: User = Depends(get_current_user)) -> User:
+        if current_user.role not in roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+        return current_user
+
+    return check_role
+
+
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
@@ -1,46 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, insert, literal
 from typing import List, Optional
 from datetime import datetime
+import logging
 import httpx
+import ijson
+import orjson
+from starlette.background import BackgroundTask
 
-from app.core.database import get_db
+from app.core.database import get_db, tenant_filter, tenant_params
 from app.core.config import settings
 from app.api.v1.auth import get_current_user
 from app.models.user import User
 from app.models.asset import Charger
+from app.models.ticket import Ticket
 from app.models.csms import CsmsEventRef, FirmwareJobRef
 from app.schemas.csms import ChargerStatusResponse, CsmsEventResponse, FirmwareJobResponse, FirmwareJobCreate
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
-async def get_csms_client():
-    """Get CSMS HTTP client."""
+def create_csms_client() -> httpx.AsyncClient:
+    """
+    Create the shared CSMS HTTP client.
+
+    Built once in the application lifespan so every request reuses the same
+    keep-alive connection pool (and HTTP/2 multiplexing) instead of paying a
+    fresh TCP + TLS handshake per call.
+    """
     return httpx.AsyncClient(
         base_url=settings.CSMS_API_BASE_URL,
-        headers={"Authorization": f"Bearer {settings.CSMS_API_KEY}"}
+        headers={"Authorization": f"Bearer {settings.CSMS_API_KEY}"},
+        http2=True,
+        timeout=httpx.Timeout(5.0),
+        limits=httpx.Limits(max_keepalive_connections=64)
     )
 
 
+def get_csms_client(request: Request) -> httpx.AsyncClient:
+    """Get the shared CSMS HTTP client from application state."""
+    return request.app.state.csms_client
+
+
 @router.get("/chargers/{charger_id}/status", response_model=ChargerStatusResponse)
 async def get_charger_status(
     charger_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    client: httpx.AsyncClient = Depends(get_csms_client)
 ):
     """Get charger status from CSMS."""
-    # Verify charger exists
+    # Verify charger exists; only its CSMS id is needed
     result = await db.execute(
-        select(Charger).where(
+        select(Charger.csms_charger_id).where(
             and_(
                 Charger.id == charger_id,
-                Charger.tenant_id == current_user.tenant_id
+                tenant_filter(Charger)
             )
-        )
+        ),
+        tenant_params()
     )
-    charger = result.scalar_one_or_none()
+    charger = result.first()
 
     if not charger:
         raise HTTPException(
@@ -49,16 +74,15 @@ async def get_charger_status(
         )
 
     # Get status from CSMS
-    async with await get_csms_client() as client:
-        try:
-            response = await client.get(f"/chargers/{charger.csms_charger_id}/status")
-            response.raise_for_status()
-            csms_data = response.json()
-        except httpx.HTTPError as e:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"CSMS communication error: {str(e)}"
-            )
+    try:
+        response = await client.get(f"/chargers/{charger.csms_charger_id}/status")
+        response.raise_for_status()
+        csms_data = response.json()
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"CSMS communication error: {str(e)}"
+        )
 
     return {
         "charger_id": charger_id,
@@ -69,25 +93,78 @@ async def get_charger_status(
     }
 
 
-@router.get("/chargers/{charger_id}/events", response_model=List[CsmsEventResponse])
+class _AsyncByteReader:
+    """Adapt an httpx byte stream to the async file-like read() ijson expects."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str and treats any
+        # other empty read as EOF, so don't consume on a probe and skip
+        # empty chunks.
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+# Last NDJSON line of a stream cut short by a CSMS or parse failure
+STREAM_ABORTED_LINE = orjson.dumps({"error": "CSMS event stream aborted"}).decode() + "\n"
+
+
+async def _stream_events_ndjson(response: httpx.Response, charger_id: str):
+    """
+    Parse the CSMS events array incrementally and emit one JSON line per event.
+
+    The upstream response is also closed by the StreamingResponse background
+    task, since a client disconnect cancels this generator without closing it.
+    """
+    try:
+        async for event in ijson.items(_AsyncByteReader(response), "events.item", use_float=True):
+            yield CsmsEventResponse.model_validate(event).model_dump_json(exclude_unset=True) + "\n"
+    except (httpx.HTTPError, ijson.JSONError, ValidationError) as e:
+        # Headers are already sent, so the stream can only be cut short; a
+        # final error line tells clients it is incomplete.
+        logger.error(f"CSMS event stream for charger {charger_id} aborted: {e}")
+        yield STREAM_ABORTED_LINE
+    finally:
+        await response.aclose()
+
+
+@router.get(
+    "/chargers/{charger_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
 async def get_charger_events(
     charger_id: str,
     from_date: Optional[datetime] = Query(None),
     to_date: Optional[datetime] = Query(None),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    client: httpx.AsyncClient = Depends(get_csms_client)
 ):
-    """Get charger events from CSMS."""
-    # Verify charger exists
+    """
+    Get charger events from CSMS.
+
+    Events are streamed as NDJSON (one CsmsEventResponse per line) while the
+    CSMS response is still being read, so large time ranges are never held
+    in memory as a whole.
+    """
+    # Verify charger exists; only its CSMS id is needed
     result = await db.execute(
-        select(Charger).where(
+        select(Charger.csms_charger_id).where(
             and_(
                 Charger.id == charger_id,
-                Charger.tenant_id == current_user.tenant_id
+                tenant_filter(Charger)
             )
-        )
+        ),
+        tenant_params()
     )
-    charger = result.scalar_one_or_none()
+    charger = result.first()
 
     if not charger:
         raise HTTPException(
@@ -96,27 +173,60 @@ async def get_charger_events(
         )
 
     # Get events from CSMS
-    async with await get_csms_client() as client:
-        try:
-            params = {}
-            if from_date:
-                params["from"] = from_date.isoformat()
-            if to_date:
-                params["to"] = to_date.isoformat()
-
-            response = await client.get(
-                f"/chargers/{charger.csms_charger_id}/events",
-                params=params
-            )
-            response.raise_for_status()
-            csms_events = response.json()
-        except httpx.HTTPError as e:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"CSMS communication error: {str(e)}"
+    params = {}
+    if from_date:
+        params["from"] = from_date.isoformat()
+    if to_date:
+        params["to"] = to_date.isoformat()
+
+    # Open the stream up front so connection and status errors still map
+    # to a 502 before any bytes of the response are sent.
+    try:
+        request = client.build_request(
+            "GET",
+            f"/chargers/{charger.csms_charger_id}/events",
+            params=params
+        )
+        response = await client.send(request, stream=True)
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"CSMS communication error: {str(e)}"
+        )
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        await response.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"CSMS communication error: {str(e)}"
+        )
+
+    return StreamingResponse(
+        _stream_events_ndjson(response, charger_id),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(response.aclose)
+    )
+
+
+async def _ensure_ticket_exists(db: AsyncSession, ticket_id: str) -> None:
+    """Raise 404 unless the ticket exists in the request tenant, without loading the row."""
+    ticket_exists = await db.scalar(
+        select(literal(1)).where(
+            and_(
+                Ticket.id == ticket_id,
+                tenant_filter(Ticket)
             )
+        ),
+        tenant_params()
+    )
 
-    return csms_events.get("events", [])
+    if not ticket_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
 
 
 @router.post("/tickets/{ticket_id}/firmware-jobs", response_model=FirmwareJobResponse, status_code=status.HTTP_201_CREATED)
@@ -129,6 +239,7 @@ async def create_firmware_job_request(
     """Create firmware update job reference (request object only)."""
     # This creates a reference to a firmware job that should be managed in CSMS
     # CASS only tracks the job status, not the actual firmware update process
+    await _ensure_ticket_exists(db, ticket_id)
 
     firmware_job = FirmwareJobRef(
         ticket_id=ticket_id,
@@ -143,3 +254,46 @@ async def create_firmware_job_request(
     await db.refresh(firmware_job)
 
     return firmware_job
+
+
+@router.post("/tickets/{ticket_id}/firmware-jobs/bulk", response_model=List[FirmwareJobResponse], status_code=status.HTTP_201_CREATED)
+async def create_firmware_job_requests_bulk(
+    ticket_id: str,
+    jobs: List[FirmwareJobCreate] = Body(..., min_length=1, max_length=1000),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create firmware update job references for many chargers at once."""
+    await _ensure_ticket_exists(db, ticket_id)
+
+    # Every referenced charger must belong to the request tenant; checked
+    # with one COUNT instead of a lookup per job.
+    charger_ids = {job.charger_id for job in jobs}
+    charger_count = await db.scalar(
+        select(func.count()).select_from(Charger).where(
+            and_(
+                Charger.id.in_(charger_ids),
+                tenant_filter(Charger)
+            )
+        ),
+        tenant_params()
+    )
+
+    if charger_count != len(charger_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Charger not found"
+        )
+
+    # One executemany INSERT (batched with RETURNING) and a single commit,
+    # instead of a round trip and commit per job during bulk rollouts.
+    rows = [job.model_dump() | {"ticket_id": ticket_id} for job in jobs]
+
+    result = await db.scalars(
+        insert(FirmwareJobRef).returning(FirmwareJobRef, sort_by_parameter_order=True),
+        rows
+    )
+    firmware_jobs = result.all()
+    await db.commit()
+
+    return firmware_jobs
@@ -6,19 +6,62 @@ and JSON statistics summary.
 """
 
 from fastapi import APIRouter, Response, Depends, HTTPException, status
-from fastapi.responses import PlainTextResponse, JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import PlainTextResponse, ORJSONResponse, StreamingResponse
+from starlette.routing import Route
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy import text
+from functools import lru_cache
 from typing import Optional
+import asyncio
 import logging
+import time
 
-from app.core.database import get_db
+import orjson
+
+from app.core.database import get_probe_engine
+from app.core.response_cache import response_cache
 from app.services.metrics_service import metrics_collector, PROMETHEUS_AVAILABLE
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Process-local copy of the last rendered Prometheus payload, so overlapping
+# scrapes within METRICS_CACHE_TTL share one registry walk.
+_prometheus_cache = {"body": None, "content_type": None, "ts": 0.0}
+_prometheus_lock = asyncio.Lock()
+_PROMETHEUS_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0"
+}
+
+
+def _is_prometheus_cache_fresh(ttl: float) -> bool:
+    # Check the body explicitly: monotonic() may itself be below the TTL
+    # shortly after boot, so ts == 0.0 cannot mark an empty cache.
+    return (
+        _prometheus_cache["body"] is not None
+        and time.monotonic() - _prometheus_cache["ts"] < ttl
+    )
+
+
+async def _render_prometheus_metrics() -> tuple:
+    """Return (body, content_type), reusing the cached payload while fresh."""
+    ttl = settings.METRICS_CACHE_TTL
+    if _is_prometheus_cache_fresh(ttl):
+        return _prometheus_cache["body"], _prometheus_cache["content_type"]
+
+    async with _prometheus_lock:
+        # Another scrape may have refreshed the payload while we waited
+        if _is_prometheus_cache_fresh(ttl):
+            return _prometheus_cache["body"], _prometheus_cache["content_type"]
+
+        _prometheus_cache["body"] = metrics_collector.get_prometheus_metrics()
+        _prometheus_cache["content_type"] = metrics_collector.get_prometheus_content_type()
+        _prometheus_cache["ts"] = time.monotonic()
+        return _prometheus_cache["body"], _prometheus_cache["content_type"]
 
 
 @router.get(
@@ -47,17 +90,21 @@ async def get_prometheus_metrics():
         Prometheus text format metrics
     """
     try:
-        metrics_data = metrics_collector.get_prometheus_metrics()
-        content_type = metrics_collector.get_prometheus_content_type()
+        if settings.METRICS_CACHE_TTL <= 0:
+            # Nothing to reuse: stream family by family instead of
+            # assembling the whole payload first
+            return StreamingResponse(
+                metrics_collector.iter_prometheus_metrics(),
+                media_type=metrics_collector.get_prometheus_content_type(),
+                headers=_PROMETHEUS_HEADERS
+            )
+
+        metrics_data, content_type = await _render_prometheus_metrics()
 
         return Response(
             content=metrics_data,
             media_type=content_type,
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
+            headers=_PROMETHEUS_HEADERS
         )
     except Exception as e:
         logger.error(f"Failed to generate Prometheus metrics: {e}")
@@ -71,11 +118,11 @@ async def get_prometheus_metrics():
     "/metrics/health",
     summary="Detailed Health Check",
     description="Get detailed health status including system resources and component status",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     tags=["monitoring"]
 )
 async def get_health_details(
-    db: AsyncSession = Depends(get_db),
+    engine: AsyncEngine = Depends(get_probe_engine),
     include_db_check: bool = True
 ):
     """
@@ -95,15 +142,16 @@ async def get_health_details(
     Returns:
         JSON object with detailed health information
     """
-    try:
+    async def render_health() -> ORJSONResponse:
         health_data = metrics_collector.get_health_details()
 
         # Perform database health check if requested
         if include_db_check:
             try:
-                # Execute a simple query to verify database connectivity
-                result = await db.execute(text("SELECT 1"))
-                result.scalar()
+                # Raw connection from the probe pool, returned before the
+                # response is built
+                async with engine.connect() as conn:
+                    await conn.scalar(text("SELECT 1"))
                 health_data["database"]["healthy"] = True
                 health_data["database"]["connection"] = "ok"
             except Exception as db_error:
@@ -117,21 +165,29 @@ async def get_health_details(
 
         # Determine HTTP status code based on health status
         if health_data["status"] == "unhealthy":
-            return JSONResponse(
+            return ORJSONResponse(
                 content=health_data,
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         elif health_data["status"] == "degraded":
-            return JSONResponse(
+            return ORJSONResponse(
                 content=health_data,
                 status_code=status.HTTP_200_OK  # Still return 200 for degraded
             )
 
-        return health_data
+        return ORJSONResponse(content=health_data)
 
+    try:
+        # Cached briefly per include_db_check so probe bursts share one check
+        return await response_cache.get_or_compute(
+            f"metrics:health:{include_db_check}",
+            render_health,
+            min_ttl=2,
+            max_ttl=2
+        )
     except Exception as e:
         logger.error(f"Failed to generate health check: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "unhealthy",
                 "error": str(e),
@@ -145,7 +201,7 @@ async def get_health_details(
     "/metrics/stats",
     summary="JSON Statistics Summary",
     description="Get a JSON summary of all application metrics",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     tags=["monitoring"]
 )
 async def get_stats_summary():
@@ -164,12 +220,22 @@ async def get_stats_summary():
     Returns:
         JSON object with comprehensive metrics summary
     """
+    async def render_stats() -> ORJSONResponse:
+        # Already JSON-native; skip the jsonable_encoder pass
+        return ORJSONResponse(content=metrics_collector.get_stats_summary())
+
     try:
-        stats = metrics_collector.get_stats_summary()
-        return stats
+        # Short TTL collapses concurrent scrapes into one computation; the
+        # last good payload is served stale if generation fails.
+        return await response_cache.get_or_compute(
+            "metrics:stats",
+            render_stats,
+            min_ttl=1,
+            max_ttl=10
+        )
     except Exception as e:
         logger.error(f"Failed to generate stats summary: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "message": "Failed to generate stats summary"
@@ -184,7 +250,7 @@ async def get_stats_summary():
     description="Simple readiness probe for Kubernetes/container orchestration",
     tags=["monitoring"]
 )
-async def readiness_check(db: AsyncSession = Depends(get_db)):
+async def readiness_check(engine: AsyncEngine = Depends(get_probe_engine)):
     """
     Kubernetes-style readiness probe.
 
@@ -195,34 +261,61 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
     Returns 200 if ready, 503 if not ready.
     """
     try:
-        # Check database connectivity
-        result = await db.execute(text("SELECT 1"))
-        result.scalar()
+        # Check database connectivity on the probe pool, without an ORM session
+        async with engine.connect() as conn:
+            await conn.scalar(text("SELECT 1"))
 
         return {"status": "ready"}
 
     except Exception as e:
         logger.warning(f"Readiness check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "not_ready", "reason": str(e)},
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE
         )
 
 
-@router.get(
-    "/metrics/live",
-    summary="Liveness Check",
-    description="Simple liveness probe for Kubernetes/container orchestration",
-    tags=["monitoring"]
-)
-async def liveness_check():
+class LivenessProbe:
     """
-    Kubernetes-style liveness probe.
+    Kubernetes-style liveness probe as a bare ASGI app.
 
-    Simply returns 200 to indicate the application is alive.
-    This endpoint should be as lightweight as possible.
+    Simply returns 200 to indicate the application is alive. Registered as
+    a plain Starlette route so it skips FastAPI dependency resolution,
+    response validation and JSON encoding; the body is a constant.
     """
-    return {"status": "alive"}
+
+    body = b'{"status":"alive"}'
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+# A class instance (not a function) endpoint is served as a raw ASGI app
+router.routes.append(
+    Route("/metrics/live", endpoint=LivenessProbe(), methods=["GET"], name="liveness_check")
+)
+
+
+@lru_cache(maxsize=1)
+def get_app_info_payload() -> bytes:
+    """Serialized /metrics/info body, built once (warmed at startup)."""
+    return orjson.dumps({
+        "name": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "environment": getattr(settings, "ENVIRONMENT", "production"),
+        "debug": settings.DEBUG,
+        "features": {
+            "prometheus_metrics": PROMETHEUS_AVAILABLE,
+            "notifications_enabled": getattr(settings, "NOTIFICATION_ENABLED", False),
+            "email_configured": getattr(settings, "email_enabled", False),
+            "sms_configured": getattr(settings, "sms_enabled", False)
+        }
+    })
 
 
 @router.get(
@@ -235,18 +328,10 @@ async def get_app_info():
     """
     Get basic application information.
 
+    The payload only depends on settings fixed at startup, so the
+    pre-serialized bytes are returned as-is.
+
     Returns:
         Application name, version, environment, and feature flags
     """
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": getattr(settings, "ENVIRONMENT", "production"),
-        "debug": settings.DEBUG,
-        "features": {
-            "prometheus_metrics": PROMETHEUS_AVAILABLE,
-            "notifications_enabled": getattr(settings, "NOTIFICATION_ENABLED", False),
-            "email_configured": getattr(settings, "email_enabled", False),
-            "sms_configured": getattr(settings, "sms_enabled", False)
-        }
-    }
+    return Response(content=get_app_info_payload(), media_type="application/json")
@@ -4,26 +4,33 @@ Notification API Endpoints
 Provides REST API endpoints for notification preferences, settings, and testing.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 
 from app.core.config import settings
 from app.core.database import get_db
-from app.api.v1.auth import get_current_user
-from app.models.user import User, UserRole
+from app.core.response_cache import response_cache
+from app.core.responses import json_response
+from app.api.v1.auth import get_current_user, require_roles
+from app.models.user import User, ADMIN_ROLES, STAFF_ROLES
 from app.models.notification import (
     NotificationEventType,
     NotificationChannel,
     NotificationStatus,
-    UserNotificationPreference,
-    TenantNotificationSettings,
     NotificationLog,
+    NotificationCounter,
+)
+from app.services.notification_service import (
+    NotificationService,
+    record_notification_logs,
+    resend_notification_log,
 )
-from app.services.notification_service import NotificationService
 from app.schemas.notification import (
     NotificationPreferenceResponse,
     NotificationPreferenceUpdate,
@@ -38,13 +45,32 @@ from app.schemas.notification import (
 
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def get_notification_service(db: AsyncSession = Depends(get_db)) -> NotificationService:
+    """Per-request NotificationService bound to the request's session."""
+    return NotificationService(db)
 
 
 # ============================================================================
 # Notification System Status
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def get_notification_status_payload() -> bytes:
+    """Serialized /status body, built once (warmed at startup)."""
+    return NotificationStatusResponse(
+        email_enabled=settings.email_enabled,
+        sms_enabled=settings.sms_enabled,
+        email_provider="smtp",
+        sms_provider=settings.SMS_PROVIDER,
+        email_configured=bool(settings.SMTP_HOST),
+        sms_configured=settings.sms_enabled,
+        notifications_enabled=settings.NOTIFICATION_ENABLED
+    ).model_dump_json().encode()
+
+
 @router.get("/status", response_model=NotificationStatusResponse)
 async def get_notification_status(
     current_user: User = Depends(get_current_user)
@@ -53,16 +79,9 @@ async def get_notification_status(
     Get the current status of the notification system.
 
     Returns information about which notification channels are configured and enabled.
+    The payload only depends on settings, so the pre-serialized bytes are returned.
     """
-    return NotificationStatusResponse(
-        email_enabled=settings.email_enabled,
-        sms_enabled=settings.sms_enabled,
-        email_provider="smtp",
-        sms_provider=settings.SMS_PROVIDER,
-        email_configured=bool(settings.SMTP_HOST),
-        sms_configured=settings.sms_enabled,
-        notifications_enabled=settings.NOTIFICATION_ENABLED
-    )
+    return Response(content=get_notification_status_payload(), media_type="application/json")
 
 
 # ============================================================================
@@ -72,50 +91,42 @@ async def get_notification_status(
 @router.get("/preferences", response_model=NotificationPreferenceResponse)
 async def get_user_preferences(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Get the current user's notification preferences.
 
     Creates default preferences if none exist.
     """
-    notification_service = NotificationService(db)
     prefs = await notification_service.get_or_create_user_preferences(current_user.id)
-    return prefs
+    return json_response(NotificationPreferenceResponse.model_validate(prefs))
 
 
 @router.patch("/preferences", response_model=NotificationPreferenceResponse)
 async def update_user_preferences(
     preference_update: NotificationPreferenceUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Update the current user's notification preferences.
 
     Only provided fields will be updated; others remain unchanged.
     """
-    notification_service = NotificationService(db)
-    prefs = await notification_service.get_or_create_user_preferences(current_user.id)
-
-    # Update only provided fields
+    # Update only provided fields; a single upsert creates the row if needed
     update_data = preference_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(prefs, field, value)
-
-    prefs.updated_at = datetime.utcnow()
-    await db.commit()
-    await db.refresh(prefs)
+    prefs = await notification_service.update_user_preferences(current_user.id, update_data)
 
     logger.info(f"Updated notification preferences for user {current_user.id}")
-    return prefs
+    return json_response(NotificationPreferenceResponse.model_validate(prefs))
 
 
 @router.get("/preferences/{user_id}", response_model=NotificationPreferenceResponse)
 async def get_user_preferences_by_id(
     user_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Get notification preferences for a specific user (admin only).
@@ -123,7 +134,7 @@ async def get_user_preferences_by_id(
     Requires ADMIN or TENANT_ADMIN role.
     """
     # Check authorization
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
+    if current_user.role not in ADMIN_ROLES:
         if current_user.id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -147,9 +158,8 @@ async def get_user_preferences_by_id(
             detail="User not found"
         )
 
-    notification_service = NotificationService(db)
     prefs = await notification_service.get_or_create_user_preferences(user_id)
-    return prefs
+    return json_response(NotificationPreferenceResponse.model_validate(prefs))
 
 
 # ============================================================================
@@ -158,76 +168,41 @@ async def get_user_preferences_by_id(
 
 @router.get("/settings/tenant", response_model=TenantNotificationSettingsResponse)
 async def get_tenant_settings(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(
+        require_roles(ADMIN_ROLES, "Not authorized to view tenant settings")
+    ),
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Get notification settings for the current tenant.
 
     Requires ADMIN or TENANT_ADMIN role.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view tenant settings"
-        )
-
-    result = await db.execute(
-        select(TenantNotificationSettings).where(
-            TenantNotificationSettings.tenant_id == current_user.tenant_id
-        )
-    )
-    settings_obj = result.scalar_one_or_none()
-
-    if not settings_obj:
-        # Create default settings
-        settings_obj = TenantNotificationSettings(tenant_id=current_user.tenant_id)
-        db.add(settings_obj)
-        await db.commit()
-        await db.refresh(settings_obj)
-
-    return settings_obj
+    settings_obj = await notification_service.get_or_create_tenant_settings(current_user.tenant_id)
+    return json_response(TenantNotificationSettingsResponse.model_validate(settings_obj))
 
 
 @router.patch("/settings/tenant", response_model=TenantNotificationSettingsResponse)
 async def update_tenant_settings(
     settings_update: TenantNotificationSettingsUpdate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(
+        require_roles(ADMIN_ROLES, "Not authorized to update tenant settings")
+    ),
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Update notification settings for the current tenant.
 
     Requires ADMIN or TENANT_ADMIN role.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update tenant settings"
-        )
-
-    result = await db.execute(
-        select(TenantNotificationSettings).where(
-            TenantNotificationSettings.tenant_id == current_user.tenant_id
-        )
-    )
-    settings_obj = result.scalar_one_or_none()
-
-    if not settings_obj:
-        settings_obj = TenantNotificationSettings(tenant_id=current_user.tenant_id)
-        db.add(settings_obj)
-
-    # Update only provided fields
+    # Update only provided fields; a single upsert creates the row if needed
     update_data = settings_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(settings_obj, field, value)
-
-    settings_obj.updated_at = datetime.utcnow()
-    await db.commit()
-    await db.refresh(settings_obj)
+    settings_obj = await notification_service.update_tenant_settings(
+        current_user.tenant_id, update_data
+    )
 
     logger.info(f"Updated tenant notification settings for tenant {current_user.tenant_id}")
-    return settings_obj
+    return json_response(TenantNotificationSettingsResponse.model_validate(settings_obj))
 
 
 # ============================================================================
@@ -237,8 +212,9 @@ async def update_tenant_settings(
 @router.post("/test", response_model=TestNotificationResponse)
 async def send_test_notification(
     request: TestNotificationRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Send a test notification to verify configuration.
@@ -246,8 +222,6 @@ async def send_test_notification(
     Can send test emails or SMS to the specified recipient.
     If no recipient is provided, sends to the current user's email/phone.
     """
-    notification_service = NotificationService(db)
-
     # Determine recipient
     if request.channel == NotificationChannel.EMAIL:
         recipient = request.recipient_email or current_user.email
@@ -276,29 +250,40 @@ async def send_test_notification(
         message=request.message
     )
 
-    # Log the test notification
-    await notification_service.log_notification(
+    is_email = request.channel == NotificationChannel.EMAIL
+
+    log_entry = NotificationService.build_log_entry(
         tenant_id=current_user.tenant_id,
         event_type=NotificationEventType.TICKET_CREATED,  # Using as placeholder for test
         channel=request.channel,
         status=NotificationStatus.SENT if result["success"] else NotificationStatus.FAILED,
-        recipient_email=recipient if request.channel == NotificationChannel.EMAIL else None,
-        recipient_phone=recipient if request.channel == NotificationChannel.SMS else None,
+        recipient_email=recipient if is_email else None,
+        recipient_phone=None if is_email else recipient,
         user_id=current_user.id,
         subject=request.subject or "Test Notification",
         body_text=request.message,
-        provider=result.get("provider_message_id") and "smtp" if request.channel == NotificationChannel.EMAIL else settings.SMS_PROVIDER,
+        provider="smtp" if is_email else settings.SMS_PROVIDER,
         provider_message_id=result.get("provider_message_id"),
         error_message=result.get("error")
     )
 
-    return TestNotificationResponse(**result)
+    # Log the test notification after the response; the audit row is not
+    # needed to answer the caller
+    background_tasks.add_task(record_notification_logs, [log_entry])
+
+    return json_response(TestNotificationResponse.model_validate(result))
 
 
 # ============================================================================
 # Notification Logs
 # ============================================================================
 
+# Columns of NotificationLogResponse, so list queries skip the message bodies
+_LOG_LIST_COLUMNS = [
+    getattr(NotificationLog, field) for field in NotificationLogResponse.model_fields
+]
+
+
 @router.get("/logs", response_model=NotificationLogListResponse)
 async def list_notification_logs(
     event_type: Optional[NotificationEventType] = Query(None, description="Filter by event type"),
@@ -318,13 +303,14 @@ async def list_notification_logs(
     Requires ADMIN, TENANT_ADMIN, or AS_MANAGER role for full access.
     Regular users can only see their own notifications.
     """
-    # Build query
-    query = select(NotificationLog).where(
+    # Build query over the listed columns only (no body_text/body_html);
+    # the window count returns the filtered total with the page
+    query = select(*_LOG_LIST_COLUMNS, func.count().over().label("total")).where(
         NotificationLog.tenant_id == current_user.tenant_id
     )
 
     # Non-admin users can only see their own notifications
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.AS_MANAGER]:
+    if current_user.role not in STAFF_ROLES:
         query = query.where(NotificationLog.user_id == current_user.id)
     elif user_id:
         query = query.where(NotificationLog.user_id == user_id)
@@ -339,24 +325,29 @@ async def list_notification_logs(
     if ticket_id:
         query = query.where(NotificationLog.related_ticket_id == ticket_id)
 
-    # Get total count
-    from sqlalchemy import func
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
     # Apply pagination and ordering
-    query = query.order_by(NotificationLog.created_at.desc()).offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    logs = result.scalars().all()
+    result = await db.execute(
+        query.order_by(NotificationLog.created_at.desc()).offset(skip).limit(limit)
+    )
+    rows = result.mappings().all()
+
+    if rows:
+        total = rows[0]["total"]
+    elif skip:
+        # Page past the end: no row carries the window count
+        count_query = select(func.count()).select_from(
+            query.with_only_columns(NotificationLog.id).subquery()
+        )
+        total = await db.scalar(count_query) or 0
+    else:
+        total = 0
 
-    return NotificationLogListResponse(
-        logs=logs,
+    return json_response(NotificationLogListResponse(
+        logs=rows,
         total=total,
         skip=skip,
         limit=limit
-    )
+    ))
 
 
 @router.get("/logs/{log_id}", response_model=NotificationLogResponse)
@@ -376,7 +367,7 @@ async def get_notification_log(
     )
 
     # Non-admin users can only see their own notifications
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.AS_MANAGER]:
+    if current_user.role not in STAFF_ROLES:
         query = query.where(NotificationLog.user_id == current_user.id)
 
     result = await db.execute(query)
@@ -388,7 +379,7 @@ async def get_notification_log(
             detail="Notification log not found"
         )
 
-    return log
+    return json_response(NotificationLogResponse.model_validate(log))
 
 
 # ============================================================================
@@ -398,105 +389,101 @@ async def get_notification_log(
 @router.get("/statistics")
 async def get_notification_statistics(
     days: int = Query(30, ge=1, le=365, description="Number of days to include"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(
+        require_roles(ADMIN_ROLES, "Not authorized to view notification statistics")
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get notification statistics for the current tenant.
 
-    Returns aggregate metrics for sent/failed notifications.
+    Returns aggregate metrics for sent/failed notifications, summed from the
+    per-tenant daily counters and cached for 60 seconds.
     Requires ADMIN or TENANT_ADMIN role.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view notification statistics"
-        )
-
     from datetime import timedelta
-    from sqlalchemy import func
 
-    period_start = datetime.utcnow() - timedelta(days=days)
+    tenant_id = current_user.tenant_id
 
-    # Get counts by status
-    status_counts = {}
-    for notif_status in NotificationStatus:
+    async def render_statistics() -> ORJSONResponse:
+        # Whole days: counters are bucketed by the log's created_at date
+        period_start = datetime.utcnow() - timedelta(days=days)
         result = await db.execute(
-            select(func.count(NotificationLog.id)).where(
-                and_(
-                    NotificationLog.tenant_id == current_user.tenant_id,
-                    NotificationLog.created_at >= period_start,
-                    NotificationLog.status == notif_status
-                )
+            select(
+                NotificationCounter.dimension,
+                NotificationCounter.key,
+                func.sum(NotificationCounter.count)
             )
-        )
-        status_counts[notif_status.value] = result.scalar() or 0
-
-    # Get counts by channel
-    channel_counts = {}
-    for channel in NotificationChannel:
-        result = await db.execute(
-            select(func.count(NotificationLog.id)).where(
-                and_(
-                    NotificationLog.tenant_id == current_user.tenant_id,
-                    NotificationLog.created_at >= period_start,
-                    NotificationLog.channel == channel
-                )
-            )
-        )
-        channel_counts[channel.value] = result.scalar() or 0
-
-    # Get counts by event type
-    event_counts = {}
-    for event_type in NotificationEventType:
-        result = await db.execute(
-            select(func.count(NotificationLog.id)).where(
-                and_(
-                    NotificationLog.tenant_id == current_user.tenant_id,
-                    NotificationLog.created_at >= period_start,
-                    NotificationLog.event_type == event_type
-                )
+            .where(
+                NotificationCounter.tenant_id == tenant_id,
+                NotificationCounter.day >= period_start.date()
             )
+            .group_by(NotificationCounter.dimension, NotificationCounter.key)
         )
-        event_counts[event_type.value] = result.scalar() or 0
-
-    total_sent = status_counts.get("sent", 0) + status_counts.get("delivered", 0)
-    total_failed = status_counts.get("failed", 0)
-    success_rate = (total_sent / (total_sent + total_failed) * 100) if (total_sent + total_failed) > 0 else 0
 
-    return {
-        "period_start": period_start.isoformat(),
-        "period_end": datetime.utcnow().isoformat(),
-        "total_notifications": sum(status_counts.values()),
-        "by_status": status_counts,
-        "by_channel": channel_counts,
-        "by_event_type": event_counts,
-        "success_rate_percentage": round(success_rate, 2)
-    }
+        # Zero-fill so every enum value is present in the response
+        counts = {
+            "status": {member.value: 0 for member in NotificationStatus},
+            "channel": {member.value: 0 for member in NotificationChannel},
+            "event_type": {member.value: 0 for member in NotificationEventType},
+        }
+        for dimension, key, count in result.all():
+            counts[dimension][key] = int(count)
+
+        status_counts = counts["status"]
+        total_sent = status_counts.get("sent", 0) + status_counts.get("delivered", 0)
+        total_failed = status_counts.get("failed", 0)
+        success_rate = (total_sent / (total_sent + total_failed) * 100) if (total_sent + total_failed) > 0 else 0
+
+        # Plain JSON-native dict; serialise with orjson without jsonable_encoder
+        return ORJSONResponse(content={
+            "period_start": period_start.isoformat(),
+            "period_end": datetime.utcnow().isoformat(),
+            "total_notifications": sum(status_counts.values()),
+            "by_status": status_counts,
+            "by_channel": counts["channel"],
+            "by_event_type": counts["event_type"],
+            "success_rate_percentage": round(success_rate, 2)
+        })
+
+    return await response_cache.get_or_compute(
+        f"notifications:statistics:{tenant_id}:{days}",
+        render_statistics,
+        min_ttl=60,
+        max_ttl=60
+    )
 
 
 # ============================================================================
 # Resend Failed Notifications
 # ============================================================================
 
-@router.post("/logs/{log_id}/resend", response_model=NotificationLogResponse)
+# Age after which a PENDING entry is treated as a lost resend and may be resent
+RESEND_PENDING_GRACE = timedelta(minutes=10)
+
+@router.post(
+    "/logs/{log_id}/resend",
+    response_model=NotificationLogResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
 async def resend_notification(
     log_id: str,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(
+        require_roles(ADMIN_ROLES, "Not authorized to resend notifications")
+    ),
+    db: AsyncSession = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """
     Resend a failed notification.
 
-    Only failed notifications can be resent. Requires ADMIN or TENANT_ADMIN role.
+    Only failed notifications can be resent, plus pending ones older than
+    RESEND_PENDING_GRACE (a resend whose background task was lost, e.g. to a
+    worker restart). The entry is marked pending and the email/SMS is
+    delivered in the background, so the response does not wait on the
+    provider. Requires ADMIN or TENANT_ADMIN role.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to resend notifications"
-        )
-
     result = await db.execute(
         select(NotificationLog).where(
             and_(
@@ -513,54 +500,32 @@ async def resend_notification(
             detail="Notification log not found"
         )
 
-    if log.status != NotificationStatus.FAILED:
+    stuck_pending = (
+        log.status == NotificationStatus.PENDING
+        and (log.resend_requested_at or log.created_at) < datetime.utcnow() - RESEND_PENDING_GRACE
+    )
+    if log.status != NotificationStatus.FAILED and not stuck_pending:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only failed notifications can be resent"
         )
 
-    notification_service = NotificationService(db)
-
-    # Resend based on channel
-    if log.channel == NotificationChannel.EMAIL and log.recipient_email:
-        email_result = await notification_service.send_email(
-            to=log.recipient_email,
-            subject=log.subject or "Notification",
-            body=log.body_text or "",
-            html_body=log.body_html
-        )
-
-        if email_result["success"]:
-            log.status = NotificationStatus.SENT
-            log.sent_at = datetime.utcnow()
-            log.error_message = None
-            log.retry_count = str(int(log.retry_count or "0") + 1)
-        else:
-            log.retry_count = str(int(log.retry_count or "0") + 1)
-            log.error_message = email_result.get("error")
-
-    elif log.channel == NotificationChannel.SMS and log.recipient_phone:
-        sms_result = await notification_service.send_sms(
-            phone_number=log.recipient_phone,
-            message=log.body_text or ""
-        )
-
-        if sms_result["success"]:
-            log.status = NotificationStatus.SENT
-            log.sent_at = datetime.utcnow()
-            log.error_message = None
-            log.provider_message_id = sms_result.get("message_id")
-            log.retry_count = str(int(log.retry_count or "0") + 1)
-        else:
-            log.retry_count = str(int(log.retry_count or "0") + 1)
-            log.error_message = sms_result.get("error")
-    else:
+    if not (
+        (log.channel == NotificationChannel.EMAIL and log.recipient_email)
+        or (log.channel == NotificationChannel.SMS and log.recipient_phone)
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot resend: missing recipient information"
         )
 
+    # Marking the entry pending also rejects a second resend until this one finishes
+    await notification_service.set_log_status(log, NotificationStatus.PENDING)
+    log.error_message = None
+    log.resend_requested_at = datetime.utcnow()
     await db.commit()
     await db.refresh(log)
 
-    return log
+    background_tasks.add_task(resend_notification_log, log.id)
+
+    return json_response(NotificationLogResponse.model_validate(log), status.HTTP_202_ACCEPTED)
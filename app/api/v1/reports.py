@@ -1,17 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
-import csv
 import io
 import logging
 
 from app.core.database import get_db
-from app.api.v1.auth import get_current_user
-from app.models.user import User
-from app.models.ticket import Ticket
+from app.core.response_cache import response_cache
+from app.core.responses import construct_from, json_response
+from app.api.v1.auth import get_current_user, require_roles
+from app.models.user import User, ADMIN_ROLES, STAFF_ROLES
 from app.models.report import ReportSnapshot, PeriodType
 from app.schemas.report import (
     ReportSummaryResponse,
@@ -28,75 +27,87 @@ from app.schemas.report import (
     DistributionItem,
     ReportSnapshotsResponse,
     SnapshotTableRow,
+    ExportJobResponse,
 )
 from app.services.report_service import ReportService
+from app.services.ticket_export import (
+    CSV_HEADER,
+    XLSX_MEDIA_TYPE,
+    build_tickets_xlsx,
+    create_xlsx_export_job,
+    export_filename,
+    export_jobs,
+    export_tickets_query,
+    format_csv_row,
+    run_xlsx_export_job,
+    xlsx_supported,
+)
 from app.jobs.report_batch import get_scheduler_status
-from app.models.user import UserRole
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds report aggregates stay fresh in the response cache
+REPORT_CACHE_TTL = 60
+
+
+def get_report_service(db: AsyncSession = Depends(get_db)) -> ReportService:
+    """Per-request ReportService bound to the request's session."""
+    return ReportService(db)
+
+
+async def get_ticket_summaries(
+    report_service: ReportService,
+    tenant_id: str,
+    windows: List[Tuple[Optional[date], Optional[date]]]
+) -> List[dict]:
+    """
+    ReportService.summarize_ticket_windows over whole days, via the response cache.
+
+    Dashboards load /summary, /stats and /distribution together for the
+    same range; caching the aggregates rather than each endpoint's response
+    lets /summary and /distribution share one query per (tenant, start, end).
+    """
+    async def compute() -> List[dict]:
+        return await report_service.summarize_ticket_windows(
+            tenant_id,
+            [
+                (
+                    datetime.combine(start, datetime.min.time()) if start else None,
+                    datetime.combine(end, datetime.max.time()) if end else None
+                )
+                for start, end in windows
+            ]
+        )
+
+    key = ":".join(f"{start}:{end}" for start, end in windows)
+    return await response_cache.get_or_compute_json(
+        f"reports:summary:{tenant_id}:{key}",
+        compute,
+        min_ttl=REPORT_CACHE_TTL,
+        max_ttl=REPORT_CACHE_TTL
+    )
+
 
 @router.get("/summary", response_model=ReportSummaryResponse)
 async def get_report_summary(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """Get report summary for a date range."""
-    # Build query
-    query = select(Ticket).where(Ticket.tenant_id == current_user.tenant_id)
-
-    if from_date:
-        query = query.where(Ticket.created_at >= datetime.combine(from_date, datetime.min.time()))
-    if to_date:
-        query = query.where(Ticket.created_at <= datetime.combine(to_date, datetime.max.time()))
-
-    result = await db.execute(query)
-    tickets = result.scalars().all()
-
-    # Calculate metrics
-    total_tickets = len(tickets)
-    by_status = {}
-    by_priority = {}
-    by_category = {}
-    sla_breached = 0
-
-    for ticket in tickets:
-        # Count by status
-        status_key = ticket.current_status.value
-        by_status[status_key] = by_status.get(status_key, 0) + 1
-
-        # Count by priority
-        priority_key = ticket.priority.value
-        by_priority[priority_key] = by_priority.get(priority_key, 0) + 1
-
-        # Count by category
-        category_key = ticket.category.value
-        by_category[category_key] = by_category.get(category_key, 0) + 1
-
-        # Count SLA breaches
-        if ticket.sla_breached:
-            sla_breached += 1
-
-    # Calculate average resolution time (for closed tickets)
-    closed_tickets = [t for t in tickets if t.closed_at and t.opened_at]
-    avg_resolution_hours = 0
-    if closed_tickets:
-        total_hours = sum(
-            (t.closed_at - t.opened_at).total_seconds() / 3600
-            for t in closed_tickets
-        )
-        avg_resolution_hours = round(total_hours / len(closed_tickets), 2)
+    [summary] = await get_ticket_summaries(report_service, current_user.tenant_id, [(from_date, to_date)])
+    total_tickets = summary["total"]
+    sla_breached = summary["sla_breached"]
 
     return {
         "total_tickets": total_tickets,
-        "by_status": by_status,
-        "by_priority": by_priority,
-        "by_category": by_category,
-        "avg_resolution_time_hours": avg_resolution_hours,
+        "by_status": summary["by_status"],
+        "by_priority": summary["by_priority"],
+        "by_category": summary["by_category"],
+        "avg_resolution_time_hours": summary["avg_resolution_time_hours"],
         "sla_breached": sla_breached,
         "sla_compliance_rate": round(1 - (sla_breached / total_tickets), 3) if total_tickets > 0 else 1.0
     }
@@ -108,7 +119,7 @@ async def get_report_stats(
     end_date: date = Query(..., description="End date for the report period"),
     period: str = Query("daily", description="Period type: daily, weekly, monthly"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """Get report statistics with trend comparison."""
     # Calculate period length for comparison
@@ -116,51 +127,26 @@ async def get_report_stats(
     prev_start = start_date - timedelta(days=period_length)
     prev_end = start_date - timedelta(days=1)
 
-    # Current period query
-    current_query = select(Ticket).where(
-        and_(
-            Ticket.tenant_id == current_user.tenant_id,
-            Ticket.created_at >= datetime.combine(start_date, datetime.min.time()),
-            Ticket.created_at <= datetime.combine(end_date, datetime.max.time())
-        )
+    # Both periods in one grouped query
+    current, previous = await get_ticket_summaries(
+        report_service, current_user.tenant_id, [(start_date, end_date), (prev_start, prev_end)]
     )
-    current_result = await db.execute(current_query)
-    current_tickets = current_result.scalars().all()
-
-    # Previous period query
-    prev_query = select(Ticket).where(
-        and_(
-            Ticket.tenant_id == current_user.tenant_id,
-            Ticket.created_at >= datetime.combine(prev_start, datetime.min.time()),
-            Ticket.created_at <= datetime.combine(prev_end, datetime.max.time())
-        )
-    )
-    prev_result = await db.execute(prev_query)
-    prev_tickets = prev_result.scalars().all()
 
     # Calculate current metrics
-    total_tickets = len(current_tickets)
-    resolved_count = sum(1 for t in current_tickets if t.current_status.value in ['resolved', 'closed'])
-    sla_breached = sum(1 for t in current_tickets if t.sla_breached)
+    total_tickets = current["total"]
+    resolved_count = current["by_status"].get("resolved", 0) + current["by_status"].get("closed", 0)
+    sla_breached = current["sla_breached"]
     sla_breach_rate = round((sla_breached / total_tickets * 100), 2) if total_tickets > 0 else 0
-
-    closed_tickets = [t for t in current_tickets if t.closed_at and t.opened_at]
-    avg_resolution_time = 0
-    if closed_tickets:
-        total_hours = sum((t.closed_at - t.opened_at).total_seconds() / 3600 for t in closed_tickets)
-        avg_resolution_time = round(total_hours / len(closed_tickets), 2)
+    avg_resolution_time = current["avg_resolution_time_hours"]
 
     # Calculate previous metrics
-    prev_total = len(prev_tickets)
-    prev_resolved = sum(1 for t in prev_tickets if t.current_status.value in ['resolved', 'closed'])
-    prev_sla_breached = sum(1 for t in prev_tickets if t.sla_breached)
+    prev_total = previous["total"]
+    prev_resolved = previous["by_status"].get("resolved", 0) + previous["by_status"].get("closed", 0)
+    prev_sla_breached = previous["sla_breached"]
     prev_sla_rate = (prev_sla_breached / prev_total * 100) if prev_total > 0 else 0
-
-    prev_closed = [t for t in prev_tickets if t.closed_at and t.opened_at]
-    prev_avg_time = 0
-    if prev_closed:
-        prev_total_hours = sum((t.closed_at - t.opened_at).total_seconds() / 3600 for t in prev_closed)
-        prev_avg_time = prev_total_hours / len(prev_closed)
+    prev_avg_time = (
+        previous["resolution_hours"] / previous["closed_count"] if previous["closed_count"] else 0
+    )
 
     # Calculate trends
     total_trend = round(((total_tickets - prev_total) / prev_total * 100), 2) if prev_total > 0 else 0
@@ -186,37 +172,33 @@ async def get_report_trends(
     end_date: date = Query(..., description="End date for the report period"),
     period: str = Query("daily", description="Period type: daily, weekly, monthly"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """Get ticket volume trends over time."""
-    # Query tickets in the period
-    query = select(Ticket).where(
-        and_(
-            Ticket.tenant_id == current_user.tenant_id,
-            Ticket.created_at >= datetime.combine(start_date, datetime.min.time()),
-            Ticket.created_at <= datetime.combine(end_date, datetime.max.time())
+    tenant_id = current_user.tenant_id
+
+    async def render_trends() -> ORJSONResponse:
+        # One row per day with tickets, bucketed by the database
+        tickets_by_date = await report_service.count_created_by_day(
+            tenant_id,
+            datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.max.time())
         )
-    ).order_by(Ticket.created_at)
-    
-    result = await db.execute(query)
-    tickets = result.scalars().all()
 
-    # Group tickets by date
-    tickets_by_date = {}
-    for ticket in tickets:
-        ticket_date = ticket.created_at.date()
-        tickets_by_date[ticket_date] = tickets_by_date.get(ticket_date, 0) + 1
+        # Densify the range from day ordinals; date.isoformat() gives the
+        # same YYYY-MM-DD label as strftime without parsing a format string
+        days = list(map(date.fromordinal, range(start_date.toordinal(), end_date.toordinal() + 1)))
+        labels = list(map(date.isoformat, days))
+        values = [tickets_by_date.get(day, 0) for day in days]
 
-    # Generate date range
-    labels = []
-    values = []
-    current = start_date
-    while current <= end_date:
-        labels.append(current.strftime('%Y-%m-%d'))
-        values.append(tickets_by_date.get(current, 0))
-        current += timedelta(days=1)
+        return ORJSONResponse(content={"labels": labels, "values": values})
 
-    return ReportTrendsResponse(labels=labels, values=values)
+    return await response_cache.get_or_compute(
+        f"reports:trends:{tenant_id}:{start_date}:{end_date}:{period}",
+        render_trends,
+        min_ttl=REPORT_CACHE_TTL,
+        max_ttl=REPORT_CACHE_TTL
+    )
 
 
 @router.get("/distribution", response_model=ReportDistributionResponse)
@@ -224,92 +206,55 @@ async def get_report_distribution(
     start_date: date = Query(..., description="Start date for the report period"),
     end_date: date = Query(..., description="End date for the report period"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """Get ticket distribution by category and priority."""
-    # Query tickets in the period
-    query = select(Ticket).where(
-        and_(
-            Ticket.tenant_id == current_user.tenant_id,
-            Ticket.created_at >= datetime.combine(start_date, datetime.min.time()),
-            Ticket.created_at <= datetime.combine(end_date, datetime.max.time())
-        )
-    )
-    
-    result = await db.execute(query)
-    tickets = result.scalars().all()
+    [summary] = await get_ticket_summaries(report_service, current_user.tenant_id, [(start_date, end_date)])
 
-    total = len(tickets)
+    total = summary["total"]
     if total == 0:
         return ReportDistributionResponse(by_category=[], by_priority=[])
 
-    # Count by category
-    category_counts = {}
-    for ticket in tickets:
-        cat = ticket.category.value
-        category_counts[cat] = category_counts.get(cat, 0) + 1
-
-    by_category = [
-        DistributionItem(
-            name=cat,
-            count=count,
-            percentage=round((count / total) * 100, 2)
-        )
-        for cat, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-    ]
-
-    # Count by priority
-    priority_counts = {}
-    for ticket in tickets:
-        pri = ticket.priority.value
-        priority_counts[pri] = priority_counts.get(pri, 0) + 1
-
-    by_priority = [
-        DistributionItem(
-            name=pri,
-            count=count,
-            percentage=round((count / total) * 100, 2)
-        )
-        for pri, count in sorted(priority_counts.items(), key=lambda x: x[1], reverse=True)
-    ]
+    def distribution(counts: dict) -> list:
+        return [
+            DistributionItem(
+                name=name,
+                count=count,
+                percentage=round((count / total) * 100, 2)
+            )
+            for name, count in sorted(counts.items(), key=lambda x: x[1], reverse=True)
+        ]
 
-    return ReportDistributionResponse(by_category=by_category, by_priority=by_priority)
+    return ReportDistributionResponse(
+        by_category=distribution(summary["by_category"]),
+        by_priority=distribution(summary["by_priority"])
+    )
 
 
 @router.get("/snapshots/recent", response_model=ReportSnapshotsResponse)
 async def get_recent_snapshots(
     limit: int = Query(10, ge=1, le=50, description="Number of recent snapshots to return"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """Get recent report snapshots for the table view."""
-    report_service = ReportService(db)
-    snapshots, _ = await report_service.list_snapshots(
+    snapshots = await report_service.list_recent_snapshot_summaries(
         tenant_id=current_user.tenant_id,
-        period_type=None,
-        from_date=None,
-        to_date=None,
-        skip=0,
         limit=limit
     )
 
     # Convert to table rows
-    rows = []
-    for snapshot in snapshots:
-        metrics = snapshot.metrics or {}
-        total = metrics.get('total_created', 0)
-        resolved = metrics.get('total_resolved', 0)
-        breached = metrics.get('sla_breached_count', 0)
-        avg_hours = metrics.get('avg_resolution_time_hours', 0)
-        
-        rows.append(SnapshotTableRow(
+    rows = [
+        SnapshotTableRow(
             id=snapshot.id,
             date=snapshot.period_start.strftime('%Y-%m-%d'),
-            total=total,
-            resolved=resolved,
-            breached=breached,
-            avgTime=int(avg_hours * 60)  # Convert hours to minutes
-        ))
+            total=snapshot.total_created,
+            resolved=snapshot.total_resolved,
+            breached=snapshot.sla_breached_count,
+            avgTime=int(snapshot.avg_resolution_time_hours * 60)  # Convert hours to minutes
+        )
+        for snapshot in snapshots
+    ]
 
     return ReportSnapshotsResponse(snapshots=rows)
 
@@ -322,49 +267,21 @@ async def export_tickets_csv(
     db: AsyncSession = Depends(get_db)
 ):
     """Export tickets to CSV."""
-    # Build query
-    query = select(Ticket).where(Ticket.tenant_id == current_user.tenant_id)
-
-    if start_date:
-        query = query.where(Ticket.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        query = query.where(Ticket.created_at <= datetime.combine(end_date, datetime.max.time()))
-
-    query = query.order_by(Ticket.created_at.desc())
-
-    result = await db.execute(query)
-    tickets = result.scalars().all()
-
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        'Ticket Number', 'Title', 'Status', 'Priority', 'Category',
-        'Created At', 'Closed At', 'SLA Breached'
-    ])
-
-    # Write data
-    for ticket in tickets:
-        writer.writerow([
-            ticket.ticket_number,
-            ticket.title,
-            ticket.current_status.value,
-            ticket.priority.value,
-            ticket.category.value,
-            ticket.created_at.isoformat(),
-            ticket.closed_at.isoformat() if ticket.closed_at else '',
-            'Yes' if ticket.sla_breached else 'No'
-        ])
-
-    # Return CSV file
-    output.seek(0)
-    filename = f"tickets_export_{datetime.utcnow().strftime('%Y%m%d')}.csv"
+    query = export_tickets_query(current_user.tenant_id, start_date, end_date)
+
+    async def csv_chunks():
+        # Header first, so the download starts before the query runs
+        yield CSV_HEADER
+
+        # Server-side cursor: one batch of tickets in memory at a time
+        result = await db.stream(query)
+        async for tickets in result.partitions():
+            yield "".join(map(format_csv_row, tickets))
+
     return StreamingResponse(
-        iter([output.getvalue()]),
+        csv_chunks(),
         media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers={"Content-Disposition": f"attachment; filename={export_filename('csv')}"}
     )
 
 
@@ -375,83 +292,70 @@ async def export_tickets_xlsx(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Export tickets to Excel (XLSX)."""
+    """
+    Export tickets to Excel (XLSX).
+
+    Builds the workbook within the request. Large ranges should use
+    POST /export/xlsx, which builds it in the background.
+    """
     try:
-        import openpyxl
-        from openpyxl.styles import Font, PatternFill
+        content = await build_tickets_xlsx(db, current_user.tenant_id, start_date, end_date)
     except ImportError:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Excel export requires openpyxl package"
         )
 
-    # Build query
-    query = select(Ticket).where(Ticket.tenant_id == current_user.tenant_id)
-
-    if start_date:
-        query = query.where(Ticket.created_at >= datetime.combine(start_date, datetime.min.time()))
-    if end_date:
-        query = query.where(Ticket.created_at <= datetime.combine(end_date, datetime.max.time()))
-
-    query = query.order_by(Ticket.created_at.desc())
-
-    result = await db.execute(query)
-    tickets = result.scalars().all()
-
-    # Create workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Tickets"
-
-    # Header style
-    header_fill = PatternFill(start_color="EB5D19", end_color="EB5D19", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-
-    # Write header
-    headers = ['Ticket Number', 'Title', 'Status', 'Priority', 'Category', 
-               'Created At', 'Closed At', 'SLA Breached']
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-
-    # Write data
-    for row_num, ticket in enumerate(tickets, 2):
-        ws.cell(row=row_num, column=1, value=ticket.ticket_number)
-        ws.cell(row=row_num, column=2, value=ticket.title)
-        ws.cell(row=row_num, column=3, value=ticket.current_status.value)
-        ws.cell(row=row_num, column=4, value=ticket.priority.value)
-        ws.cell(row=row_num, column=5, value=ticket.category.value)
-        ws.cell(row=row_num, column=6, value=ticket.created_at.isoformat())
-        ws.cell(row=row_num, column=7, value=ticket.closed_at.isoformat() if ticket.closed_at else '')
-        ws.cell(row=row_num, column=8, value='Yes' if ticket.sla_breached else 'No')
-
-    # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
-
-    # Save to bytes
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
-
-    filename = f"tickets_export_{datetime.utcnow().strftime('%Y%m%d')}.xlsx"
     return StreamingResponse(
-        output,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        io.BytesIO(content),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename={export_filename('xlsx')}"}
     )
 
 
+@router.post(
+    "/export/xlsx",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def enqueue_tickets_xlsx_export(
+    background_tasks: BackgroundTasks,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Start a background XLSX export.
+
+    Returns the job immediately; poll GET /export/xlsx/{job_id} for the
+    download URL once the job has completed.
+    """
+    if not xlsx_supported():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Excel export requires openpyxl package"
+        )
+
+    job = await create_xlsx_export_job(current_user.tenant_id)
+    background_tasks.add_task(run_xlsx_export_job, job, start_date, end_date)
+    return ExportJobResponse(**job)
+
+
+@router.get("/export/xlsx/{job_id}", response_model=ExportJobResponse)
+async def get_tickets_xlsx_export(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the status, and once completed the download URL, of an XLSX export job."""
+    job = await export_jobs.get(job_id)
+    if job is None or job["tenant_id"] != current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found"
+        )
+    return ExportJobResponse(**job)
+
+
 @router.get("/export")
 async def export_tickets_csv_legacy(
     from_date: Optional[date] = Query(None),
@@ -475,7 +379,7 @@ async def list_snapshots(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """
     List report snapshots with optional filters.
@@ -488,7 +392,6 @@ async def list_snapshots(
     if period_type:
         model_period_type = PeriodType(period_type.value)
 
-    report_service = ReportService(db)
     snapshots, total = await report_service.list_snapshots(
         tenant_id=current_user.tenant_id,
         period_type=model_period_type,
@@ -498,19 +401,20 @@ async def list_snapshots(
         limit=limit
     )
 
-    return SnapshotListResponse(
-        items=[SnapshotResponse.model_validate(s) for s in snapshots],
+    # Snapshots are written by ReportService, so they are not re-validated
+    return json_response(SnapshotListResponse.model_construct(
+        items=[construct_from(SnapshotResponse, s) for s in snapshots],
         total=total,
         skip=skip,
         limit=limit
-    )
+    ))
 
 
 @router.get("/snapshots/{snapshot_id}", response_model=SnapshotDetailResponse)
 async def get_snapshot(
     snapshot_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    report_service: ReportService = Depends(get_report_service)
 ):
     """
     Get a specific report snapshot by ID.
@@ -518,7 +422,6 @@ async def get_snapshot(
     Returns detailed snapshot information including parsed metrics
     with breakdown by status, priority, category, and top sites.
     """
-    report_service = ReportService(db)
     snapshot = await report_service.get_snapshot_by_id(
         snapshot_id=snapshot_id,
         tenant_id=current_user.tenant_id
@@ -536,8 +439,10 @@ async def get_snapshot(
 @router.post("/snapshots/generate", response_model=SnapshotGenerateResponse)
 async def generate_snapshot(
     request: SnapshotCreate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(
+        require_roles(STAFF_ROLES, "Only admin or manager users can manually generate snapshots")
+    ),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """
     Manually generate a report snapshot.
@@ -550,14 +455,6 @@ async def generate_snapshot(
 
     Requires admin or manager role.
     """
-    # Check user permissions (admin or manager)
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.AS_MANAGER]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admin or manager users can manually generate snapshots"
-        )
-
-    report_service = ReportService(db)
     target_date = request.target_date
 
     try:
@@ -607,10 +504,10 @@ async def generate_snapshot(
             f"for tenant {current_user.tenant_id}"
         )
 
-        return SnapshotGenerateResponse(
-            snapshot=SnapshotResponse.model_validate(snapshot),
+        return json_response(SnapshotGenerateResponse.model_construct(
+            snapshot=construct_from(SnapshotResponse, snapshot),
             message=message
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Failed to generate snapshot: {str(e)}", exc_info=True)
@@ -623,21 +520,16 @@ async def generate_snapshot(
 @router.delete("/snapshots/{snapshot_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_snapshot(
     snapshot_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(
+        require_roles(ADMIN_ROLES, "Only admin users can delete snapshots")
+    ),
+    report_service: ReportService = Depends(get_report_service)
 ):
     """
     Delete a report snapshot.
 
     Requires admin role.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admin users can delete snapshots"
-        )
-
-    report_service = ReportService(db)
     deleted = await report_service.delete_snapshot(
         snapshot_id=snapshot_id,
         tenant_id=current_user.tenant_id
@@ -657,7 +549,9 @@ async def delete_snapshot(
 
 @router.get("/scheduler/status", response_model=SchedulerStatusResponse)
 async def get_report_scheduler_status(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(
+        require_roles(ADMIN_ROLES, "Only admin users can view scheduler status")
+    )
 ):
     """
     Get the status of the report batch scheduler.
@@ -665,11 +559,5 @@ async def get_report_scheduler_status(
     Returns information about scheduled jobs including their next run time.
     Requires admin role.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.TENANT_ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admin users can view scheduler status"
-        )
-
     status_info = get_scheduler_status()
     return SchedulerStatusResponse(**status_info)
@@ -4,23 +4,30 @@ SLA API Endpoints
 Provides REST API endpoints for SLA policy management, measurements, and recalculation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, and_, func, distinct, exists, tuple_, lambda_stmt, cast, Integer
 from typing import List, Optional
-from datetime import datetime
+from pydantic import TypeAdapter
+from datetime import datetime, timedelta
 import logging
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, tenant_filter, tenant_params
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.response_cache import response_cache
+from app.core.responses import construct_from, json_array_chunks, json_response
 from app.api.v1.auth import get_current_user
 from app.models.user import User
 from app.models.ticket import Ticket
-from app.models.sla import SlaPolicy, SlaMeasurement, SlaStatus
+from app.models.sla import SlaPolicy, SlaMeasurement, SlaStatus, sla_daily_rollup
 from app.services.sla_service import SlaService
 from app.jobs.sla_batch import (
     trigger_sla_recalculation,
     get_sla_scheduler,
-    process_single_ticket_sla
+    process_single_ticket_sla,
+    recalculate_tickets_sla
 )
 from app.schemas.sla import (
     SlaPolicyCreate,
@@ -40,6 +47,54 @@ from app.schemas.sla import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Validates and encodes /measurements batches in one pydantic-core pass each
+MEASUREMENT_LIST_ADAPTER = TypeAdapter(List[SlaMeasurementResponse])
+
+# Measurements fetched per round trip (and encoded per chunk) by /measurements
+MEASUREMENT_BATCH_SIZE = 200
+
+# Columns read for /measurements: plain rows instead of SlaMeasurement instances
+MEASUREMENT_COLUMNS = tuple(
+    getattr(SlaMeasurement, name) for name in SlaMeasurementResponse.model_fields
+)
+
+# /statistics measurement counts: all measurements, then one conditional
+# count per status in the order the handler unpacks them. Built once; the
+# expressions are immutable and reused by every request.
+_MEASUREMENT_COUNT = func.count(SlaMeasurement.id)
+STATISTICS_COUNTS = (
+    _MEASUREMENT_COUNT,
+    *(
+        _MEASUREMENT_COUNT.filter(SlaMeasurement.status == sla_status)
+        for sla_status in (SlaStatus.BREACHED, SlaStatus.MET, SlaStatus.ACTIVE, SlaStatus.CANCELLED)
+    ),
+)
+
+# The same counts, plus the ticket total, summed from sla_daily_rollup (cast
+# back to integers: PostgreSQL sums bigint columns as numeric)
+_ROLLUP = sla_daily_rollup.c
+STATISTICS_ROLLUP_SUMS = tuple(
+    cast(func.coalesce(func.sum(column), 0), Integer)
+    for column in (
+        _ROLLUP.ticket_count, _ROLLUP.measurement_count, _ROLLUP.breached_count,
+        _ROLLUP.met_count, _ROLLUP.active_count, _ROLLUP.cancelled_count
+    )
+)
+
+# Seconds /statistics responses and unfiltered policy lists stay cached
+SLA_STATISTICS_CACHE_TTL = 60
+SLA_POLICY_CACHE_TTL = 300
+
+
+def policy_list_cache_keys(tenant_id: str) -> List[str]:
+    """Cache keys of a tenant's unfiltered policy lists (active only and all)."""
+    return [f"sla:policies:{tenant_id}:{active_only}" for active_only in (True, False)]
+
+
+def get_sla_service(db: AsyncSession = Depends(get_db)) -> SlaService:
+    """Per-request SlaService bound to the request's session."""
+    return SlaService(db)
+
 
 # ============================================================================
 # SLA Policy Endpoints
@@ -57,26 +112,43 @@ async def list_sla_policies(
     List all SLA policies for the current tenant.
 
     Returns a list of SLA policies with optional filtering by status, category, or priority.
+    Unfiltered lists are cached per tenant until a policy changes.
     """
-    query = select(SlaPolicy).where(SlaPolicy.tenant_id == current_user.tenant_id)
+    tenant_id = current_user.tenant_id
+
+    async def render_policies() -> Response:
+        query = select(SlaPolicy).where(SlaPolicy.tenant_id == tenant_id)
+
+        if active_only:
+            query = query.where(SlaPolicy.is_active == True)
 
-    if active_only:
-        query = query.where(SlaPolicy.is_active == True)
+        if category:
+            query = query.where(SlaPolicy.category == category)
 
-    if category:
-        query = query.where(SlaPolicy.category == category)
+        if priority:
+            query = query.where(SlaPolicy.priority == priority)
 
-    if priority:
-        query = query.where(SlaPolicy.priority == priority)
+        query = query.order_by(SlaPolicy.priority, SlaPolicy.category)
 
-    query = query.order_by(SlaPolicy.priority, SlaPolicy.category)
+        result = await db.execute(query)
+        policies = result.scalars().all()
 
-    result = await db.execute(query)
-    policies = result.scalars().all()
+        # Policies are our own rows; build the response without re-validating them
+        return json_response(SlaPolicyListResponse.model_construct(
+            policies=[construct_from(SlaPolicyResponse, policy) for policy in policies],
+            total=len(policies)
+        ))
 
-    return SlaPolicyListResponse(
-        policies=policies,
-        total=len(policies)
+    # Filtered lists are free-form and cheap; only the settings page's full
+    # lists are cached, so writes know exactly which keys to invalidate
+    if category or priority:
+        return await render_policies()
+
+    return await response_cache.get_or_compute(
+        f"sla:policies:{tenant_id}:{active_only}",
+        render_policies,
+        min_ttl=SLA_POLICY_CACHE_TTL,
+        max_ttl=SLA_POLICY_CACHE_TTL
     )
 
 
@@ -84,7 +156,8 @@ async def list_sla_policies(
 async def create_sla_policy(
     policy_data: SlaPolicyCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """
     Create a new SLA policy.
@@ -93,24 +166,24 @@ async def create_sla_policy(
     Only one active policy should exist per category/priority pair.
     """
     # Check if policy already exists for this category/priority
-    existing = await db.execute(
-        select(SlaPolicy).where(
+    # EXISTS answers from the partial active-policy index without loading a row
+    policy_exists = await db.scalar(
+        select(exists().where(
             and_(
                 SlaPolicy.tenant_id == current_user.tenant_id,
                 SlaPolicy.category == policy_data.category,
                 SlaPolicy.priority == policy_data.priority,
                 SlaPolicy.is_active == True
             )
-        )
+        ))
     )
 
-    if existing.scalar_one_or_none():
+    if policy_exists:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Active SLA policy already exists for category '{policy_data.category}' and priority '{policy_data.priority}'"
         )
 
-    sla_service = SlaService(db)
     policy = await sla_service.create_policy(
         tenant_id=current_user.tenant_id,
         category=policy_data.category,
@@ -118,6 +191,7 @@ async def create_sla_policy(
         response_time_minutes=policy_data.response_time_minutes,
         resolution_time_minutes=policy_data.resolution_time_minutes
     )
+    await response_cache.invalidate(*policy_list_cache_keys(current_user.tenant_id))
 
     return policy
 
@@ -131,13 +205,15 @@ async def get_sla_policy(
     """
     Get a specific SLA policy by ID.
     """
+    # Cached lambda_stmt: compiled once, the id and tenant bound per call
     result = await db.execute(
-        select(SlaPolicy).where(
+        lambda_stmt(lambda: select(SlaPolicy).where(
             and_(
                 SlaPolicy.id == policy_id,
-                SlaPolicy.tenant_id == current_user.tenant_id
+                tenant_filter(SlaPolicy)
             )
-        )
+        )),
+        tenant_params()
     )
     policy = result.scalar_one_or_none()
 
@@ -147,7 +223,7 @@ async def get_sla_policy(
             detail="SLA policy not found"
         )
 
-    return policy
+    return json_response(construct_from(SlaPolicyResponse, policy))
 
 
 @router.patch("/policies/{policy_id}", response_model=SlaPolicyResponse)
@@ -155,7 +231,8 @@ async def update_sla_policy(
     policy_id: str,
     policy_update: SlaPolicyUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """
     Update an SLA policy.
@@ -178,13 +255,13 @@ async def update_sla_policy(
             detail="SLA policy not found"
         )
 
-    sla_service = SlaService(db)
     updated_policy = await sla_service.update_policy(
         policy_id=policy_id,
         **policy_update.model_dump(exclude_unset=True)
     )
+    await response_cache.invalidate(*policy_list_cache_keys(current_user.tenant_id))
 
-    return updated_policy
+    return json_response(construct_from(SlaPolicyResponse, updated_policy))
 
 
 @router.delete("/policies/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -199,24 +276,27 @@ async def deactivate_sla_policy(
     This soft-deletes the policy by setting is_active to False.
     Existing measurements remain unaffected.
     """
+    # UPDATE ... RETURNING finds and deactivates the policy in one round trip
     result = await db.execute(
-        select(SlaPolicy).where(
+        update(SlaPolicy)
+        .where(
             and_(
                 SlaPolicy.id == policy_id,
                 SlaPolicy.tenant_id == current_user.tenant_id
             )
         )
+        .values(is_active=False)
+        .returning(SlaPolicy.id)
     )
-    policy = result.scalar_one_or_none()
 
-    if not policy:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="SLA policy not found"
         )
 
-    policy.is_active = False
     await db.commit()
+    await response_cache.invalidate(*policy_list_cache_keys(current_user.tenant_id))
 
 
 # ============================================================================
@@ -227,34 +307,17 @@ async def deactivate_sla_policy(
 async def get_ticket_sla_status(
     ticket_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """
     Get complete SLA status for a specific ticket.
 
     Returns policy information, measurements, and current calculation results.
     """
-    # Verify ticket exists and belongs to tenant
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
-
-    sla_service = SlaService(db)
-
+    # The service scopes the ticket to the tenant and raises ValueError
+    # (404) when it does not exist there
     try:
-        sla_status = await sla_service.get_sla_status_for_ticket(ticket_id)
+        sla_status = await sla_service.get_sla_status_for_ticket(ticket_id, current_user.tenant_id)
         return sla_status
     except ValueError as e:
         raise HTTPException(
@@ -267,34 +330,15 @@ async def get_ticket_sla_status(
 async def check_ticket_sla_breach(
     ticket_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """
     Check if SLA is breached for a specific ticket.
 
     Returns breach status and time remaining until breach (if not yet breached).
     """
-    # Verify ticket exists and belongs to tenant
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
-
-    sla_service = SlaService(db)
-
     try:
-        breach_status = await sla_service.check_sla_breach(ticket_id)
+        breach_status = await sla_service.check_sla_breach(ticket_id, current_user.tenant_id)
         return breach_status
     except ValueError as e:
         raise HTTPException(
@@ -307,35 +351,16 @@ async def check_ticket_sla_breach(
 async def recalculate_ticket_sla(
     ticket_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """
     Manually recalculate SLA for a specific ticket.
 
     Updates the SLA measurement record with current calculation.
     """
-    # Verify ticket exists and belongs to tenant
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
-
-    sla_service = SlaService(db)
-
     try:
-        await sla_service.update_sla_measurements(ticket_id)
-        sla_status = await sla_service.get_sla_status_for_ticket(ticket_id)
+        await sla_service.update_sla_measurements(ticket_id, current_user.tenant_id)
+        sla_status = await sla_service.get_sla_status_for_ticket(ticket_id, current_user.tenant_id)
         return sla_status
     except ValueError as e:
         raise HTTPException(
@@ -362,52 +387,53 @@ async def trigger_sla_batch_recalculation(
     Otherwise, all open tickets in the tenant are processed.
     """
     if request and request.ticket_ids:
-        # Process specific tickets
-        sla_service = SlaService(db)
-        total_processed = 0
-        breached = 0
-        within_sla = 0
-        errors = []
-
-        for ticket_id in request.ticket_ids:
-            try:
-                # Verify ticket belongs to tenant
-                result = await db.execute(
-                    select(Ticket).where(
-                        and_(
-                            Ticket.id == ticket_id,
-                            Ticket.tenant_id == current_user.tenant_id
-                        )
-                    )
+        # Verify tenant ownership of all requested tickets in one query
+        result = await db.execute(
+            select(Ticket.id).where(
+                and_(
+                    Ticket.id.in_(request.ticket_ids),
+                    Ticket.tenant_id == current_user.tenant_id
                 )
-                ticket = result.scalar_one_or_none()
+            )
+        )
+        owned_ids = set(result.scalars().all())
 
-                if not ticket:
-                    errors.append(f"Ticket not found: {ticket_id}")
-                    continue
+        errors = [
+            f"Ticket not found: {ticket_id}"
+            for ticket_id in request.ticket_ids
+            if ticket_id not in owned_ids
+        ]
+        # Each ticket once: concurrent updates of one ticket would race
+        valid_ids = list(dict.fromkeys(ticket_id for ticket_id in request.ticket_ids if ticket_id in owned_ids))
 
-                measurement = await sla_service.update_sla_measurements(ticket_id)
-                total_processed += 1
+        total_processed = 0
+        breached = 0
+        within_sla = 0
 
-                if measurement and (measurement.response_breached or measurement.resolution_breached):
-                    breached += 1
-                else:
-                    within_sla += 1
+        outcomes = await recalculate_tickets_sla(valid_ids)
+        for ticket_id, measurement in zip(valid_ids, outcomes):
+            if isinstance(measurement, Exception):
+                errors.append(f"Error processing {ticket_id}: {str(measurement)}")
+                continue
 
-            except Exception as e:
-                errors.append(f"Error processing {ticket_id}: {str(e)}")
+            total_processed += 1
+            if measurement and (measurement.response_breached or measurement.resolution_breached):
+                breached += 1
+            else:
+                within_sla += 1
 
-        return SlaBatchResultResponse(
+        # Counts and messages built above already match the schema
+        return json_response(SlaBatchResultResponse.model_construct(
             total_processed=total_processed,
             breached=breached,
             within_sla=within_sla,
             errors=errors,
             processed_at=datetime.utcnow().isoformat()
-        )
+        ))
     else:
-        # Process all open tickets
+        # Process all open tickets; the batch summary is built by our own job
         result = await trigger_sla_recalculation()
-        return SlaBatchResultResponse(**result)
+        return json_response(SlaBatchResultResponse.model_construct(**result))
 
 
 @router.get("/scheduler/status", response_model=SlaSchedulerStatusResponse)
@@ -438,71 +464,75 @@ async def get_sla_statistics(
     Get SLA statistics for the current tenant.
 
     Returns aggregate metrics including breach rates and average times.
+    Cached per tenant and period length for SLA_STATISTICS_CACHE_TTL seconds.
     """
-    from datetime import timedelta
-
-    period_end = datetime.utcnow()
-    period_start = period_end - timedelta(days=days)
-
-    # Get total tickets in period
-    total_result = await db.execute(
-        select(func.count(Ticket.id)).where(
-            and_(
-                Ticket.tenant_id == current_user.tenant_id,
-                Ticket.opened_at >= period_start,
-                Ticket.opened_at <= period_end
-            )
-        )
-    )
-    total_tickets = total_result.scalar() or 0
+    tenant_id = current_user.tenant_id
 
-    # Get tickets with SLA measurements
-    sla_result = await db.execute(
-        select(func.count(SlaMeasurement.id)).join(Ticket).where(
-            and_(
-                Ticket.tenant_id == current_user.tenant_id,
-                Ticket.opened_at >= period_start,
-                Ticket.opened_at <= period_end
-            )
-        )
-    )
-    tickets_with_sla = sla_result.scalar() or 0
+    async def render_statistics() -> Response:
+        period_end = datetime.utcnow()
+        period_start = period_end - timedelta(days=days)
 
-    # Count by status
-    status_counts = {}
-    for sla_status in SlaStatus:
-        count_result = await db.execute(
-            select(func.count(SlaMeasurement.id)).join(Ticket).where(
+        if settings.SLA_ROLLUP_ENABLED and db.get_bind().dialect.name == "postgresql":
+            # Sum the period's rows of the refreshed daily view; it is bucketed
+            # by ticket open date, so the period is compared as whole days
+            query = select(*STATISTICS_ROLLUP_SUMS).where(
                 and_(
-                    Ticket.tenant_id == current_user.tenant_id,
-                    Ticket.opened_at >= period_start,
-                    Ticket.opened_at <= period_end,
-                    SlaMeasurement.status == sla_status
+                    _ROLLUP.tenant_id == tenant_id,
+                    _ROLLUP.day >= period_start.date(),
+                    _ROLLUP.day <= period_end.date()
                 )
             )
-        )
-        status_counts[sla_status.value] = count_result.scalar() or 0
-
-    # Calculate breach rate
-    breach_rate = 0.0
-    if tickets_with_sla > 0:
-        breach_rate = (status_counts.get("breached", 0) / tickets_with_sla) * 100
-
-    # TODO: Calculate average response and resolution times
-    # This would require more complex aggregation queries
-
-    return SlaStatisticsResponse(
-        total_tickets=total_tickets,
-        tickets_with_sla=tickets_with_sla,
-        breached_count=status_counts.get("breached", 0),
-        met_count=status_counts.get("met", 0),
-        active_count=status_counts.get("active", 0),
-        cancelled_count=status_counts.get("cancelled", 0),
-        average_response_time_minutes=None,  # TODO: Implement
-        average_resolution_time_minutes=None,  # TODO: Implement
-        breach_rate_percentage=round(breach_rate, 2),
-        period_start=period_start,
-        period_end=period_end
+        else:
+            # Ticket total, measurement total and per-status measurement counts
+            # in one round trip, as conditional aggregates over tickets
+            # left-joined to their measurements (a ticket can have several)
+            query = (
+                select(func.count(distinct(Ticket.id)), *STATISTICS_COUNTS)
+                .select_from(Ticket)
+                .outerjoin(SlaMeasurement, SlaMeasurement.ticket_id == Ticket.id)
+                .where(
+                    and_(
+                        Ticket.tenant_id == tenant_id,
+                        Ticket.opened_at >= period_start,
+                        Ticket.opened_at <= period_end
+                    )
+                )
+            )
+
+        result = await db.execute(query)
+        (
+            total_tickets, tickets_with_sla,
+            breached_count, met_count, active_count, cancelled_count
+        ) = result.one()
+
+        # Calculate breach rate
+        breach_rate = 0.0
+        if tickets_with_sla > 0:
+            breach_rate = (breached_count / tickets_with_sla) * 100
+
+        # TODO: Calculate average response and resolution times
+        # This would require more complex aggregation queries
+
+        return json_response(SlaStatisticsResponse(
+            total_tickets=total_tickets,
+            tickets_with_sla=tickets_with_sla,
+            breached_count=breached_count,
+            met_count=met_count,
+            active_count=active_count,
+            cancelled_count=cancelled_count,
+            average_response_time_minutes=None,  # TODO: Implement
+            average_resolution_time_minutes=None,  # TODO: Implement
+            breach_rate_percentage=round(breach_rate, 2),
+            period_start=period_start,
+            period_end=period_end
+        ))
+
+    # Statistics are not real-time: cache per (tenant, days) for a minute
+    return await response_cache.get_or_compute(
+        f"sla:statistics:{tenant_id}:{days}",
+        render_statistics,
+        min_ttl=SLA_STATISTICS_CACHE_TTL,
+        max_ttl=SLA_STATISTICS_CACHE_TTL
     )
 
 
@@ -517,32 +547,75 @@ async def list_sla_measurements(
     resolution_breached: Optional[bool] = Query(None, description="Filter by resolution breach status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List SLA measurements for tickets in the current tenant.
 
-    Supports filtering by status and breach conditions.
+    Supports filtering by status and breach conditions. Pages are ordered
+    newest first; the X-Next-Cursor response header holds the cursor for the
+    following page, which is read by key instead of skipping `skip` rows.
     """
-    query = (
-        select(SlaMeasurement)
-        .join(Ticket)
-        .where(Ticket.tenant_id == current_user.tenant_id)
-    )
+    conditions = [Ticket.tenant_id == current_user.tenant_id]
 
     if status_filter:
-        query = query.where(SlaMeasurement.status == status_filter)
+        conditions.append(SlaMeasurement.status == status_filter)
 
     if response_breached is not None:
-        query = query.where(SlaMeasurement.response_breached == response_breached)
+        conditions.append(SlaMeasurement.response_breached == response_breached)
 
     if resolution_breached is not None:
-        query = query.where(SlaMeasurement.resolution_breached == resolution_breached)
+        conditions.append(SlaMeasurement.resolution_breached == resolution_breached)
+
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, datetime.fromisoformat, str)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        conditions.append(tuple_(SlaMeasurement.created_at, SlaMeasurement.id) < after)
+        skip = 0
+
+    def page(*columns):
+        return (
+            select(*columns)
+            .join(Ticket, SlaMeasurement.ticket_id == Ticket.id)
+            .where(*conditions)
+            .order_by(SlaMeasurement.created_at.desc(), SlaMeasurement.id.desc())
+        )
+
+    # The body is streamed, so the header's cursor (the page's last key)
+    # comes from a keys-only lookup made before the first chunk is sent.
+    # Both statements must see one snapshot, or a measurement inserted in
+    # between shifts the page and the cursor skips a row the client never
+    # got: end the authentication transaction and run them in a
+    # REPEATABLE READ one (PostgreSQL; the SQLite test database is a
+    # single connection).
+    if db.get_bind().dialect.name == "postgresql":
+        await db.commit()
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    last_key = (await db.execute(
+        page(SlaMeasurement.created_at, SlaMeasurement.id).offset(skip + limit - 1).limit(1)
+    )).first()
+    headers = {"X-Next-Cursor": encode_cursor(*last_key)} if last_key else None
 
-    query = query.order_by(SlaMeasurement.created_at.desc()).offset(skip).limit(limit)
+    query = (
+        page(*MEASUREMENT_COLUMNS)
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=MEASUREMENT_BATCH_SIZE)
+    )
 
-    result = await db.execute(query)
-    measurements = result.scalars().all()
+    async def measurement_batches():
+        # Server-side cursor: one batch of rows in memory at a time
+        result = await db.stream(query)
+        async for rows in result.mappings().partitions():
+            yield rows
 
-    return measurements
+    return StreamingResponse(
+        json_array_chunks(MEASUREMENT_LIST_ADAPTER, measurement_batches()),
+        media_type="application/json",
+        headers=headers
+    )
@@ -7,8 +7,10 @@ Provides real-time streaming endpoints for:
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Optional
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
@@ -17,27 +19,77 @@ from sqlalchemy import select
 
 from app.core.database import get_db
 from app.core.security import decode_access_token
-from app.core.sse import connection_manager, SSEConnection
-from app.models.user import User
+from app.core.sse import connection_manager, SSEConnection, sse_pack
+from app.models.user import User, UserRole
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Most queued messages (and bytes) coalesced into one streamed chunk
+SSE_DRAIN_MAX_MESSAGES = 32
+SSE_DRAIN_MAX_BYTES = 16 * 1024
+
+# Seconds an authenticated token is trusted without re-reading the user
+# (never past the token's exp), and the most tokens remembered
+SSE_AUTH_CACHE_SECONDS = 60.0
+SSE_AUTH_CACHE_MAX_ENTRIES = 10_000
+
+
+class SSEUser(NamedTuple):
+    """The user fields SSE endpoints need, cached per token."""
+    id: str
+    tenant_id: str
+    role: UserRole
+
+
+# Token digest -> (user snapshot, monotonic expiry)
+_auth_cache: Dict[bytes, Tuple[SSEUser, float]] = {}
+
+
+def _cache_user(key: bytes, user: SSEUser, payload: dict) -> None:
+    now = time.monotonic()
+    ttl = SSE_AUTH_CACHE_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl <= 0:
+        return
+
+    if len(_auth_cache) >= SSE_AUTH_CACHE_MAX_ENTRIES:
+        for stale in [k for k, (_, expires) in _auth_cache.items() if expires <= now]:
+            del _auth_cache[stale]
+        if len(_auth_cache) >= SSE_AUTH_CACHE_MAX_ENTRIES:
+            _auth_cache.clear()
+    _auth_cache[key] = (user, now + ttl)
+
 
 async def get_user_from_token(
     token: str,
     db: AsyncSession
-) -> Optional[User]:
+) -> Optional[SSEUser]:
     """
     Validate token and get user.
 
     For SSE connections, we use query parameter auth instead of headers
     because EventSource doesn't support custom headers.
+
+    Clients reconnect with the same token, so an accepted token is cached
+    by digest for up to SSE_AUTH_CACHE_SECONDS (bounded by its exp) and
+    reconnects skip the JWT decode and the user SELECT. A deactivated user
+    is therefore refused at most that long after the change.
     """
     if not token:
         return None
 
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _auth_cache.get(key)
+    if cached is not None:
+        user, expires = cached
+        if time.monotonic() < expires:
+            return user
+        del _auth_cache[key]
+
     payload = decode_access_token(token)
     if payload is None:
         return None
@@ -46,12 +98,15 @@ async def get_user_from_token(
     if user_id is None:
         return None
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if user is None or not user.is_active:
+    result = await db.execute(
+        select(User.id, User.tenant_id, User.role).where(User.id == user_id, User.is_active)
+    )
+    row = result.one_or_none()
+    if row is None:
         return None
 
+    user = SSEUser(*row)
+    _cache_user(key, user, payload)
     return user
 
 
@@ -59,21 +114,25 @@ async def event_generator(connection: SSEConnection):
     """
     Generate SSE events for a connection.
 
-    Yields events from the connection's queue.
-    Sends heartbeat pings to keep connection alive.
+    Yields events from the connection's queue, including the heartbeat
+    pings its timer queues to keep the connection alive. A burst of queued
+    events is drained into one chunk (SSE frames concatenate as-is), so it
+    costs one body send rather than one per event.
     """
+    queue = connection.queue
     try:
         while True:
-            try:
-                # Wait for message with timeout (for heartbeat)
-                message = await asyncio.wait_for(
-                    connection.queue.get(),
-                    timeout=30.0
-                )
-                yield message
-            except asyncio.TimeoutError:
-                # Send heartbeat ping
-                yield ": ping\n\n"
+            messages = [await queue.get()]
+            size = len(messages[0])
+            while (
+                len(messages) < SSE_DRAIN_MAX_MESSAGES
+                and size < SSE_DRAIN_MAX_BYTES
+                and not queue.empty()
+            ):
+                message = queue.get_nowait()
+                messages.append(message)
+                size += len(message)
+            yield b"".join(messages)
     except asyncio.CancelledError:
         # Connection was closed
         logger.debug(f"SSE generator cancelled for user {connection.user_id}")
@@ -127,7 +186,7 @@ async def stream_tickets(
     async def generate():
         try:
             # Send initial connection confirmation
-            yield f"event: connected\ndata: {{\"user_id\": \"{user.id}\", \"tenant_id\": \"{user.tenant_id}\"}}\n\n"
+            yield sse_pack("connected", {"user_id": user.id, "tenant_id": user.tenant_id})
 
             async for message in event_generator(connection):
                 yield message
@@ -185,7 +244,7 @@ async def stream_notifications(
     async def generate():
         try:
             # Send initial connection confirmation
-            yield f"event: connected\ndata: {{\"user_id\": \"{user.id}\"}}\n\n"
+            yield sse_pack("connected", {"user_id": user.id})
 
             async for message in event_generator(connection):
                 yield message
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, exists
+from sqlalchemy.orm import raiseload
 from typing import List, Optional
 from datetime import datetime
 import uuid
@@ -8,6 +9,7 @@ import logging
 
 from app.core.database import get_db
 from app.api.v1.auth import get_current_user
+from app.api.v1.sla import get_sla_service
 from app.models.user import User
 from app.models.ticket import Ticket, TicketStatusHistory, TicketStatus
 from app.schemas.ticket import (
@@ -19,7 +21,7 @@ from app.schemas.ticket import (
 )
 from app.schemas.sla import SlaTicketStatusResponse
 from app.services.sla_service import SlaService
-from app.services.event_publisher import event_publisher
+from app.services.event_publisher import ticket_event_queue
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,36 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def ticket_exists(db: AsyncSession, ticket_id: str, tenant_id: str) -> bool:
+    """Check that a ticket exists in the tenant without loading it."""
+    return bool(await db.scalar(
+        select(exists().where(
+            and_(
+                Ticket.id == ticket_id,
+                Ticket.tenant_id == tenant_id
+            )
+        ))
+    ))
+
+
+async def get_tenant_ticket(db: AsyncSession, ticket_id: str, tenant_id: str) -> Ticket:
+    """
+    Load a tenant's ticket by id, or raise 404.
+
+    Goes through the session's identity map (Session.get), so a ticket the
+    request has already loaded is returned without another query.
+    """
+    ticket = await db.get(Ticket, ticket_id)
+
+    if ticket is None or ticket.tenant_id != tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+
+    return ticket
+
+
 def generate_ticket_number() -> str:
     """Generate unique ticket number."""
     return f"TKT-{datetime.utcnow().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
@@ -35,9 +67,9 @@ def generate_ticket_number() -> str:
 @router.post("", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
 async def create_ticket(
     ticket_data: TicketCreate,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """Create a new ticket."""
     ticket = Ticket(
@@ -64,14 +96,12 @@ async def create_ticket(
 
     # Initialize SLA measurement for the new ticket
     try:
-        sla_service = SlaService(db)
         await sla_service.initialize_sla_for_new_ticket(ticket)
     except Exception as e:
         logger.warning(f"Failed to initialize SLA for ticket {ticket.id}: {e}")
 
-    # Publish SSE event for ticket creation
-    background_tasks.add_task(
-        event_publisher.publish_ticket_created,
+    # Publish SSE event for ticket creation (sent by the queue worker)
+    ticket_event_queue.publish_ticket_created(
         ticket,
         current_user.id
     )
@@ -93,7 +123,13 @@ async def list_tickets(
     db: AsyncSession = Depends(get_db)
 ):
     """List tickets with filters."""
-    query = select(Ticket).where(Ticket.tenant_id == current_user.tenant_id)
+    # TicketResponse has no relationship fields; raiseload turns any future
+    # lazy load during serialization into an error instead of N+1 queries
+    query = (
+        select(Ticket)
+        .options(raiseload("*"))
+        .where(Ticket.tenant_id == current_user.tenant_id)
+    )
 
     # Apply filters
     if status:
@@ -125,21 +161,7 @@ async def get_ticket(
     db: AsyncSession = Depends(get_db)
 ):
     """Get ticket by ID."""
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    ticket = await get_tenant_ticket(db, ticket_id, current_user.tenant_id)
 
     return ticket
 
@@ -148,26 +170,11 @@ async def get_ticket(
 async def update_ticket(
     ticket_id: str,
     ticket_update: TicketUpdate,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Update ticket details."""
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    ticket = await get_tenant_ticket(db, ticket_id, current_user.tenant_id)
 
     # Update fields
     update_data = ticket_update.model_dump(exclude_unset=True)
@@ -178,8 +185,7 @@ async def update_ticket(
     await db.refresh(ticket)
 
     # Publish SSE event for ticket update
-    background_tasks.add_task(
-        event_publisher.publish_ticket_updated,
+    ticket_event_queue.publish_ticket_updated(
         ticket,
         update_data,
         current_user.id
@@ -192,26 +198,12 @@ async def update_ticket(
 async def change_ticket_status(
     ticket_id: str,
     status_change: TicketStatusChange,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """Change ticket status."""
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    ticket = await get_tenant_ticket(db, ticket_id, current_user.tenant_id)
 
     # Store old status
     old_status = ticket.current_status
@@ -240,14 +232,12 @@ async def change_ticket_status(
 
     # Update SLA measurements after status change
     try:
-        sla_service = SlaService(db)
         await sla_service.update_sla_measurements(ticket_id)
     except Exception as e:
         logger.warning(f"Failed to update SLA for ticket {ticket_id}: {e}")
 
     # Publish SSE event for status change
-    background_tasks.add_task(
-        event_publisher.publish_ticket_status_changed,
+    ticket_event_queue.publish_ticket_status_changed(
         ticket,
         old_status,
         status_change.to_status,
@@ -266,17 +256,7 @@ async def get_ticket_status_history(
 ):
     """Get ticket status change history."""
     # Verify ticket exists and belongs to user's tenant
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
+    if not await ticket_exists(db, ticket_id, current_user.tenant_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
@@ -285,6 +265,7 @@ async def get_ticket_status_history(
     # Get status history
     result = await db.execute(
         select(TicketStatusHistory)
+        .options(raiseload("*"))
         .where(TicketStatusHistory.ticket_id == ticket_id)
         .order_by(TicketStatusHistory.changed_at.desc())
     )
@@ -297,34 +278,18 @@ async def get_ticket_status_history(
 async def get_ticket_sla(
     ticket_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    sla_service: SlaService = Depends(get_sla_service)
 ):
     """
     Get SLA status for a specific ticket.
 
     Returns comprehensive SLA information including policy, measurements, and current calculations.
     """
-    # Verify ticket exists and belongs to user's tenant
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
-
-    sla_service = SlaService(db)
-
     try:
-        sla_status = await sla_service.get_sla_status_for_ticket(ticket_id)
+        # Tenant-scoped lookup: another tenant's ticket is not found
+        sla_status = await sla_service.get_sla_status_for_ticket(
+            ticket_id, tenant_id=current_user.tenant_id
+        )
         return sla_status
     except ValueError as e:
         raise HTTPException(
@@ -1,8 +1,10 @@
 """Webhook endpoints for CSMS integration."""
 import logging
-from typing import Optional
+from typing import Optional, Type, TypeVar
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -15,13 +17,46 @@ from app.schemas.webhook import (
     WebhookErrorResponse,
     WebhookResponse,
 )
-from app.services.webhook_service import WebhookService, get_webhook_service
+from app.services.webhook_service import WebhookService, get_webhook_service, process_webhook_batch
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+PayloadT = TypeVar("PayloadT", bound=BaseModel)
+
+
+def parse_payload(model: Type[PayloadT], body: bytes) -> PayloadT:
+    """
+    Validate a raw JSON body straight into `model` with pydantic-core.
+
+    For routes that take the verified body bytes instead of a body
+    parameter: model_validate_json decodes and validates in one pass,
+    skipping the stdlib json.loads FastAPI would do first. Errors are
+    raised as FastAPI's own 422 response.
+    """
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
+def json_body_schema(model: Type[BaseModel]) -> dict:
+    """openapi_extra documenting `model` as the request body of a raw-body route."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": model.model_json_schema(ref_template="#/components/schemas/{model}")
+                }
+            }
+        }
+    }
+
 
 async def verify_csms_signature(
     request: Request,
@@ -225,59 +260,61 @@ async def receive_firmware_update(
         500: {"model": WebhookErrorResponse, "description": "Internal server error"},
     },
     summary="Batch Webhook Receiver",
-    description="Webhook endpoint for receiving multiple events in a single request."
+    description="Webhook endpoint for receiving multiple events in a single request.",
+    openapi_extra=json_body_schema(BatchWebhookPayload)
 )
 async def receive_batch_webhook(
-    payload: BatchWebhookPayload,
-    db: AsyncSession = Depends(get_db),
-    _body: bytes = Depends(verify_csms_signature),
+    body: bytes = Depends(verify_csms_signature),
 ) -> BatchWebhookResponse:
     """
     Batch webhook receiver for multiple CSMS events.
 
     This endpoint receives multiple events in a single request for
-    efficient bulk processing.
+    efficient bulk processing. Events of different chargers are processed
+    concurrently, each charger's in order.
+
+    The body (up to 100 events) is validated from the verified raw bytes
+    with pydantic-core rather than parsed to a dict first.
 
     Args:
-        payload: The batch webhook payload containing multiple events
-        db: Database session
-        _body: Raw request body (used for signature verification)
+        body: Raw request body, verified against the signature
 
     Returns:
         BatchWebhookResponse with individual results for each event
     """
+    payload = parse_payload(BatchWebhookPayload, body)
+
     results = []
     errors = []
     processed_count = 0
     failed_count = 0
 
-    service = await get_webhook_service(db)
-
-    for event in payload.events:
-        try:
-            result = await service.process_generic_webhook(event)
-            results.append(result)
-
-            if result.success:
-                processed_count += 1
-            else:
-                failed_count += 1
-                errors.append(WebhookErrorResponse(
-                    success=False,
-                    error="ProcessingError",
-                    message=result.message,
-                    details={"event_id": event.event_id}
-                ))
-
-        except Exception as e:
+    outcomes = await process_webhook_batch(payload.events)
+
+    for event, result in zip(payload.events, outcomes):
+        if isinstance(result, Exception):
             failed_count += 1
             errors.append(WebhookErrorResponse(
                 success=False,
                 error="InternalError",
-                message=str(e),
+                message=str(result),
+                details={"event_id": event.event_id}
+            ))
+            logger.error(f"Error processing batch event {event.event_id}: {result}", exc_info=result)
+            continue
+
+        results.append(result)
+
+        if result.success:
+            processed_count += 1
+        else:
+            failed_count += 1
+            errors.append(WebhookErrorResponse(
+                success=False,
+                error="ProcessingError",
+                message=result.message,
                 details={"event_id": event.event_id}
             ))
-            logger.exception(f"Error processing batch event {event.event_id}: {e}")
 
     return BatchWebhookResponse(
         success=failed_count == 0,
@@ -1,15 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from typing import List
 
 from app.core.database import get_db
 from app.api.v1.auth import get_current_user
+from app.api.v1.tickets import get_tenant_ticket, ticket_exists
 from app.models.user import User
-from app.models.ticket import Ticket
 from app.models.worklog import Worklog
 from app.schemas.worklog import WorklogCreate, WorklogResponse
-from app.services.event_publisher import event_publisher
+from app.services.event_publisher import ticket_event_queue
 
 router = APIRouter()
 
@@ -18,27 +19,12 @@ router = APIRouter()
 async def create_worklog(
     ticket_id: str,
     worklog_data: WorklogCreate,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Create worklog entry for ticket."""
     # Verify ticket exists
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    ticket = await get_tenant_ticket(db, ticket_id, current_user.tenant_id)
 
     # Create worklog
     worklog = Worklog(
@@ -52,8 +38,7 @@ async def create_worklog(
     await db.refresh(worklog)
 
     # Publish SSE event for worklog creation
-    background_tasks.add_task(
-        event_publisher.publish_worklog,
+    ticket_event_queue.publish_worklog(
         worklog,
         ticket,
         current_user.id
@@ -70,17 +55,7 @@ async def list_worklogs(
 ):
     """List worklogs for ticket."""
     # Verify ticket exists
-    result = await db.execute(
-        select(Ticket).where(
-            and_(
-                Ticket.id == ticket_id,
-                Ticket.tenant_id == current_user.tenant_id
-            )
-        )
-    )
-    ticket = result.scalar_one_or_none()
-
-    if not ticket:
+    if not await ticket_exists(db, ticket_id, current_user.tenant_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
@@ -89,6 +64,7 @@ async def list_worklogs(
     # Get worklogs
     result = await db.execute(
         select(Worklog)
+        .options(raiseload("*"))
         .where(Worklog.ticket_id == ticket_id)
         .order_by(Worklog.created_at.desc())
     )
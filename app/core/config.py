@@ -18,6 +18,12 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_PROBE_POOL_SIZE: int = 2  # Dedicated pool for health/readiness probes
+    DB_QUERY_CACHE_SIZE: int = 1200  # Compiled SQL statements cached per engine
+    DB_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statements cached per connection
 
     # Security
     SECRET_KEY: str
@@ -45,6 +51,16 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    RESPONSE_CACHE_ENABLED: bool = False  # Cache hot monitoring responses in Redis (optional)
+    GZIP_MINIMUM_SIZE: int = 1024  # Gzip responses of at least this many bytes (0 = disabled)
+
+    # Reports
+    REPORT_ROLLUP_ENABLED: bool = False  # Serve report aggregates from the ticket_daily_rollup view (PostgreSQL)
+    REPORT_ROLLUP_REFRESH_MINUTES: int = 5  # Refresh interval for ticket_daily_rollup
+
+    # SLA
+    SLA_ROLLUP_ENABLED: bool = False  # Serve /sla/statistics from the sla_daily_rollup view (PostgreSQL)
+    SLA_ROLLUP_REFRESH_MINUTES: int = 5  # Refresh interval for sla_daily_rollup
 
     # CSMS Integration
     CSMS_API_BASE_URL: str
@@ -90,6 +106,7 @@ class Settings(BaseSettings):
     ENABLE_STRUCTURED_LOGGING: bool = True  # Use JSON structured logging
     ENABLE_PROMETHEUS_METRICS: bool = True  # Enable Prometheus metrics collection
     METRICS_INCLUDE_PATH_PARAMS: bool = False  # Include path params in metrics (can cause cardinality issues)
+    METRICS_CACHE_TTL: float = 5.0  # Reuse the rendered Prometheus payload for this many seconds (0 = disabled)
 
     @property
     def email_enabled(self) -> bool:
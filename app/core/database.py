@@ -1,14 +1,69 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import bindparam, func
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.config import settings
 
-# Create async engine
+
+def _database_url() -> URL:
+    """settings.DATABASE_URL, with a bare postgresql:// URL mapped to asyncpg."""
+    url = make_url(settings.DATABASE_URL)
+    if url.drivername == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+DATABASE_URL = _database_url()
+
+
+def _connect_args() -> dict:
+    """
+    Driver connect arguments.
+
+    asyncpg prepares every statement and keeps the prepared statements per
+    connection, so the report and list queries that repeat with different
+    bind values skip parse/plan after their first run on a connection.
+    JIT is turned off for the session: the API's queries are short index
+    scans and small aggregates, where JIT compilation costs more than it
+    saves.
+    """
+    if DATABASE_URL.get_driver_name() == "asyncpg":
+        return {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"jit": "off"},
+        }
+    return {}
+
+
+# Create async engine. query_cache_size bounds SQLAlchemy's compiled-SQL
+# cache; every distinct statement shape (e.g. each optional-filter
+# combination) takes one entry, so it is sized above the default 500.
 engine = create_async_engine(
-    settings.DATABASE_URL,
+    DATABASE_URL,
     echo=settings.DEBUG,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=_connect_args(),
+)
+
+# Small separate engine for health/readiness probes, so request load on the
+# main pool cannot queue probes (and probe bursts cannot starve requests)
+probe_engine = create_async_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.DB_PROBE_POOL_SIZE,
+    max_overflow=0,
+    pool_timeout=2,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=_connect_args(),
 )
 
 # Create async session factory
@@ -23,6 +78,47 @@ AsyncSessionLocal = sessionmaker(
 # Base class for models
 Base = declarative_base()
 
+# Tenant of the authenticated user for the current request (set by get_current_user)
+current_tenant_id: ContextVar[Optional[str]] = ContextVar("current_tenant_id", default=None)
+
+
+def tenant_filter(model):
+    """
+    Tenant scope for `model` as a named bind parameter.
+
+    The value is supplied at execution time via tenant_params(), so the
+    clause never reads ORM attributes and is safe to build inside a cached
+    lambda_stmt.
+    """
+    return model.tenant_id == bindparam("current_tenant_id")
+
+
+def tenant_params(**params) -> dict:
+    """Execution parameters for statements built with tenant_filter()."""
+    return {"current_tenant_id": current_tenant_id.get(), **params}
+
+
+def dialect_insert(db: AsyncSession, model):
+    """
+    INSERT construct for `model` with ON CONFLICT support.
+
+    PostgreSQL in production; SQLite (same on_conflict_* API) in tests.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(model)
+    return pg_insert(model)
+
+
+def hours_between(db: AsyncSession, start, end):
+    """
+    SQL expression for the hours from `start` to `end` (NULL if either is NULL).
+
+    PostgreSQL uses the interval's epoch; SQLite (tests) uses julianday().
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 24
+    return func.extract("epoch", end - start) / 3600
+
 
 # Dependency for getting DB session
 async def get_db() -> AsyncSession:
@@ -31,3 +127,8 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+# Dependency for probes that only need a raw connection
+def get_probe_engine() -> AsyncEngine:
+    return probe_engine
@@ -0,0 +1,39 @@
+"""
+Keyset Pagination Cursors.
+
+A cursor is the sort key of the last row on a page, encoded as URL-safe
+base64 JSON so clients treat it as an opaque token. The next page filters
+on `(sort columns) < (cursor values)`, which walks the index from that key
+instead of counting past `skip` rows the way OFFSET does.
+"""
+
+import base64
+from datetime import date, datetime
+from typing import Any, Callable, Tuple
+
+import orjson
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a row's sort key values; dates and datetimes as ISO strings."""
+    raw = orjson.dumps([
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor into its sort key values, one parser per value.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the parsers
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
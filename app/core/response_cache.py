@@ -0,0 +1,219 @@
+"""
+Redis-backed Response Cache.
+
+Short-TTL cache for rendered JSON responses of hot monitoring endpoints.
+Each entry stores status code, body and content type in a Redis hash and
+outlives its freshness window, so the last good payload can be served as
+stale when regenerating it fails. After a Redis error the cache stops
+calling Redis for a backoff window, so an unreachable Redis costs one timeout
+per window instead of several per request.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+from fastapi import Response
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Response cache with per-key single-flight and stale fallback.
+
+    Freshness of a new entry is its generation time plus a buffer, clamped
+    to the caller's [min_ttl, max_ttl]. Without a Redis client every call
+    simply computes the response.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        prefix: str = "cass:response-cache:",
+        stale_seconds: int = 300,
+        backoff_seconds: float = 30.0
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            client: Optional redis.asyncio client
+            prefix: Key prefix for cache entries
+            stale_seconds: How long entries are kept after going stale
+            backoff_seconds: How long Redis is bypassed after an error
+        """
+        self._client = client
+        self.prefix = prefix
+        self.stale_seconds = stale_seconds
+        self.backoff_seconds = backoff_seconds
+        self._retry_at = 0.0
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def init(self, redis_url: str):
+        """Connect the cache to Redis (connections are opened lazily)."""
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(
+            redis_url,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.25
+        )
+
+    async def close(self):
+        """Close the Redis client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _available(self) -> bool:
+        return self._client is not None and time.monotonic() >= self._retry_at
+
+    def _back_off(self, action: str, key: str, error: Exception):
+        self._retry_at = time.monotonic() + self.backoff_seconds
+        logger.warning(
+            f"Response cache {action} failed for {key}, bypassing Redis for "
+            f"{self.backoff_seconds:g}s: {error}"
+        )
+
+    async def _read(self, key: str) -> Optional[Dict[bytes, bytes]]:
+        if not self._available():
+            return None
+        try:
+            entry = await self._client.hgetall(self.prefix + key)
+        except Exception as e:
+            self._back_off("read", key, e)
+            return None
+        return entry or None
+
+    async def _write(self, key: str, response: Response, ttl: float):
+        if not self._available():
+            return
+        try:
+            await self._client.hset(self.prefix + key, mapping={
+                "status": response.status_code,
+                "body": response.body,
+                "content_type": response.media_type or "application/json",
+                "fresh_until": time.time() + ttl,
+            })
+            await self._client.expire(self.prefix + key, int(ttl) + self.stale_seconds)
+        except Exception as e:
+            self._back_off("write", key, e)
+
+    async def invalidate(self, *keys: str):
+        """
+        Drop cached entries (stale copies included) after the data changed.
+
+        While Redis is bypassed this is a no-op; entries written before the
+        outage then expire with their TTL.
+        """
+        if not keys or not self._available():
+            return
+        try:
+            await self._client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            self._back_off("invalidate", ", ".join(keys), e)
+
+    @staticmethod
+    def _is_fresh(entry: Optional[Dict[bytes, bytes]]) -> bool:
+        return entry is not None and float(entry[b"fresh_until"]) > time.time()
+
+    @staticmethod
+    def _to_response(entry: Dict[bytes, bytes], cache_status: str) -> Response:
+        return Response(
+            content=entry[b"body"],
+            status_code=int(entry[b"status"]),
+            media_type=entry[b"content_type"].decode(),
+            headers={"X-Cache": cache_status}
+        )
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Response]],
+        min_ttl: float,
+        max_ttl: float,
+        buffer: float = 1.0
+    ) -> Response:
+        """
+        Return a cached response for `key` or compute and cache a new one.
+
+        Concurrent misses for the same key in this process wait for a single
+        computation. If `compute` raises and a stale entry exists, the stale
+        entry is returned with `X-Cache: stale`; otherwise the error
+        propagates. Responses with a 5xx status are never cached.
+
+        Args:
+            key: Cache key (without prefix)
+            compute: Coroutine function producing the response
+            min_ttl: Minimum freshness lifetime in seconds
+            max_ttl: Maximum freshness lifetime in seconds
+            buffer: Seconds added to the generation time for freshness
+
+        Returns:
+            Response with an X-Cache header of hit, miss or stale
+        """
+        entry = await self._read(key)
+        if self._is_fresh(entry):
+            return self._to_response(entry, "hit")
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed the entry while we waited
+            entry = await self._read(key)
+            if self._is_fresh(entry):
+                return self._to_response(entry, "hit")
+
+            started = time.perf_counter()
+            try:
+                response = await compute()
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.warning(f"Serving stale response for {key}: {e}")
+                return self._to_response(entry, "stale")
+
+            if response.status_code < 500:
+                elapsed = time.perf_counter() - started
+                ttl = min(max(elapsed + buffer, min_ttl), max_ttl)
+                await self._write(key, response, ttl)
+
+            response.headers["X-Cache"] = "miss"
+            return response
+
+    async def get_or_compute_json(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        min_ttl: float,
+        max_ttl: float,
+        buffer: float = 1.0
+    ) -> Any:
+        """
+        Return a cached JSON value for `key` or compute and cache a new one.
+
+        get_or_compute for handlers that need the value rather than a
+        response. It is JSON-encoded only to be written to Redis and decoded
+        only when read back, so with the cache disabled (or bypassed after a
+        Redis error) `compute` is simply awaited.
+        """
+        if not self._available():
+            return await compute()
+
+        value = None
+
+        async def compute_response() -> Response:
+            nonlocal value
+            value = await compute()
+            return Response(content=orjson.dumps(value), media_type="application/json")
+
+        response = await self.get_or_compute(key, compute_response, min_ttl, max_ttl, buffer)
+        if response.headers["X-Cache"] == "miss":
+            return value
+        return orjson.loads(response.body)
+
+
+# Global response cache instance (connected in the application lifespan)
+response_cache = ResponseCache()
@@ -0,0 +1,57 @@
+"""
+JSON Response Helpers.
+
+Handlers validate their ORM rows into the response schema once and return
+the result through these helpers, which encode it with pydantic-core (large
+lists are streamed a fetched batch at a time).
+Returning a Response skips FastAPI's response_model pass (re-validation plus
+jsonable_encoder); response_model stays on the route for the OpenAPI schema
+only, so keep it when adding handlers.
+"""
+
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Sequence, Tuple, Type, TypeVar
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def construct_from(schema: Type[SchemaT], obj: Any) -> SchemaT:
+    """
+    Build `schema` from an ORM object's attributes without validation.
+
+    For rows read back from our own tables, whose column types already match
+    the schema field for field; anything else goes through model_validate.
+    """
+    return schema.model_construct(**{name: getattr(obj, name) for name in _field_names(schema)})
+
+
+def json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encode an already-validated schema."""
+    return Response(content=model.model_dump_json(), media_type="application/json", status_code=status_code)
+
+
+async def json_array_chunks(
+    adapter: TypeAdapter,
+    batches: AsyncIterable[Sequence[Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Validate and encode batches of rows as one streamed JSON array.
+
+    `adapter` is a TypeAdapter over a list of the item schema. Each batch
+    goes through it once and becomes one chunk, with the brackets of its
+    encoded list dropped so the chunks join into a single array.
+    """
+    separator = b"["
+    async for batch in batches:
+        encoded = adapter.dump_json(adapter.validate_python(batch))
+        yield separator + encoded[1:-1]
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
@@ -6,23 +6,111 @@ Supports per-tenant connection pools and targeted messaging.
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
-from asyncio import Queue
+from collections import deque
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Seconds between keep-alive comments sent on every SSE stream
+SSE_HEARTBEAT_SECONDS = 30.0
+
+# Messages buffered per connection before the oldest are dropped
+SSE_QUEUE_CAPACITY = 256
+
+SSE_PING = b": ping\n\n"
+
+
+def sse_pack(event_type: str, data: Any) -> bytes:
+    """
+    Encode one SSE frame with orjson.
+
+    Frames are bytes end to end (queue, stream chunks), so the streaming
+    response sends them without a per-chunk str encode.
+    """
+    return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(data, default=str) + b"\n\n"
+
+
+class SSEMessageQueue:
+    """
+    Bounded single-consumer message buffer for one SSE connection.
+
+    A deque plus one Event: put_nowait() appends and sets the event, get()
+    only waits when the buffer is empty. Unlike asyncio.Queue, a put never
+    allocates a waiter Future, and a client that stops reading loses its
+    oldest messages instead of growing the buffer without bound.
+    """
+
+    def __init__(self, capacity: int = SSE_QUEUE_CAPACITY):
+        self._messages: deque = deque(maxlen=capacity)
+        self._not_empty = asyncio.Event()
+        self.dropped = 0
+
+    def put_nowait(self, message: bytes):
+        """Append a message, dropping the oldest one when full."""
+        if len(self._messages) == self._messages.maxlen:
+            self.dropped += 1
+        self._messages.append(message)
+        self._not_empty.set()
+
+    def get_nowait(self) -> bytes:
+        """
+        Pop the oldest message.
+
+        Raises:
+            asyncio.QueueEmpty: If no message is buffered
+        """
+        if not self._messages:
+            raise asyncio.QueueEmpty
+        return self._messages.popleft()
+
+    async def get(self) -> bytes:
+        """Pop the oldest message, waiting for one if the buffer is empty."""
+        while not self._messages:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._messages.popleft()
+
+    def empty(self) -> bool:
+        return not self._messages
+
+    def qsize(self) -> int:
+        return len(self._messages)
+
 
 @dataclass
 class SSEConnection:
     """Represents a single SSE connection."""
     user_id: str
     tenant_id: str
-    queue: Queue = field(default_factory=Queue)
+    queue: SSEMessageQueue = field(default_factory=SSEMessageQueue)
     connected_at: datetime = field(default_factory=datetime.utcnow)
+    _heartbeat: Optional[asyncio.TimerHandle] = field(default=None, init=False, repr=False)
+
+    def start_heartbeat(self, interval: float = SSE_HEARTBEAT_SECONDS):
+        """
+        Queue a ping every `interval` seconds from one re-armed loop timer.
+
+        The stream then only awaits its queue, instead of wrapping every
+        get() in a wait_for timeout (a Task and timer per message).
+        """
+        loop = asyncio.get_running_loop()
+
+        def ping():
+            self.queue.put_nowait(SSE_PING)
+            self._heartbeat = loop.call_later(interval, ping)
+
+        self._heartbeat = loop.call_later(interval, ping)
+
+    def stop_heartbeat(self):
+        """Cancel the heartbeat timer."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
 
     def __hash__(self):
         return hash(id(self))
@@ -64,6 +152,7 @@ class ConnectionManager:
             SSEConnection object for this connection
         """
         connection = SSEConnection(user_id=user_id, tenant_id=tenant_id)
+        connection.start_heartbeat()
 
         async with self._lock:
             # Add to tenant pool
@@ -93,6 +182,8 @@ class ConnectionManager:
         Args:
             connection: The connection to remove
         """
+        connection.stop_heartbeat()
+
         async with self._lock:
             # Remove from tenant pool
             if connection.tenant_id in self._tenant_connections:
@@ -137,19 +228,19 @@ class ConnectionManager:
             logger.debug(f"No connections for tenant {tenant_id}")
             return
 
-        message = self._format_sse_message(event_type, data)
+        message = sse_pack(event_type, data)
 
-        tasks = []
+        recipients = 0
         for conn in connections:
             if exclude_user_id and conn.user_id == exclude_user_id:
                 continue
-            tasks.append(self._send_to_connection(conn, message))
+            self._send_to_connection(conn, message)
+            recipients += 1
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if recipients:
             logger.debug(
                 f"Broadcast to tenant {tenant_id}: event={event_type}, "
-                f"recipients={len(tasks)}"
+                f"recipients={recipients}"
             )
 
     async def send_to_user(
@@ -172,14 +263,14 @@ class ConnectionManager:
             logger.debug(f"No connections for user {user_id}")
             return
 
-        message = self._format_sse_message(event_type, data)
+        message = sse_pack(event_type, data)
 
-        tasks = [self._send_to_connection(conn, message) for conn in connections]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        for conn in connections:
+            self._send_to_connection(conn, message)
 
         logger.debug(
             f"Sent to user {user_id}: event={event_type}, "
-            f"connections={len(tasks)}"
+            f"connections={len(connections)}"
         )
 
     async def broadcast_global(self, event_type: str, data: Any):
@@ -193,37 +284,27 @@ class ConnectionManager:
         if not self._all_connections:
             return
 
-        message = self._format_sse_message(event_type, data)
+        message = sse_pack(event_type, data)
 
-        tasks = [
+        for conn in self._all_connections:
             self._send_to_connection(conn, message)
-            for conn in self._all_connections
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
 
         logger.debug(
             f"Global broadcast: event={event_type}, "
-            f"recipients={len(tasks)}"
+            f"recipients={len(self._all_connections)}"
         )
 
-    async def _send_to_connection(self, connection: SSEConnection, message: str):
-        """Send a message to a specific connection."""
-        try:
-            await connection.queue.put(message)
-        except Exception as e:
-            logger.error(f"Failed to send message to connection: {e}")
-
-    def _format_sse_message(self, event_type: str, data: Any) -> str:
+    def _send_to_connection(self, connection: SSEConnection, message: bytes):
         """
-        Format a message according to SSE specification.
-
-        SSE format:
-        event: event_type
-        data: json_data
+        Send a message to a specific connection.
 
+        Queueing never blocks, so fan-out is a plain loop rather than one
+        gathered coroutine per connection.
         """
-        json_data = json.dumps(data, default=str)
-        return f"event: {event_type}\ndata: {json_data}\n\n"
+        try:
+            connection.queue.put_nowait(message)
+        except Exception as e:
+            logger.error(f"Failed to send message to connection: {e}")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
@@ -12,6 +12,8 @@ from app.jobs.report_batch import (
     setup_report_scheduler,
     get_scheduler_status,
 )
+from app.jobs.notification_partitions import run_notification_partition_job
+from app.jobs.report_rollup import run_report_rollup_refresh
 
 __all__ = [
     "SlaJobScheduler",
@@ -20,4 +22,6 @@ __all__ = [
     "run_monthly_snapshot_job",
     "setup_report_scheduler",
     "get_scheduler_status",
+    "run_notification_partition_job",
+    "run_report_rollup_refresh",
 ]
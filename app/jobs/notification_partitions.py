@@ -0,0 +1,70 @@
+"""
+Notification Log Partition Maintenance
+
+notification_logs is range-partitioned by month on created_at. This job
+creates the monthly partitions ahead of time so rows never start landing in
+notification_logs_default: once the default partition holds rows for a month,
+creating that month's partition fails.
+"""
+
+import logging
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Number of months after the current one that must already have a partition
+PARTITION_MONTHS_AHEAD = 2
+
+
+def partition_months(today: date, months_ahead: int = PARTITION_MONTHS_AHEAD) -> List[Tuple[int, int]]:
+    """Return (year, month) for the current month and the following `months_ahead` months."""
+    months = []
+    year, month = today.year, today.month
+    for _ in range(months_ahead + 1):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def partition_ddl(year: int, month: int) -> str:
+    """Build the CREATE TABLE statement for one monthly notification_logs partition."""
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS notification_logs_{year}_{month:02d} "
+        f"PARTITION OF notification_logs "
+        f"FOR VALUES FROM ('{year}-{month:02d}-01') TO ('{next_year}-{next_month:02d}-01')"
+    )
+
+
+async def run_notification_partition_job(today: Optional[date] = None) -> dict:
+    """
+    Ensure notification_logs partitions exist for the upcoming months.
+
+    Args:
+        today: Optional reference date. Defaults to today.
+
+    Returns:
+        dict: Summary with the partitions checked
+    """
+    if today is None:
+        today = date.today()
+
+    if engine.dialect.name != "postgresql":
+        logger.info("Skipping notification partition job: database is not PostgreSQL")
+        return {"job_type": "notification_partitions", "partitions": []}
+
+    months = partition_months(today)
+
+    async with engine.begin() as conn:
+        for year, month in months:
+            await conn.execute(text(partition_ddl(year, month)))
+
+    partitions = [f"notification_logs_{year}_{month:02d}" for year, month in months]
+    logger.info(f"Notification log partitions ensured: {', '.join(partitions)}")
+
+    return {"job_type": "notification_partitions", "partitions": partitions}
@@ -6,13 +6,17 @@ Uses APScheduler for job scheduling with async support.
 """
 
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional, List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.jobs.notification_partitions import run_notification_partition_job
+from app.jobs.report_rollup import run_report_rollup_refresh
+from app.jobs.sla_rollup import run_sla_rollup_refresh
 from app.models.tenant import Tenant
 from app.services.report_service import ReportService
 
@@ -249,6 +253,9 @@ def setup_report_scheduler(app):
     - Daily snapshot: Runs at 00:05 every day
     - Weekly snapshot: Runs at 00:10 every Monday
     - Monthly snapshot: Runs at 00:15 on the 1st of each month
+    - Notification log partitions: Runs at startup and at 00:20 every day
+    - Report rollup refresh: Every REPORT_ROLLUP_REFRESH_MINUTES, if enabled
+    - SLA rollup refresh: Every SLA_ROLLUP_REFRESH_MINUTES, if enabled
 
     Args:
         app: The FastAPI application instance
@@ -258,6 +265,7 @@ def setup_report_scheduler(app):
     try:
         from apscheduler.schedulers.asyncio import AsyncIOScheduler
         from apscheduler.triggers.cron import CronTrigger
+        from apscheduler.triggers.interval import IntervalTrigger
         from apscheduler.jobstores.memory import MemoryJobStore
         from apscheduler.executors.asyncio import AsyncIOExecutor
     except ImportError:
@@ -317,6 +325,43 @@ def setup_report_scheduler(app):
     )
     logger.info("Scheduled monthly snapshot job for 1st of month 00:15 UTC")
 
+    # Add notification log partition job - runs at startup and 00:20 UTC daily
+    scheduler.add_job(
+        run_notification_partition_job,
+        trigger=CronTrigger(hour=0, minute=20),
+        id='notification_partitions',
+        name='Notification Log Partitions',
+        next_run_time=datetime.now(timezone.utc),
+        replace_existing=True
+    )
+    logger.info("Scheduled notification partition job for startup and 00:20 UTC")
+
+    # Add report rollup refresh - only when reports read from the view
+    if settings.REPORT_ROLLUP_ENABLED:
+        scheduler.add_job(
+            run_report_rollup_refresh,
+            trigger=IntervalTrigger(minutes=settings.REPORT_ROLLUP_REFRESH_MINUTES),
+            id='report_rollup',
+            name='Report Rollup Refresh',
+            replace_existing=True
+        )
+        logger.info(
+            f"Scheduled report rollup refresh every {settings.REPORT_ROLLUP_REFRESH_MINUTES} minutes"
+        )
+
+    # Add SLA rollup refresh - only when SLA statistics read from the view
+    if settings.SLA_ROLLUP_ENABLED:
+        scheduler.add_job(
+            run_sla_rollup_refresh,
+            trigger=IntervalTrigger(minutes=settings.SLA_ROLLUP_REFRESH_MINUTES),
+            id='sla_rollup',
+            name='SLA Rollup Refresh',
+            replace_existing=True
+        )
+        logger.info(
+            f"Scheduled SLA rollup refresh every {settings.SLA_ROLLUP_REFRESH_MINUTES} minutes"
+        )
+
     # Register startup/shutdown handlers
     @app.on_event("startup")
     async def start_scheduler():
@@ -0,0 +1,33 @@
+"""
+Report Rollup Refresh
+
+Refreshes the ticket_daily_rollup materialized view that report endpoints
+read when REPORT_ROLLUP_ENABLED is set. CONCURRENTLY keeps the view
+readable during the refresh.
+"""
+
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def run_report_rollup_refresh() -> dict:
+    """
+    Refresh the ticket_daily_rollup materialized view.
+
+    Returns:
+        dict: Summary with whether the view was refreshed
+    """
+    if engine.dialect.name != "postgresql":
+        logger.info("Skipping report rollup refresh: database is not PostgreSQL")
+        return {"job_type": "report_rollup", "refreshed": False}
+
+    async with engine.begin() as conn:
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY ticket_daily_rollup"))
+
+    logger.info("Refreshed ticket_daily_rollup")
+    return {"job_type": "report_rollup", "refreshed": True}
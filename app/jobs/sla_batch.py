@@ -6,18 +6,23 @@ Provides scheduled background tasks for SLA calculation and breach detection.
 
 import asyncio
 from datetime import datetime
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, List, Union
 import logging
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
+from app.models.sla import SlaMeasurement
 from app.services.sla_service import SlaService
 
 
 logger = logging.getLogger(__name__)
 
+# Tickets recalculated at once by recalculate_tickets_sla, each holding its
+# own pooled connection, so a large request cannot drain the pool
+SLA_RECALC_CONCURRENCY = 8
+
 
 class SlaJobScheduler:
     """
@@ -247,6 +252,31 @@ async def trigger_sla_recalculation() -> dict:
     return await scheduler.run_sla_check()
 
 
+async def recalculate_tickets_sla(
+    ticket_ids: List[str]
+) -> List[Union[Optional[SlaMeasurement], Exception]]:
+    """
+    Recalculate SLA measurements for several tickets concurrently.
+
+    Each ticket is updated in its own session (an AsyncSession cannot run
+    statements concurrently), at most SLA_RECALC_CONCURRENCY at a time.
+
+    Args:
+        ticket_ids: IDs of tickets already verified to belong to the caller
+
+    Returns:
+        One entry per ticket ID, in order: the updated measurement (None when
+        no policy applies) or the exception raised for that ticket
+    """
+    semaphore = asyncio.Semaphore(SLA_RECALC_CONCURRENCY)
+
+    async def update(ticket_id: str) -> Optional[SlaMeasurement]:
+        async with semaphore, AsyncSessionLocal() as db:
+            return await SlaService(db).update_sla_measurements(ticket_id)
+
+    return await asyncio.gather(*(update(ticket_id) for ticket_id in ticket_ids), return_exceptions=True)
+
+
 async def process_single_ticket_sla(ticket_id: str) -> dict:
     """
     Process SLA for a single ticket.
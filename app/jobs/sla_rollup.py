@@ -0,0 +1,33 @@
+"""
+SLA Rollup Refresh
+
+Refreshes the sla_daily_rollup materialized view that /sla/statistics reads
+when SLA_ROLLUP_ENABLED is set. CONCURRENTLY keeps the view readable during
+the refresh.
+"""
+
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def run_sla_rollup_refresh() -> dict:
+    """
+    Refresh the sla_daily_rollup materialized view.
+
+    Returns:
+        dict: Summary with whether the view was refreshed
+    """
+    if engine.dialect.name != "postgresql":
+        logger.info("Skipping SLA rollup refresh: database is not PostgreSQL")
+        return {"job_type": "sla_rollup", "refreshed": False}
+
+    async with engine.begin() as conn:
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY sla_daily_rollup"))
+
+    logger.info("Refreshed sla_daily_rollup")
+    return {"job_type": "sla_rollup", "refreshed": True}
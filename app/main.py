@@ -3,10 +3,15 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.api.v1.csms import create_csms_client
+from app.api.v1.metrics import get_app_info_payload
+from app.api.v1.notifications import get_notification_status_payload
 from app.middleware.audit import AuditLogMiddleware
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.monitoring import (
     MonitoringMiddleware,
     configure_structured_logging,
@@ -15,6 +20,9 @@ from app.middleware.monitoring import (
 from app.jobs.report_batch import setup_report_scheduler
 from app.jobs.sla_batch import start_sla_scheduler, stop_sla_scheduler, get_sla_scheduler
 from app.core.sse import connection_manager
+from app.core.response_cache import response_cache
+from app.services.ticket_export import export_jobs
+from app.services.event_publisher import assignment_event_queue, ticket_event_queue
 
 # Configure structured logging
 if getattr(settings, "ENABLE_STRUCTURED_LOGGING", True):
@@ -66,11 +74,54 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start SLA scheduler: {e}")
 
+    # Serialize the settings-only info/status payloads once
+    get_app_info_payload()
+    get_notification_status_payload()
+
+    # Shared CSMS HTTP client (connection pool reused across requests)
+    app.state.csms_client = create_csms_client()
+
+    # Start SSE event workers
+    ticket_event_queue.start()
+    assignment_event_queue.start()
+
+    # Redis-backed cache for monitoring responses
+    if settings.RESPONSE_CACHE_ENABLED:
+        response_cache.init(settings.REDIS_URL)
+
+    # Redis-backed export job records, shared by all workers
+    export_jobs.init(settings.REDIS_URL)
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
 
+    # Stop SSE event workers
+    for event_queue in (ticket_event_queue, assignment_event_queue):
+        try:
+            await event_queue.stop()
+        except Exception as e:
+            logger.error(f"Error stopping {event_queue.name.lower()} worker: {e}")
+
+    # Close response cache
+    try:
+        await response_cache.close()
+    except Exception as e:
+        logger.error(f"Error closing response cache: {e}")
+
+    # Close export job store
+    try:
+        await export_jobs.close()
+    except Exception as e:
+        logger.error(f"Error closing export job store: {e}")
+
+    # Close CSMS HTTP client
+    try:
+        await app.state.csms_client.aclose()
+    except Exception as e:
+        logger.error(f"Error closing CSMS client: {e}")
+
     # Stop SLA scheduler
     try:
         await stop_sla_scheduler()
@@ -85,8 +136,21 @@ app = FastAPI(
     description="Charger After-Service System API",
     debug=settings.DEBUG,
     lifespan=lifespan,
+    # orjson serialises large list responses several times faster than the
+    # stdlib encoder and handles datetimes natively.
+    default_response_class=ORJSONResponse,
 )
 
+# Gzip large JSON/Prometheus bodies; SSE streams are left uncompressed
+if settings.GZIP_MINIMUM_SIZE > 0:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=5,
+        # SSE must not be buffered; XLSX files are already zip-compressed
+        exclude_prefixes=("/api/v1/sse", "/api/v1/reports/export/xlsx"),
+    )
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -94,6 +158,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset pagination cursor for list endpoints with bare-array bodies
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Performance monitoring middleware (outermost - runs first)
@@ -151,5 +217,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
     )
@@ -0,0 +1,40 @@
+"""
+Response compression middleware for CASS backend.
+
+Gzip-compresses large responses such as notification log listings,
+statistics, streamed CSV exports and the Prometheus scrape. Server-sent event
+streams are passed through untouched: gzip buffers its output, which would
+hold events back from the client. Excluded prefixes also cover responses that
+are already compressed, such as XLSX (zip) exports.
+"""
+
+from typing import Iterable
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips event streams and excluded path prefixes."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compresslevel: int = 5,
+        exclude_prefixes: Iterable[str] = ()
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self._is_excluded(scope):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+    def _is_excluded(self, scope: Scope) -> bool:
+        if scope["path"].startswith(self.exclude_prefixes):
+            return True
+        return "text/event-stream" in Headers(scope=scope).get("accept", "")
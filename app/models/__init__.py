@@ -14,6 +14,7 @@ from app.models.notification import (
     UserNotificationPreference,
     TenantNotificationSettings,
     NotificationLog,
+    NotificationCounter,
     NotificationEventType,
     NotificationChannel,
     NotificationStatus,
@@ -39,6 +40,7 @@ __all__ = [
     "UserNotificationPreference",
     "TenantNotificationSettings",
     "NotificationLog",
+    "NotificationCounter",
     "NotificationEventType",
     "NotificationChannel",
     "NotificationStatus",
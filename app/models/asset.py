@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -39,6 +39,10 @@ class Site(Base):
     chargers = relationship("Charger", back_populates="site", cascade="all, delete-orphan")
     tickets = relationship("Ticket", back_populates="site")
 
+    __table_args__ = (
+        Index("ix_sites_tenant_name_id", "tenant_id", "name", "id"),
+    )
+
 
 class Charger(Base):
     __tablename__ = "chargers"
@@ -84,3 +88,8 @@ class Charger(Base):
     tickets = relationship("Ticket", back_populates="charger")
     csms_events = relationship("CsmsEventRef", back_populates="charger")
     firmware_jobs = relationship("FirmwareJobRef", back_populates="charger")
+
+    __table_args__ = (
+        Index("ix_chargers_tenant_name_id", "tenant_id", "name", "id"),
+        Index("ix_chargers_tenant_site_name_id", "tenant_id", "site_id", "name", "id"),
+    )
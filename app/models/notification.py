@@ -4,7 +4,11 @@ Notification Models
 Defines notification preferences for users and tenants, plus notification history tracking.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Text, JSON
+from sqlalchemy import (
+    Column, String, Boolean, Date, DateTime, ForeignKey, Text, JSON, Integer, SmallInteger,
+    Index, CheckConstraint, text
+)
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -40,6 +44,33 @@ class NotificationStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a str Enum as a SMALLINT code instead of a Postgres ENUM type.
+
+    Codes are 1-based in member declaration order, so new members must only
+    ever be appended (and the matching CHECK constraint widened).
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+        self._codes = {member: code for code, member in enumerate(enum_class, start=1)}
+        self._members = {code: member for member, code in self._codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
 class UserNotificationPreference(Base):
     """User-level notification preferences."""
     __tablename__ = "user_notification_preferences"
@@ -105,10 +136,10 @@ class TenantNotificationSettings(Base):
 
     # Notification throttling settings
     throttle_enabled = Column(Boolean, default=True, nullable=False)
-    max_notifications_per_hour = Column(String, default="100")  # Per user
+    max_notifications_per_hour = Column(Integer, default=100)  # Per user
 
     # SLA warning threshold (minutes before breach to send warning)
-    sla_warning_threshold_minutes = Column(String, default="30")
+    sla_warning_threshold_minutes = Column(Integer, default=30)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -123,7 +154,7 @@ class NotificationLog(Base):
     __tablename__ = "notification_logs"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    tenant_id = Column(String, ForeignKey("tenants.id"), nullable=False, index=True)
+    tenant_id = Column(String, ForeignKey("tenants.id"), nullable=False)
 
     # Target
     user_id = Column(String, ForeignKey("users.id"), index=True)
@@ -131,9 +162,9 @@ class NotificationLog(Base):
     recipient_phone = Column(String)
 
     # Notification details
-    event_type = Column(SQLEnum(NotificationEventType), nullable=False, index=True)
-    channel = Column(SQLEnum(NotificationChannel), nullable=False, index=True)
-    status = Column(SQLEnum(NotificationStatus), nullable=False, default=NotificationStatus.PENDING, index=True)
+    event_type = Column(SmallIntEnum(NotificationEventType), nullable=False)
+    channel = Column(SmallIntEnum(NotificationChannel), nullable=False)
+    status = Column(SmallIntEnum(NotificationStatus), nullable=False, default=NotificationStatus.PENDING)
 
     # Content
     subject = Column(String)
@@ -149,15 +180,57 @@ class NotificationLog(Base):
     provider = Column(String)  # smtp, twilio, aws_sns
     provider_message_id = Column(String)  # External message ID from provider
     error_message = Column(Text)
-    retry_count = Column(String, default="0")
+    retry_count = Column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Part of the primary key because the table is range-partitioned on it
+    created_at = Column(DateTime, default=datetime.utcnow, primary_key=True, index=True)
     sent_at = Column(DateTime)
     delivered_at = Column(DateTime)
     failed_at = Column(DateTime)
+    resend_requested_at = Column(DateTime)  # Last time a resend was queued
 
     # Relationships
     tenant = relationship("Tenant")
     user = relationship("User")
     ticket = relationship("Ticket", foreign_keys=[related_ticket_id])
+
+    __table_args__ = (
+        Index("ix_notification_logs_tenant_status_created", "tenant_id", "status", created_at.desc()),
+        Index("ix_notification_logs_tenant_user_created", "tenant_id", "user_id", created_at.desc()),
+        Index("ix_notification_logs_tenant_event_created", "tenant_id", "event_type", created_at.desc()),
+        Index(
+            "ix_notification_logs_tenant_created_stats", "tenant_id", "created_at",
+            postgresql_include=["status", "channel", "event_type"]
+        ),
+        Index(
+            "ix_notification_logs_pending", "tenant_id", "created_at",
+            postgresql_where=text("status = 1")  # NotificationStatus.PENDING
+        ),
+        CheckConstraint(
+            f"event_type BETWEEN 1 AND {len(NotificationEventType)}",
+            name="ck_notification_logs_event_type"
+        ),
+        CheckConstraint(f"channel BETWEEN 1 AND {len(NotificationChannel)}", name="ck_notification_logs_channel"),
+        CheckConstraint(f"status BETWEEN 1 AND {len(NotificationStatus)}", name="ck_notification_logs_status"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+class NotificationCounter(Base):
+    """
+    Per-tenant daily notification counts.
+
+    One row per (tenant, day, dimension, key), where dimension is "status",
+    "channel" or "event_type" and key is the enum value. Rows are bumped in
+    the same transaction that writes or updates notification_logs, so the
+    statistics endpoint sums a few hundred counter rows instead of scanning
+    the log table.
+    """
+    __tablename__ = "notification_counters"
+
+    tenant_id = Column(String, ForeignKey("tenants.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    dimension = Column(String(16), primary_key=True)
+    key = Column(String(32), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
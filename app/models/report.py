@@ -1,9 +1,12 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Enum as SQLEnum, Date
+from sqlalchemy import (
+    Column, String, DateTime, ForeignKey, JSON, Enum as SQLEnum, Date, Integer, Float, MetaData, Table
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 import enum
 from app.core.database import Base
+from app.models.ticket import TicketStatus, TicketPriority, TicketCategory
 
 
 class PeriodType(str, enum.Enum):
@@ -39,3 +42,24 @@ class ReportSnapshot(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# Per-tenant daily ticket aggregates, a PostgreSQL materialized view created
+# by the add_ticket_daily_rollup migration and refreshed by the report
+# scheduler. Declared on its own MetaData so Base.metadata.create_all() does
+# not create it as a plain table.
+rollup_metadata = MetaData()
+
+ticket_daily_rollup = Table(
+    "ticket_daily_rollup",
+    rollup_metadata,
+    Column("tenant_id", String),
+    Column("day", Date),
+    Column("current_status", SQLEnum(TicketStatus)),
+    Column("priority", SQLEnum(TicketPriority)),
+    Column("category", SQLEnum(TicketCategory)),
+    Column("ticket_count", Integer),
+    Column("breached_count", Integer),
+    Column("closed_count", Integer),
+    Column("resolution_seconds", Float),
+)
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Enum as SQLEnum, Boolean
+from sqlalchemy import (
+    Column, String, DateTime, ForeignKey, Integer, Enum as SQLEnum, Boolean, Index, text, Date, Table
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 import enum
 from app.core.database import Base
+from app.models.report import rollup_metadata
 
 
 class SlaStatus(str, enum.Enum):
@@ -38,6 +41,13 @@ class SlaPolicy(Base):
     # Relationships
     measurements = relationship("SlaMeasurement", back_populates="policy")
 
+    __table_args__ = (
+        Index(
+            "ix_sla_policies_active_lookup", "tenant_id", "category", "priority",
+            postgresql_where=text("is_active")
+        ),
+    )
+
 
 class SlaMeasurement(Base):
     """SLA measurements for individual tickets."""
@@ -69,3 +79,26 @@ class SlaMeasurement(Base):
     # Relationships
     ticket = relationship("Ticket", back_populates="sla_measurements")
     policy = relationship("SlaPolicy", back_populates="measurements")
+
+    __table_args__ = (
+        # Keyset order of /sla/measurements pages
+        Index("ix_sla_measurements_created_id", created_at.desc(), id.desc()),
+    )
+
+
+# Per-tenant daily SLA measurement counts by ticket open date, a PostgreSQL
+# materialized view created by the add_sla_daily_rollup migration and
+# refreshed by the report scheduler. Declared on the rollup MetaData so
+# Base.metadata.create_all() does not create it as a plain table.
+sla_daily_rollup = Table(
+    "sla_daily_rollup",
+    rollup_metadata,
+    Column("tenant_id", String),
+    Column("day", Date),
+    Column("ticket_count", Integer),
+    Column("measurement_count", Integer),
+    Column("breached_count", Integer),
+    Column("met_count", Integer),
+    Column("active_count", Integer),
+    Column("cancelled_count", Integer),
+)
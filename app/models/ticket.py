@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -42,6 +42,13 @@ class TicketStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Member -> value lookups for per-row loops (reports, exports), so hot paths
+# do a dict lookup instead of the Enum .value descriptor on every row
+STATUS_VALUES = {member: member.value for member in TicketStatus}
+PRIORITY_VALUES = {member: member.value for member in TicketPriority}
+CATEGORY_VALUES = {member: member.value for member in TicketCategory}
+
+
 class Ticket(Base):
     __tablename__ = "tickets"
 
@@ -97,6 +104,15 @@ class Ticket(Base):
     firmware_jobs = relationship("FirmwareJobRef", back_populates="ticket")
     sla_measurements = relationship("SlaMeasurement", back_populates="ticket", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index(
+            "ix_tickets_tenant_created_cov", "tenant_id", "created_at",
+            postgresql_include=["current_status", "priority", "category", "sla_breached", "opened_at", "closed_at"]
+        ),
+        # Ticket list filtered by status, newest first
+        Index("ix_tickets_tenant_status_created", "tenant_id", "current_status", created_at.desc()),
+    )
+
 
 class TicketStatusHistory(Base):
     __tablename__ = "ticket_status_history"
@@ -114,3 +130,8 @@ class TicketStatusHistory(Base):
     # Relationships
     ticket = relationship("Ticket", back_populates="status_history")
     changed_by_user = relationship("User")
+
+    __table_args__ = (
+        # Per-ticket history, newest first
+        Index("ix_ticket_status_history_ticket_changed", "ticket_id", changed_at.desc()),
+    )
@@ -15,6 +15,11 @@ class UserRole(str, enum.Enum):
     VIEWER = "viewer"  # Read-only
 
 
+# Role groups for authorization checks (frozensets: built once, O(1) lookup)
+ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.TENANT_ADMIN})
+STAFF_ROLES = frozenset({UserRole.ADMIN, UserRole.TENANT_ADMIN, UserRole.AS_MANAGER})
+
+
 class User(Base):
     __tablename__ = "users"
 
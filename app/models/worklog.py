@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -40,3 +40,8 @@ class Worklog(Base):
     # Relationships
     ticket = relationship("Ticket", back_populates="worklogs")
     author = relationship("User", back_populates="worklogs")
+
+    __table_args__ = (
+        # Per-ticket worklog list, newest first
+        Index("ix_worklogs_ticket_created", "ticket_id", created_at.desc()),
+    )
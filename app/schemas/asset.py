@@ -33,6 +33,24 @@ class ChargerResponse(BaseModel):
         from_attributes = True
 
 
+class AssetPageCursor(BaseModel):
+    """Keyset cursor; pass back as after_name/after_id to fetch the next page."""
+    after_name: str
+    after_id: str
+
+
+class SiteListResponse(BaseModel):
+    """Response schema for a keyset-paginated site list."""
+    items: List[SiteResponse]
+    next_cursor: Optional[AssetPageCursor] = None
+
+
+class ChargerListResponse(BaseModel):
+    """Response schema for a keyset-paginated charger list."""
+    items: List[ChargerResponse]
+    next_cursor: Optional[AssetPageCursor] = None
+
+
 class ChargerDetail(ChargerResponse):
     csms_charger_id: Optional[str]
     ocpp_protocol: Optional[str]
@@ -103,8 +103,8 @@ class TenantNotificationSettingsBase(BaseModel):
     custom_from_name: Optional[str] = None
     default_user_preferences: Optional[Dict[str, Any]] = None
     throttle_enabled: bool = True
-    max_notifications_per_hour: str = "100"
-    sla_warning_threshold_minutes: str = "30"
+    max_notifications_per_hour: int = 100
+    sla_warning_threshold_minutes: int = 30
 
 
 class TenantNotificationSettingsUpdate(BaseModel):
@@ -115,8 +115,8 @@ class TenantNotificationSettingsUpdate(BaseModel):
     custom_from_name: Optional[str] = None
     default_user_preferences: Optional[Dict[str, Any]] = None
     throttle_enabled: Optional[bool] = None
-    max_notifications_per_hour: Optional[str] = None
-    sla_warning_threshold_minutes: Optional[str] = None
+    max_notifications_per_hour: Optional[int] = None
+    sla_warning_threshold_minutes: Optional[int] = None
 
 
 class TenantNotificationSettingsResponse(TenantNotificationSettingsBase):
@@ -151,7 +151,7 @@ class NotificationLogResponse(BaseModel):
     provider: Optional[str]
     provider_message_id: Optional[str]
     error_message: Optional[str]
-    retry_count: str
+    retry_count: int
     created_at: datetime
     sent_at: Optional[datetime]
     delivered_at: Optional[datetime]
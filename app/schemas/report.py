@@ -201,3 +201,12 @@ class SnapshotTableRow(BaseModel):
 class ReportSnapshotsResponse(BaseModel):
     """Response schema for recent snapshots table."""
     snapshots: List[SnapshotTableRow] = Field(description="List of snapshot rows")
+
+
+class ExportJobResponse(BaseModel):
+    """Response schema for a background XLSX export job."""
+    job_id: str = Field(description="Export job ID")
+    status: str = Field(description="pending, running, completed or failed")
+    download_url: Optional[str] = Field(None, description="Presigned download URL once completed")
+    error: Optional[str] = Field(None, description="Failure reason if the job failed")
+    created_at: datetime = Field(description="When the job was created")
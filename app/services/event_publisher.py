@@ -4,10 +4,15 @@ Event Publisher Service.
 Publishes events to SSE connections for real-time updates.
 """
 
+import asyncio
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
 from app.core.sse import connection_manager
 from app.models.ticket import Ticket, TicketStatus
 from app.models.assignment import Assignment
@@ -88,6 +93,55 @@ class EventPublisher:
             "updated_at": worklog.updated_at.isoformat() if worklog.updated_at else None,
         }
 
+    @staticmethod
+    def ticket_created_data(ticket: Ticket) -> Dict[str, Any]:
+        """Build the ticket_created event payload."""
+        return {
+            "ticket": EventPublisher._serialize_ticket(ticket),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    @staticmethod
+    def ticket_updated_data(
+        ticket: Ticket,
+        updated_fields: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the ticket_updated event payload."""
+        return {
+            "ticket": EventPublisher._serialize_ticket(ticket),
+            "updated_fields": updated_fields or {},
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    @staticmethod
+    def ticket_status_changed_data(
+        ticket: Ticket,
+        old_status: TicketStatus,
+        new_status: TicketStatus,
+        reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the ticket_status_changed event payload."""
+        return {
+            "ticket": EventPublisher._serialize_ticket(ticket),
+            "old_status": old_status.value if old_status else None,
+            "new_status": new_status.value if new_status else None,
+            "reason": reason,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    @staticmethod
+    def worklog_added_data(worklog: Worklog, ticket: Ticket) -> Dict[str, Any]:
+        """Build the worklog_added event payload."""
+        return {
+            "worklog": EventPublisher._serialize_worklog(worklog),
+            "ticket": {
+                "id": ticket.id,
+                "ticket_number": ticket.ticket_number,
+                "title": ticket.title,
+            },
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
     @staticmethod
     async def publish_ticket_created(
         ticket: Ticket,
@@ -101,10 +155,7 @@ class EventPublisher:
             created_by_user_id: Optional user ID to exclude from broadcast
         """
         try:
-            event_data = {
-                "ticket": EventPublisher._serialize_ticket(ticket),
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            event_data = EventPublisher.ticket_created_data(ticket)
 
             await connection_manager.broadcast_to_tenant(
                 tenant_id=ticket.tenant_id,
@@ -133,11 +184,7 @@ class EventPublisher:
             updated_by_user_id: Optional user ID to exclude from broadcast
         """
         try:
-            event_data = {
-                "ticket": EventPublisher._serialize_ticket(ticket),
-                "updated_fields": updated_fields or {},
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            event_data = EventPublisher.ticket_updated_data(ticket, updated_fields)
 
             await connection_manager.broadcast_to_tenant(
                 tenant_id=ticket.tenant_id,
@@ -170,13 +217,9 @@ class EventPublisher:
             reason: Optional reason for the status change
         """
         try:
-            event_data = {
-                "ticket": EventPublisher._serialize_ticket(ticket),
-                "old_status": old_status.value if old_status else None,
-                "new_status": new_status.value if new_status else None,
-                "reason": reason,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            event_data = EventPublisher.ticket_status_changed_data(
+                ticket, old_status, new_status, reason
+            )
 
             await connection_manager.broadcast_to_tenant(
                 tenant_id=ticket.tenant_id,
@@ -262,15 +305,7 @@ class EventPublisher:
             author_user_id: Optional user ID to exclude from broadcast
         """
         try:
-            event_data = {
-                "worklog": EventPublisher._serialize_worklog(worklog),
-                "ticket": {
-                    "id": ticket.id,
-                    "ticket_number": ticket.ticket_number,
-                    "title": ticket.title,
-                },
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            event_data = EventPublisher.worklog_added_data(worklog, ticket)
 
             await connection_manager.broadcast_to_tenant(
                 tenant_id=ticket.tenant_id,
@@ -325,3 +360,214 @@ class EventPublisher:
 
 # Create a singleton instance
 event_publisher = EventPublisher()
+
+
+class EventQueue(ABC):
+    """
+    Bounded queue of SSE events drained by a long-lived worker task.
+
+    Request handlers enqueue without awaiting anything, and one worker
+    publishes everything queued, so a write costs a put_nowait rather than
+    a BackgroundTasks callback. The worker takes up to `batch_size` queued
+    events per wake-up and hands them to `_publish_batch`.
+    """
+
+    # Name used in log messages
+    name = "SSE event"
+
+    def __init__(self, maxsize: int = 10_000, batch_size: int = 100):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+
+    def _put(self, event: Tuple, description: str) -> bool:
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"{self.name} queue full, dropping {description}")
+            return False
+
+    @abstractmethod
+    async def _publish_batch(self, batch: List[Tuple]):
+        """Publish a batch of queued events."""
+
+    async def _worker_loop(self):
+        """Wait for events and publish them in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._publish_batch(batch)
+            except Exception as e:
+                logger.error(f"{self.name} worker error: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def start(self):
+        """Start the worker task."""
+        if self._task is not None:
+            logger.warning(f"{self.name} worker is already running")
+            return
+
+        self._task = asyncio.create_task(self._worker_loop())
+        logger.info(f"{self.name} worker started")
+
+    async def stop(self):
+        """Cancel the worker task; events still queued are dropped."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info(f"{self.name} worker stopped")
+
+    async def join(self):
+        """Wait until every queued event has been processed."""
+        await self._queue.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics."""
+        return {
+            "running": self._task is not None,
+            "queued": self._queue.qsize(),
+            "maxsize": self.maxsize,
+        }
+
+
+class TicketEventQueue(EventQueue):
+    """
+    Queue of ticket and worklog events.
+
+    Handlers serialize the event when they enqueue it, while the ORM objects
+    are still bound to the request session; the worker only broadcasts
+    queued (event_type, tenant_id, data, exclude_user_id) envelopes, in order.
+    """
+
+    name = "Ticket event"
+
+    def _enqueue(
+        self,
+        event_type: str,
+        tenant_id: str,
+        data: Dict[str, Any],
+        exclude_user_id: Optional[str]
+    ) -> bool:
+        return self._put((event_type, tenant_id, data, exclude_user_id), f"{event_type} event")
+
+    def publish_ticket_created(self, ticket: Ticket, created_by_user_id: Optional[str] = None) -> bool:
+        """
+        Queue a ticket created event.
+
+        Returns:
+            False if the queue is full and the event was dropped
+        """
+        return self._enqueue(
+            "ticket_created", ticket.tenant_id,
+            EventPublisher.ticket_created_data(ticket), created_by_user_id
+        )
+
+    def publish_ticket_updated(
+        self,
+        ticket: Ticket,
+        updated_fields: Optional[Dict[str, Any]] = None,
+        updated_by_user_id: Optional[str] = None
+    ) -> bool:
+        """Queue a ticket updated event."""
+        return self._enqueue(
+            "ticket_updated", ticket.tenant_id,
+            EventPublisher.ticket_updated_data(ticket, updated_fields), updated_by_user_id
+        )
+
+    def publish_ticket_status_changed(
+        self,
+        ticket: Ticket,
+        old_status: TicketStatus,
+        new_status: TicketStatus,
+        changed_by_user_id: Optional[str] = None,
+        reason: Optional[str] = None
+    ) -> bool:
+        """Queue a ticket status changed event."""
+        return self._enqueue(
+            "ticket_status_changed", ticket.tenant_id,
+            EventPublisher.ticket_status_changed_data(ticket, old_status, new_status, reason),
+            changed_by_user_id
+        )
+
+    def publish_worklog(
+        self,
+        worklog: Worklog,
+        ticket: Ticket,
+        author_user_id: Optional[str] = None
+    ) -> bool:
+        """Queue a worklog added event."""
+        return self._enqueue(
+            "worklog_added", ticket.tenant_id,
+            EventPublisher.worklog_added_data(worklog, ticket), author_user_id
+        )
+
+    async def _publish_batch(self, batch: List[Tuple[str, str, Dict[str, Any], Optional[str]]]):
+        """Broadcast each queued event to its tenant, in order."""
+        for event_type, tenant_id, data, exclude_user_id in batch:
+            await connection_manager.broadcast_to_tenant(
+                tenant_id=tenant_id,
+                event_type=event_type,
+                data=data,
+                exclude_user_id=exclude_user_id
+            )
+            logger.info(f"Published {event_type} event: {data['ticket']['ticket_number']}")
+
+
+class AssignmentEventQueue(EventQueue):
+    """
+    Queue of assignment events.
+
+    Assignments are inserted with INSERT ... SELECT, so events carry only the
+    ticket id; the worker loads the tickets for a whole batch with one SELECT
+    and publishes them, so bursts of assignments share a session.
+    """
+
+    name = "Assignment event"
+
+    def enqueue(
+        self,
+        assignment: Assignment,
+        ticket_id: str,
+        assigned_by_user_id: Optional[str] = None
+    ) -> bool:
+        """
+        Queue an assignment event for publishing.
+
+        Returns:
+            False if the queue is full and the event was dropped
+        """
+        return self._put((assignment, ticket_id, assigned_by_user_id), f"event for ticket {ticket_id}")
+
+    async def _publish_batch(self, batch: List[Tuple[Assignment, str, Optional[str]]]):
+        """Load the tickets for a batch of events and publish each one."""
+        ticket_ids = {ticket_id for _, ticket_id, _ in batch}
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(select(Ticket).where(Ticket.id.in_(ticket_ids)))
+                tickets = {ticket.id: ticket for ticket in result.scalars()}
+        except Exception as e:
+            logger.error(f"Failed to load tickets for {len(batch)} assignment events: {e}")
+            return
+
+        for assignment, ticket_id, assigned_by_user_id in batch:
+            ticket = tickets.get(ticket_id)
+            if ticket is not None:
+                await EventPublisher.publish_assignment(assignment, ticket, assigned_by_user_id)
+
+
+# Shared queues; their workers are started in the application lifespan
+ticket_event_queue = TicketEventQueue()
+assignment_event_queue = AssignmentEventQueue()
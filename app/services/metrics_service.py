@@ -7,7 +7,7 @@ response times, error rates, and active connections.
 
 import time
 import threading
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, field
 from collections import defaultdict
 from datetime import datetime, timedelta
@@ -116,6 +116,16 @@ class RequestStats:
         }
 
 
+class _SingleFamilyRegistry:
+    """Registry stand-in exposing one collected metric family to generate_latest()."""
+
+    def __init__(self, metric):
+        self._metric = metric
+
+    def collect(self):
+        return [self._metric]
+
+
 class MetricsCollector:
     """
     Collects and manages application metrics.
@@ -334,16 +344,27 @@ class MetricsCollector:
         if PROMETHEUS_AVAILABLE:
             self.memory_usage_gauge.set(memory_bytes)
 
-    def get_prometheus_metrics(self) -> bytes:
-        """Generate Prometheus-format metrics output."""
+    def iter_prometheus_metrics(self) -> Iterator[bytes]:
+        """
+        Generate Prometheus-format metrics output one metric family at a time.
+
+        Each family is rendered by generate_latest() on its own, so callers
+        can stream the scrape without holding the whole payload in memory.
+        """
         if not PROMETHEUS_AVAILABLE:
-            return b"# Prometheus client not installed\n"
+            yield b"# Prometheus client not installed\n"
+            return
 
         # Update uptime
         uptime = (datetime.utcnow() - self._start_time).total_seconds()
         self.uptime_gauge.set(uptime)
 
-        return generate_latest(REGISTRY)
+        for metric in REGISTRY.collect():
+            yield generate_latest(_SingleFamilyRegistry(metric))
+
+    def get_prometheus_metrics(self) -> bytes:
+        """Generate Prometheus-format metrics output."""
+        return b"".join(self.iter_prometheus_metrics())
 
     def get_prometheus_content_type(self) -> str:
         """Get the content type for Prometheus metrics."""
@@ -7,7 +7,9 @@ Supports multiple SMS providers (Twilio, AWS SNS) and async email sending via ai
 
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
@@ -15,11 +17,12 @@ from typing import Optional, Dict, Any, List, Union
 
 import aiosmtplib
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dialect_insert
 from app.models.notification import (
     NotificationEventType,
     NotificationChannel,
@@ -27,6 +30,7 @@ from app.models.notification import (
     UserNotificationPreference,
     TenantNotificationSettings,
     NotificationLog,
+    NotificationCounter,
 )
 from app.models.user import User
 from app.models.ticket import Ticket
@@ -40,6 +44,15 @@ logger = logging.getLogger(__name__)
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
 
+@lru_cache(maxsize=1)
+def get_template_env() -> Environment:
+    """Shared Jinja2 environment, so compiled templates are cached across requests."""
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(['html', 'xml'])
+    )
+
+
 # ============================================================================
 # SMS Provider Interface and Implementations
 # ============================================================================
@@ -219,8 +232,14 @@ class AWSSNSProvider(SMSProvider):
             }
 
 
+@lru_cache(maxsize=1)
 def get_sms_provider() -> SMSProvider:
-    """Factory function to get the configured SMS provider."""
+    """
+    Return the configured SMS provider.
+
+    Cached so every NotificationService shares one provider, and with it the
+    lazily created Twilio/SNS client and its connection pool.
+    """
     provider_name = settings.SMS_PROVIDER.lower()
 
     if provider_name == "twilio":
@@ -257,12 +276,7 @@ class NotificationService:
         """
         self.db = db
         self.sms_provider = get_sms_provider()
-
-        # Initialize Jinja2 template environment
-        self.template_env = Environment(
-            loader=FileSystemLoader(str(TEMPLATE_DIR)),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        self.template_env = get_template_env()
 
     # ========================================================================
     # Email Methods
@@ -456,20 +470,63 @@ class NotificationService:
         )
         return result.scalar_one_or_none()
 
+    async def _get_or_create(self, model, key: str, value: str):
+        """
+        Fetch the row of `model` whose unique `key` column equals `value`,
+        creating it with defaults if missing.
+
+        Existing rows cost one SELECT. A missing row is inserted with
+        ON CONFLICT DO NOTHING, so concurrent first requests do not fail on
+        the unique key; the loser re-reads the winner's row.
+        """
+        query = select(model).where(getattr(model, key) == value)
+        row = (await self.db.execute(query)).scalar_one_or_none()
+        if row:
+            return row
+
+        row = await self.db.scalar(
+            dialect_insert(self.db, model)
+            .values({key: value})
+            .on_conflict_do_nothing(index_elements=[key])
+            .returning(model)
+        )
+        await self.db.commit()
+
+        return row or (await self.db.execute(query)).scalar_one()
+
+    async def _upsert(self, model, key: str, value: str, values: Dict[str, Any]):
+        """
+        Create or update the row of `model` keyed by unique `key` in one
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING round trip.
+        """
+        row = await self.db.scalar(
+            dialect_insert(self.db, model)
+            .values({key: value, **values})
+            .on_conflict_do_update(
+                index_elements=[key],
+                set_={**values, "updated_at": datetime.utcnow()}
+            )
+            .returning(model),
+            execution_options={"populate_existing": True}
+        )
+        await self.db.commit()
+
+        return row
+
     async def get_or_create_user_preferences(
         self,
         user_id: str
     ) -> UserNotificationPreference:
         """Get or create notification preferences for a user."""
-        prefs = await self.get_user_preferences(user_id)
+        return await self._get_or_create(UserNotificationPreference, "user_id", user_id)
 
-        if not prefs:
-            prefs = UserNotificationPreference(user_id=user_id)
-            self.db.add(prefs)
-            await self.db.commit()
-            await self.db.refresh(prefs)
-
-        return prefs
+    async def update_user_preferences(
+        self,
+        user_id: str,
+        values: Dict[str, Any]
+    ) -> UserNotificationPreference:
+        """Apply preference changes for a user, creating the row if needed."""
+        return await self._upsert(UserNotificationPreference, "user_id", user_id, values)
 
     async def get_tenant_settings(self, tenant_id: str) -> Optional[TenantNotificationSettings]:
         """Get notification settings for a tenant."""
@@ -480,6 +537,18 @@ class NotificationService:
         )
         return result.scalar_one_or_none()
 
+    async def get_or_create_tenant_settings(self, tenant_id: str) -> TenantNotificationSettings:
+        """Get or create notification settings for a tenant."""
+        return await self._get_or_create(TenantNotificationSettings, "tenant_id", tenant_id)
+
+    async def update_tenant_settings(
+        self,
+        tenant_id: str,
+        values: Dict[str, Any]
+    ) -> TenantNotificationSettings:
+        """Apply setting changes for a tenant, creating the row if needed."""
+        return await self._upsert(TenantNotificationSettings, "tenant_id", tenant_id, values)
+
     async def should_send_notification(
         self,
         user: User,
@@ -546,6 +615,44 @@ class NotificationService:
     # Notification Logging
     # ========================================================================
 
+    @staticmethod
+    def build_log_entry(
+        tenant_id: str,
+        event_type: NotificationEventType,
+        channel: NotificationChannel,
+        status: NotificationStatus,
+        recipient_email: Optional[str] = None,
+        recipient_phone: Optional[str] = None,
+        user_id: Optional[str] = None,
+        subject: Optional[str] = None,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+        related_ticket_id: Optional[str] = None,
+        provider: Optional[str] = None,
+        provider_message_id: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a notification log row as a plain dict for insertion."""
+        now = datetime.utcnow()
+        return {
+            "tenant_id": tenant_id,
+            "user_id": user_id,
+            "recipient_email": recipient_email,
+            "recipient_phone": recipient_phone,
+            "event_type": event_type,
+            "channel": channel,
+            "status": status,
+            "subject": subject,
+            "body_text": body_text,
+            "body_html": body_html,
+            "related_ticket_id": related_ticket_id,
+            "provider": provider,
+            "provider_message_id": provider_message_id,
+            "error_message": error_message,
+            "sent_at": now if status == NotificationStatus.SENT else None,
+            "failed_at": now if status == NotificationStatus.FAILED else None,
+        }
+
     async def log_notification(
         self,
         tenant_id: str,
@@ -564,31 +671,148 @@ class NotificationService:
         error_message: Optional[str] = None
     ) -> NotificationLog:
         """Log a notification for auditing."""
-        log = NotificationLog(
+        log = NotificationLog(**self.build_log_entry(
             tenant_id=tenant_id,
-            user_id=user_id,
-            recipient_email=recipient_email,
-            recipient_phone=recipient_phone,
             event_type=event_type,
             channel=channel,
             status=status,
+            recipient_email=recipient_email,
+            recipient_phone=recipient_phone,
+            user_id=user_id,
             subject=subject,
             body_text=body_text,
             body_html=body_html,
             related_ticket_id=related_ticket_id,
             provider=provider,
             provider_message_id=provider_message_id,
-            error_message=error_message,
-            sent_at=datetime.utcnow() if status == NotificationStatus.SENT else None,
-            failed_at=datetime.utcnow() if status == NotificationStatus.FAILED else None
-        )
+            error_message=error_message
+        ))
 
         self.db.add(log)
+        await self._count_new_logs([{"tenant_id": tenant_id, "event_type": event_type,
+                                     "channel": channel, "status": status}])
         await self.db.commit()
         await self.db.refresh(log)
 
         return log
 
+    async def log_notifications(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Log a batch of notifications in a single INSERT.
+
+        Fanout methods accumulate one entry per recipient/channel via
+        build_log_entry() and flush them here, so N recipients cost one
+        round trip and one commit instead of N.
+
+        Args:
+            entries: Rows produced by build_log_entry()
+        """
+        if not entries:
+            return
+
+        await self.db.execute(insert(NotificationLog), entries)
+        await self._count_new_logs(entries)
+        await self.db.commit()
+
+    async def _bump_counters(self, deltas: Counter) -> None:
+        """
+        Apply (tenant_id, day, dimension, key) -> delta to notification_counters.
+
+        A single multi-row INSERT ... ON CONFLICT DO UPDATE in the caller's
+        transaction, so counters commit or roll back with the log rows.
+        """
+        rows = [
+            {"tenant_id": tenant_id, "day": day, "dimension": dimension, "key": key, "count": delta}
+            for (tenant_id, day, dimension, key), delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+
+        stmt = dialect_insert(self.db, NotificationCounter)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tenant_id", "day", "dimension", "key"],
+            set_={"count": NotificationCounter.count + stmt.excluded.count}
+        )
+        await self.db.execute(stmt, rows)
+
+    async def _count_new_logs(self, entries: List[Dict[str, Any]]) -> None:
+        """Count freshly inserted log rows under today's counters."""
+        today = datetime.utcnow().date()
+        deltas = Counter()
+        for entry in entries:
+            deltas[(entry["tenant_id"], today, "status", NotificationStatus(entry["status"]).value)] += 1
+            deltas[(entry["tenant_id"], today, "channel", NotificationChannel(entry["channel"]).value)] += 1
+            deltas[(entry["tenant_id"], today, "event_type", NotificationEventType(entry["event_type"]).value)] += 1
+        await self._bump_counters(deltas)
+
+    async def set_log_status(self, log: NotificationLog, status: NotificationStatus) -> None:
+        """
+        Change a log entry's status and move its count between status counters.
+
+        Does not commit; the change lands with the caller's commit.
+        """
+        if log.status == status:
+            return
+
+        day: date = log.created_at.date()
+        deltas = Counter()
+        deltas[(log.tenant_id, day, "status", log.status.value)] -= 1
+        deltas[(log.tenant_id, day, "status", status.value)] += 1
+        log.status = status
+        await self._bump_counters(deltas)
+
+    async def resend_log(self, log_id: str) -> Optional[NotificationLog]:
+        """
+        Deliver a notification log entry that was queued for resend.
+
+        Only entries still PENDING are sent, so a resend scheduled twice goes
+        out once. The entry ends up SENT or FAILED with retry_count bumped.
+
+        Args:
+            log_id: Notification log ID
+
+        Returns:
+            The updated log entry, or None if it does not exist
+        """
+        result = await self.db.execute(
+            select(NotificationLog).where(NotificationLog.id == log_id)
+        )
+        log = result.scalar_one_or_none()
+
+        if not log or log.status != NotificationStatus.PENDING:
+            return log
+
+        if log.channel == NotificationChannel.EMAIL:
+            send_result = await self.send_email(
+                to=log.recipient_email,
+                subject=log.subject or "Notification",
+                body=log.body_text or "",
+                html_body=log.body_html
+            )
+        else:
+            send_result = await self.send_sms(
+                phone_number=log.recipient_phone,
+                message=log.body_text or ""
+            )
+
+        log.retry_count = (log.retry_count or 0) + 1
+        if send_result["success"]:
+            await self.set_log_status(log, NotificationStatus.SENT)
+            log.sent_at = datetime.utcnow()
+            log.error_message = None
+            if log.channel == NotificationChannel.SMS:
+                log.provider_message_id = send_result.get("message_id")
+        else:
+            await self.set_log_status(log, NotificationStatus.FAILED)
+            log.failed_at = datetime.utcnow()
+            log.error_message = send_result.get("error")
+
+        await self.db.commit()
+        logger.info(f"Resent notification {log_id}: {log.status.value}")
+
+        return log
+
     # ========================================================================
     # Event-Based Notification Methods
     # ========================================================================
@@ -628,6 +852,7 @@ class NotificationService:
             List of notification results
         """
         results = []
+        log_entries = []
 
         # Load ticket relations if not already loaded
         if not hasattr(ticket, 'site') or ticket.site is None:
@@ -705,7 +930,7 @@ View ticket: {context['ticket_url']}
                 })
 
                 # Log notification
-                await self.log_notification(
+                log_entries.append(self.build_log_entry(
                     tenant_id=ticket.tenant_id,
                     event_type=NotificationEventType.TICKET_CREATED,
                     channel=NotificationChannel.EMAIL,
@@ -719,7 +944,7 @@ View ticket: {context['ticket_url']}
                     provider="smtp",
                     provider_message_id=email_result.get("message_id"),
                     error_message=email_result.get("error")
-                )
+                ))
 
             # Check SMS preference
             if user.phone and await self.should_send_notification(
@@ -733,7 +958,7 @@ View ticket: {context['ticket_url']}
                     **sms_result
                 })
 
-                await self.log_notification(
+                log_entries.append(self.build_log_entry(
                     tenant_id=ticket.tenant_id,
                     event_type=NotificationEventType.TICKET_CREATED,
                     channel=NotificationChannel.SMS,
@@ -745,7 +970,9 @@ View ticket: {context['ticket_url']}
                     provider=sms_result.get("provider"),
                     provider_message_id=sms_result.get("message_id"),
                     error_message=sms_result.get("error")
-                )
+                ))
+
+        await self.log_notifications(log_entries)
 
         return results
 
@@ -769,6 +996,7 @@ View ticket: {context['ticket_url']}
             List of notification results
         """
         results = []
+        log_entries = []
 
         # Load ticket relations
         if not hasattr(ticket, 'site') or ticket.site is None:
@@ -825,7 +1053,7 @@ View ticket: {context['ticket_url']}
                 **email_result
             })
 
-            await self.log_notification(
+            log_entries.append(self.build_log_entry(
                 tenant_id=ticket.tenant_id,
                 event_type=NotificationEventType.TICKET_ASSIGNED,
                 channel=NotificationChannel.EMAIL,
@@ -835,7 +1063,7 @@ View ticket: {context['ticket_url']}
                 subject=subject,
                 related_ticket_id=ticket.id,
                 error_message=email_result.get("error")
-            )
+            ))
 
         # Send SMS to assignee
         if assignee.phone and await self.should_send_notification(
@@ -849,7 +1077,7 @@ View ticket: {context['ticket_url']}
                 **sms_result
             })
 
-            await self.log_notification(
+            log_entries.append(self.build_log_entry(
                 tenant_id=ticket.tenant_id,
                 event_type=NotificationEventType.TICKET_ASSIGNED,
                 channel=NotificationChannel.SMS,
@@ -860,7 +1088,9 @@ View ticket: {context['ticket_url']}
                 related_ticket_id=ticket.id,
                 provider=sms_result.get("provider"),
                 error_message=sms_result.get("error")
-            )
+            ))
+
+        await self.log_notifications(log_entries)
 
         return results
 
@@ -1005,6 +1235,7 @@ View ticket: {context['ticket_url']}
             List of notification results
         """
         results = []
+        log_entries = []
 
         if not hasattr(ticket, 'site') or ticket.site is None:
             ticket = await self._get_ticket_with_relations(ticket.id)
@@ -1098,7 +1329,7 @@ View ticket: {context['ticket_url']}
                     **email_result
                 })
 
-                await self.log_notification(
+                log_entries.append(self.build_log_entry(
                     tenant_id=ticket.tenant_id,
                     event_type=NotificationEventType.SLA_BREACH,
                     channel=NotificationChannel.EMAIL,
@@ -1108,7 +1339,7 @@ View ticket: {context['ticket_url']}
                     subject=subject,
                     related_ticket_id=ticket.id,
                     error_message=email_result.get("error")
-                )
+                ))
 
             if user.phone and await self.should_send_notification(
                 user, NotificationEventType.SLA_BREACH, NotificationChannel.SMS
@@ -1121,7 +1352,7 @@ View ticket: {context['ticket_url']}
                     **sms_result
                 })
 
-                await self.log_notification(
+                log_entries.append(self.build_log_entry(
                     tenant_id=ticket.tenant_id,
                     event_type=NotificationEventType.SLA_BREACH,
                     channel=NotificationChannel.SMS,
@@ -1132,7 +1363,9 @@ View ticket: {context['ticket_url']}
                     related_ticket_id=ticket.id,
                     provider=sms_result.get("provider"),
                     error_message=sms_result.get("error")
-                )
+                ))
+
+        await self.log_notifications(log_entries)
 
         return results
 
@@ -1318,3 +1551,43 @@ View ticket: {context['ticket_url']}
                 "message": f"Unsupported channel: {channel.value}",
                 "error": "Unsupported notification channel"
             }
+
+
+async def resend_notification_log(log_id: str) -> None:
+    """
+    Background task wrapper for NotificationService.resend_log.
+
+    Runs after the response has been sent, so it uses its own session
+    instead of the request-scoped one. If the resend raises, the entry is
+    set back to FAILED so it can be resent again rather than staying PENDING.
+    """
+    async with AsyncSessionLocal() as db:
+        service = NotificationService(db)
+        try:
+            await service.resend_log(log_id)
+        except Exception as e:
+            logger.error(f"Failed to resend notification {log_id}: {e}")
+            try:
+                await db.rollback()
+                log = await db.scalar(select(NotificationLog).where(NotificationLog.id == log_id))
+                if log is not None and log.status == NotificationStatus.PENDING:
+                    await service.set_log_status(log, NotificationStatus.FAILED)
+                    log.failed_at = datetime.utcnow()
+                    log.error_message = str(e)
+                    await db.commit()
+            except Exception as e:
+                logger.error(f"Failed to mark notification {log_id} as failed: {e}")
+
+
+async def record_notification_logs(entries: List[Dict[str, Any]]) -> None:
+    """
+    Background task wrapper for NotificationService.log_notifications.
+
+    Lets handlers write audit log entries after the response has been sent,
+    using their own session instead of the request-scoped one.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            await NotificationService(db).log_notifications(entries)
+        except Exception as e:
+            logger.error(f"Failed to record {len(entries)} notification log(s): {e}")
@@ -5,14 +5,20 @@ Provides methods for generating daily, weekly, and monthly report snapshots
 with ticket aggregation metrics for the CASS system.
 """
 
+from collections import Counter
 from datetime import date, datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple
-from sqlalchemy import select, func, and_, case
+from sqlalchemy import select, delete, func, and_, or_, case, true, Date
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
-from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCategory
-from app.models.report import ReportSnapshot, PeriodType
+from app.core.config import settings
+from app.core.database import hours_between
+from app.models.ticket import (
+    Ticket, TicketStatus, TicketPriority, TicketCategory,
+    STATUS_VALUES, PRIORITY_VALUES, CATEGORY_VALUES,
+)
+from app.models.report import ReportSnapshot, PeriodType, ticket_daily_rollup
 from app.models.asset import Site
 
 logger = logging.getLogger(__name__)
@@ -213,6 +219,152 @@ class ReportService:
 
         return snapshot
 
+    def _use_rollup(self) -> bool:
+        """Whether report aggregates are read from the ticket_daily_rollup view."""
+        return settings.REPORT_ROLLUP_ENABLED and self.db.get_bind().dialect.name == "postgresql"
+
+    async def summarize_ticket_windows(
+        self,
+        tenant_id: str,
+        windows: List[Tuple[Optional[datetime], Optional[datetime]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate the tickets created in each of several windows in one GROUP BY query.
+
+        Each ticket is tagged with the first window containing it and the
+        database groups by (window, status, priority, category), so at most a
+        few hundred rows come back however many tickets match; they are folded
+        into per-dimension counts here. Windows are expected not to overlap.
+        With REPORT_ROLLUP_ENABLED the groups are summed from
+        ticket_daily_rollup (whole days) instead of tickets.
+
+        Returns one dictionary per window, in order, containing:
+        - total: Tickets created in the window
+        - by_status / by_priority / by_category: Counts per value present
+        - sla_breached: Number of SLA breaches
+        - closed_count: Tickets with a closed_at
+        - resolution_hours: Sum of opened_at -> closed_at over closed tickets
+        - avg_resolution_time_hours: resolution_hours / closed_count, rounded
+        """
+        use_rollup = self._use_rollup()
+        if use_rollup:
+            rollup = ticket_daily_rollup.c
+            source, created = ticket_daily_rollup, rollup.day
+            dimensions = (rollup.current_status, rollup.priority, rollup.category)
+            aggregates = (
+                func.sum(rollup.ticket_count),
+                func.sum(rollup.breached_count),
+                func.sum(rollup.closed_count),
+                func.sum(rollup.resolution_seconds) / 3600
+            )
+            tenant_condition = rollup.tenant_id == tenant_id
+        else:
+            source, created = Ticket, Ticket.created_at
+            dimensions = (Ticket.current_status, Ticket.priority, Ticket.category)
+            aggregates = (
+                func.count(),
+                func.sum(case((Ticket.sla_breached, 1), else_=0)),
+                func.count(Ticket.closed_at),
+                func.sum(hours_between(self.db, Ticket.opened_at, Ticket.closed_at))
+            )
+            tenant_condition = Ticket.tenant_id == tenant_id
+
+        window_conditions = []
+        for start_datetime, end_datetime in windows:
+            # The view is bucketed by day, so compare dates against it
+            if use_rollup:
+                start_datetime = start_datetime and start_datetime.date()
+                end_datetime = end_datetime and end_datetime.date()
+            conditions = [true()]
+            if start_datetime:
+                conditions.append(created >= start_datetime)
+            if end_datetime:
+                conditions.append(created <= end_datetime)
+            window_conditions.append(and_(*conditions))
+
+        window = case(
+            *[(condition, index) for index, condition in enumerate(window_conditions)]
+        ).label("window")
+        result = await self.db.execute(
+            select(window, *dimensions, *aggregates)
+            .select_from(source)
+            .where(tenant_condition, or_(*window_conditions))
+            .group_by(window, *dimensions)
+        )
+
+        totals = [
+            {
+                "total": 0,
+                "by_status": {},
+                "by_priority": {},
+                "by_category": {},
+                "sla_breached": 0,
+                "closed_count": 0,
+                "resolution_hours": 0.0,
+            }
+            for _ in windows
+        ]
+
+        for index, status, priority, category, count, breached, closed, hours in result.all():
+            summary = totals[index]
+            # SUM over the view's bigint columns comes back as Decimal
+            count = int(count)
+            summary["total"] += count
+            status, priority, category = (
+                STATUS_VALUES[status], PRIORITY_VALUES[priority], CATEGORY_VALUES[category]
+            )
+            summary["by_status"][status] = summary["by_status"].get(status, 0) + count
+            summary["by_priority"][priority] = summary["by_priority"].get(priority, 0) + count
+            summary["by_category"][category] = summary["by_category"].get(category, 0) + count
+            summary["sla_breached"] += int(breached or 0)
+            summary["closed_count"] += int(closed or 0)
+            summary["resolution_hours"] += float(hours or 0)
+
+        for summary in totals:
+            closed_count = summary["closed_count"]
+            summary["avg_resolution_time_hours"] = (
+                round(summary["resolution_hours"] / closed_count, 2) if closed_count else 0
+            )
+
+        return totals
+
+    async def count_created_by_day(
+        self,
+        tenant_id: str,
+        start_datetime: datetime,
+        end_datetime: datetime
+    ) -> Dict[date, int]:
+        """Count tickets created per calendar day in the window (days without tickets are absent)."""
+        if self._use_rollup():
+            rollup = ticket_daily_rollup.c
+            query = (
+                select(rollup.day, func.sum(rollup.ticket_count))
+                .where(
+                    and_(
+                        rollup.tenant_id == tenant_id,
+                        rollup.day >= start_datetime.date(),
+                        rollup.day <= end_datetime.date()
+                    )
+                )
+                .group_by(rollup.day)
+            )
+        else:
+            day = func.date(Ticket.created_at, type_=Date).label("day")
+            query = (
+                select(day, func.count())
+                .where(
+                    and_(
+                        Ticket.tenant_id == tenant_id,
+                        Ticket.created_at >= start_datetime,
+                        Ticket.created_at <= end_datetime
+                    )
+                )
+                .group_by(day)
+            )
+
+        result = await self.db.execute(query)
+        return {day: int(count) for day, count in result.all()}
+
     async def _get_existing_snapshot(
         self,
         tenant_id: str,
@@ -254,7 +406,16 @@ class ReportService:
         - top_sites: Sites with highest ticket counts
         """
         # Get tickets created in this period
-        created_query = select(Ticket).where(
+        # Only the columns the breakdowns read, as plain rows
+        created_query = select(
+            Ticket.current_status,
+            Ticket.priority,
+            Ticket.category,
+            Ticket.site_id,
+            Ticket.sla_breached,
+            Ticket.opened_at,
+            Ticket.resolved_at
+        ).where(
             and_(
                 Ticket.tenant_id == tenant_id,
                 Ticket.created_at >= start_datetime,
@@ -262,7 +423,7 @@ class ReportService:
             )
         )
         created_result = await self.db.execute(created_query)
-        created_tickets = created_result.scalars().all()
+        created_tickets = created_result.all()
 
         # Get tickets resolved in this period
         resolved_query = select(func.count(Ticket.id)).where(
@@ -286,40 +447,26 @@ class ReportService:
         closed_result = await self.db.execute(closed_query)
         total_closed = closed_result.scalar() or 0
 
-        # Calculate breakdowns
-        by_status: Dict[str, int] = {}
-        by_priority: Dict[str, int] = {}
-        by_category: Dict[str, int] = {}
-        site_counts: Dict[str, int] = {}
-        sla_breached_count = 0
-        resolution_times: List[float] = []
-
-        for ticket in created_tickets:
-            # Status breakdown
-            status_key = ticket.current_status.value
-            by_status[status_key] = by_status.get(status_key, 0) + 1
-
-            # Priority breakdown
-            priority_key = ticket.priority.value
-            by_priority[priority_key] = by_priority.get(priority_key, 0) + 1
-
-            # Category breakdown
-            category_key = ticket.category.value
-            by_category[category_key] = by_category.get(category_key, 0) + 1
-
-            # Site counts
-            site_counts[ticket.site_id] = site_counts.get(ticket.site_id, 0) + 1
-
-            # SLA breaches
-            if ticket.sla_breached:
-                sla_breached_count += 1
-
-            # Resolution time (for resolved tickets)
-            if ticket.resolved_at and ticket.opened_at:
-                resolution_hours = (
-                    ticket.resolved_at - ticket.opened_at
-                ).total_seconds() / 3600
-                resolution_times.append(resolution_hours)
+        # Calculate breakdowns; Counter does the per-key counting in C and
+        # members are mapped to their values once per key, not once per row
+        by_status = {
+            STATUS_VALUES[k]: n for k, n in Counter(t.current_status for t in created_tickets).items()
+        }
+        by_priority = {
+            PRIORITY_VALUES[k]: n for k, n in Counter(t.priority for t in created_tickets).items()
+        }
+        by_category = {
+            CATEGORY_VALUES[k]: n for k, n in Counter(t.category for t in created_tickets).items()
+        }
+        site_counts = dict(Counter(t.site_id for t in created_tickets))
+        sla_breached_count = sum(1 for t in created_tickets if t.sla_breached)
+
+        # Resolution time (for resolved tickets)
+        resolution_times = [
+            (t.resolved_at - t.opened_at).total_seconds() / 3600
+            for t in created_tickets
+            if t.resolved_at and t.opened_at
+        ]
 
         total_created = len(created_tickets)
 
@@ -435,36 +582,78 @@ class ReportService:
         if to_date:
             base_conditions.append(ReportSnapshot.period_end <= to_date)
 
-        # Get total count
+        # Page rows and the total match count in one query: COUNT(*) OVER ()
+        # is computed before OFFSET/LIMIT, so every row carries the total
+        query = (
+            select(ReportSnapshot, func.count().over().label("total"))
+            .where(and_(*base_conditions))
+            .order_by(ReportSnapshot.period_start.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # Empty page: past the end of a non-empty result, or no matches
+        if skip == 0:
+            return [], 0
         count_query = select(func.count(ReportSnapshot.id)).where(
             and_(*base_conditions)
         )
         count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+        return [], count_result.scalar() or 0
 
-        # Get paginated results
+    async def list_recent_snapshot_summaries(self, tenant_id: str, limit: int = 10) -> List[Any]:
+        """
+        List the latest snapshots with only the metrics the snapshot table shows.
+
+        The four metrics are extracted from the JSON column in SQL, so neither
+        the rest of the metrics document nor ReportSnapshot instances are loaded.
+
+        Returns:
+            Rows of (id, period_start, total_created, total_resolved,
+            sla_breached_count, avg_resolution_time_hours); missing metrics are 0
+        """
+        metrics = ReportSnapshot.metrics
         query = (
-            select(ReportSnapshot)
-            .where(and_(*base_conditions))
+            select(
+                ReportSnapshot.id,
+                ReportSnapshot.period_start,
+                func.coalesce(metrics["total_created"].as_integer(), 0).label("total_created"),
+                func.coalesce(metrics["total_resolved"].as_integer(), 0).label("total_resolved"),
+                func.coalesce(metrics["sla_breached_count"].as_integer(), 0).label("sla_breached_count"),
+                func.coalesce(
+                    metrics["avg_resolution_time_hours"].as_float(), 0.0
+                ).label("avg_resolution_time_hours"),
+            )
+            .where(ReportSnapshot.tenant_id == tenant_id)
             .order_by(ReportSnapshot.period_start.desc())
-            .offset(skip)
             .limit(limit)
         )
         result = await self.db.execute(query)
-        snapshots = result.scalars().all()
-
-        return list(snapshots), total
+        return result.all()
 
     async def delete_snapshot(
         self,
         snapshot_id: str,
         tenant_id: str
     ) -> bool:
-        """Delete a snapshot by ID."""
-        snapshot = await self.get_snapshot_by_id(snapshot_id, tenant_id)
-        if not snapshot:
-            return False
-
-        await self.db.delete(snapshot)
+        """Delete a snapshot by ID; returns False if the tenant has no such snapshot."""
+        # DELETE ... RETURNING reports whether a row matched in the same round
+        # trip, instead of loading the snapshot first
+        result = await self.db.execute(
+            delete(ReportSnapshot)
+            .where(
+                and_(
+                    ReportSnapshot.id == snapshot_id,
+                    ReportSnapshot.tenant_id == tenant_id
+                )
+            )
+            .returning(ReportSnapshot.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await self.db.commit()
-        return True
+        return deleted
@@ -7,7 +7,7 @@ Provides SLA calculation and breach detection functionality for tickets.
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, lambda_stmt
 from sqlalchemy.orm import selectinload
 import logging
 
@@ -55,16 +55,23 @@ class SlaService:
         Returns:
             SlaPolicy if found, None otherwise
         """
+        # Policy lookups run for every ticket in a batch, so they are cached
+        # lambda_stmts: compiled once per shape, with the closure values
+        # below bound as parameters on each call
+        tenant_id = ticket.tenant_id
+        category = ticket.category.value
+        priority = ticket.priority.value
+
         # First, try to find exact match for category and priority
         result = await self.db.execute(
-            select(SlaPolicy).where(
+            lambda_stmt(lambda: select(SlaPolicy).where(
                 and_(
-                    SlaPolicy.tenant_id == ticket.tenant_id,
-                    SlaPolicy.category == ticket.category.value,
-                    SlaPolicy.priority == ticket.priority.value,
+                    SlaPolicy.tenant_id == tenant_id,
+                    SlaPolicy.category == category,
+                    SlaPolicy.priority == priority,
                     SlaPolicy.is_active == True
                 )
-            )
+            ))
         )
         policy = result.scalar_one_or_none()
 
@@ -73,13 +80,13 @@ class SlaService:
 
         # Fall back to policy matching only priority (any category)
         result = await self.db.execute(
-            select(SlaPolicy).where(
+            lambda_stmt(lambda: select(SlaPolicy).where(
                 and_(
-                    SlaPolicy.tenant_id == ticket.tenant_id,
-                    SlaPolicy.priority == ticket.priority.value,
+                    SlaPolicy.tenant_id == tenant_id,
+                    SlaPolicy.priority == priority,
                     SlaPolicy.is_active == True
                 )
-            ).order_by(SlaPolicy.created_at.asc())
+            ).order_by(SlaPolicy.created_at.asc()))
         )
         policy = result.scalars().first()
 
@@ -87,25 +94,31 @@ class SlaService:
 
     async def get_ticket_with_relations(
         self,
-        ticket_id: str
+        ticket_id: str,
+        tenant_id: Optional[str] = None
     ) -> Optional[Ticket]:
         """
         Get a ticket with its SLA measurements and worklogs loaded.
 
         Args:
             ticket_id: The ID of the ticket
+            tenant_id: Optional tenant the ticket must belong to
 
         Returns:
             Ticket with loaded relations if found, None otherwise
         """
-        result = await self.db.execute(
+        query = lambda_stmt(lambda: (
             select(Ticket)
             .options(
                 selectinload(Ticket.sla_measurements),
                 selectinload(Ticket.worklogs)
             )
             .where(Ticket.id == ticket_id)
-        )
+        ))
+        if tenant_id is not None:
+            query += lambda s: s.where(Ticket.tenant_id == tenant_id)
+
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
     async def get_first_response_time(
@@ -165,7 +178,8 @@ class SlaService:
 
     async def calculate_sla_for_ticket(
         self,
-        ticket_id: str
+        ticket_id: str,
+        tenant_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Calculate SLA metrics for a specific ticket.
@@ -174,6 +188,7 @@ class SlaService:
 
         Args:
             ticket_id: The ID of the ticket
+            tenant_id: Optional tenant the ticket must belong to
 
         Returns:
             Dictionary containing SLA metrics:
@@ -187,7 +202,7 @@ class SlaService:
             - resolution_breached: bool
             - overall_status: SlaStatus
         """
-        ticket = await self.get_ticket_with_relations(ticket_id)
+        ticket = await self.get_ticket_with_relations(ticket_id, tenant_id)
 
         if not ticket:
             raise ValueError(f"Ticket not found: {ticket_id}")
@@ -272,13 +287,15 @@ class SlaService:
 
     async def check_sla_breach(
         self,
-        ticket_id: str
+        ticket_id: str,
+        tenant_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Check if SLA is breached for a specific ticket.
 
         Args:
             ticket_id: The ID of the ticket
+            tenant_id: Optional tenant the ticket must belong to
 
         Returns:
             Dictionary containing breach status:
@@ -289,7 +306,7 @@ class SlaService:
             - time_to_response_breach_minutes: float or None
             - time_to_resolution_breach_minutes: float or None
         """
-        sla_data = await self.calculate_sla_for_ticket(ticket_id)
+        sla_data = await self.calculate_sla_for_ticket(ticket_id, tenant_id)
 
         response_breached = sla_data.get("response_breached", False)
         resolution_breached = sla_data.get("resolution_breached", False)
@@ -313,7 +330,7 @@ class SlaService:
             time_to_response_breach = (sla_data["response_target_at"] - now).total_seconds() / 60
 
         if sla_data.get("resolution_target_at"):
-            ticket = await self.get_ticket_with_relations(ticket_id)
+            ticket = await self.get_ticket_with_relations(ticket_id, tenant_id)
             if ticket and ticket.current_status not in [TicketStatus.RESOLVED, TicketStatus.CLOSED, TicketStatus.CANCELLED]:
                 time_to_resolution_breach = (sla_data["resolution_target_at"] - now).total_seconds() / 60
 
@@ -330,7 +347,8 @@ class SlaService:
 
     async def update_sla_measurements(
         self,
-        ticket_id: str
+        ticket_id: str,
+        tenant_id: Optional[str] = None
     ) -> Optional[SlaMeasurement]:
         """
         Update or create SLA measurements for a ticket.
@@ -340,11 +358,12 @@ class SlaService:
 
         Args:
             ticket_id: The ID of the ticket
+            tenant_id: Optional tenant the ticket must belong to
 
         Returns:
             Updated or created SlaMeasurement object
         """
-        ticket = await self.get_ticket_with_relations(ticket_id)
+        ticket = await self.get_ticket_with_relations(ticket_id, tenant_id)
 
         if not ticket:
             raise ValueError(f"Ticket not found: {ticket_id}")
@@ -357,7 +376,7 @@ class SlaService:
             return None
 
         # Calculate SLA metrics
-        sla_data = await self.calculate_sla_for_ticket(ticket_id)
+        sla_data = await self.calculate_sla_for_ticket(ticket_id, tenant_id)
 
         # Get or create measurement
         result = await self.db.execute(
@@ -498,7 +517,8 @@ class SlaService:
 
     async def get_sla_status_for_ticket(
         self,
-        ticket_id: str
+        ticket_id: str,
+        tenant_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get comprehensive SLA status for a ticket.
@@ -507,17 +527,18 @@ class SlaService:
 
         Args:
             ticket_id: The ID of the ticket
+            tenant_id: Optional tenant the ticket must belong to
 
         Returns:
             Complete SLA status information
         """
-        ticket = await self.get_ticket_with_relations(ticket_id)
+        ticket = await self.get_ticket_with_relations(ticket_id, tenant_id)
 
         if not ticket:
             raise ValueError(f"Ticket not found: {ticket_id}")
 
         # Get SLA calculation
-        sla_data = await self.calculate_sla_for_ticket(ticket_id)
+        sla_data = await self.calculate_sla_for_ticket(ticket_id, tenant_id)
 
         # Get existing measurement
         result = await self.db.execute(
@@ -0,0 +1,330 @@
+"""
+Ticket Export Service
+
+Builds the CSV and XLSX ticket exports and runs XLSX exports as background
+jobs. A job builds the workbook after the enqueueing request has returned,
+uploads it to S3 and records a presigned download URL in the export job
+store, which clients poll. Job records live in Redis so any API worker can
+answer the poll; without Redis they are kept in process memory.
+"""
+
+import asyncio
+import importlib.util
+import io
+import logging
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.ticket import (
+    Ticket, TicketStatus, TicketPriority, TicketCategory,
+    STATUS_VALUES, PRIORITY_VALUES, CATEGORY_VALUES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tickets fetched per round trip by the exports (and written per CSV chunk)
+EXPORT_BATCH_SIZE = 1000
+
+# Ticket columns written by the exports; selected as plain rows so no
+# Ticket instances (or their unused text columns) are loaded
+EXPORT_COLUMNS = (
+    Ticket.ticket_number,
+    Ticket.title,
+    Ticket.current_status,
+    Ticket.priority,
+    Ticket.category,
+    Ticket.created_at,
+    Ticket.closed_at,
+    Ticket.sla_breached,
+)
+
+EXPORT_HEADERS = [
+    'Ticket Number', 'Title', 'Status', 'Priority', 'Category',
+    'Created At', 'Closed At', 'SLA Breached'
+]
+
+# CSV export header line; rows use the same "\r\n" terminator as csv.writer
+CSV_HEADER = ",".join(EXPORT_HEADERS) + "\r\n"
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+# XLSX export column widths: ticket number, title (capped as before), the
+# three enum columns sized to their longest value, ISO timestamps, Yes/No
+XLSX_COLUMN_WIDTHS = [
+    24,
+    50,
+    max(len(v.value) for v in TicketStatus) + 2,
+    max(len(v.value) for v in TicketPriority) + 2,
+    max(len(v.value) for v in TicketCategory) + 2,
+    28,
+    28,
+    14,
+]
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Seconds export job records, and the presigned download URLs, stay valid
+EXPORT_JOB_TTL = 3600
+
+
+def export_tickets_query(
+    tenant_id: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+):
+    """Build the streaming export query for a tenant's tickets, newest first."""
+    query = select(*EXPORT_COLUMNS).where(Ticket.tenant_id == tenant_id)
+
+    if start_date:
+        query = query.where(Ticket.created_at >= datetime.combine(start_date, datetime.min.time()))
+    if end_date:
+        query = query.where(Ticket.created_at <= datetime.combine(end_date, datetime.max.time()))
+
+    return query.order_by(Ticket.created_at.desc()).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+
+def export_filename(extension: str) -> str:
+    """Return the download file name for an export created today."""
+    return f"tickets_export_{datetime.utcnow().strftime('%Y%m%d')}.{extension}"
+
+
+def _csv_field(value: str) -> str:
+    """Quote a free-text CSV field only when it contains special characters."""
+    if _CSV_SPECIAL_CHARS.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def format_csv_row(ticket) -> str:
+    """
+    Format one EXPORT_COLUMNS row as a CSV line.
+
+    Only ticket_number and title are free text; the enum values, ISO
+    timestamps and Yes/No flag never need quoting, so they are joined as-is
+    instead of going through csv.writer's per-field checks.
+    """
+    closed_at = ticket.closed_at
+    return ",".join((
+        _csv_field(ticket.ticket_number),
+        _csv_field(ticket.title),
+        STATUS_VALUES[ticket.current_status],
+        PRIORITY_VALUES[ticket.priority],
+        CATEGORY_VALUES[ticket.category],
+        ticket.created_at.isoformat(),
+        closed_at.isoformat() if closed_at else "",
+        "Yes" if ticket.sla_breached else "No",
+    )) + "\r\n"
+
+
+def xlsx_supported() -> bool:
+    """Return whether openpyxl is installed for XLSX exports."""
+    return importlib.util.find_spec("openpyxl") is not None
+
+
+def _xlsx_row(ticket) -> List[str]:
+    closed_at = ticket.closed_at
+    return [
+        ticket.ticket_number,
+        ticket.title,
+        STATUS_VALUES[ticket.current_status],
+        PRIORITY_VALUES[ticket.priority],
+        CATEGORY_VALUES[ticket.category],
+        ticket.created_at.isoformat(),
+        closed_at.isoformat() if closed_at else '',
+        'Yes' if ticket.sla_breached else 'No'
+    ]
+
+
+async def build_tickets_xlsx(
+    db: AsyncSession,
+    tenant_id: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> bytes:
+    """
+    Build the XLSX ticket export.
+
+    Rows are appended and the workbook is saved in a worker thread, one
+    fetched batch at a time, so the event loop keeps serving requests while
+    a large export is written.
+
+    Raises:
+        ImportError: If openpyxl is not installed
+    """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    # Write-only workbook: rows are serialised as they are appended instead
+    # of being kept as Cell objects
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Tickets")
+
+    # Column widths must be set before the first row in write-only mode, so
+    # they come from the known value shapes rather than a pass over the cells
+    for col_num, width in enumerate(XLSX_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+
+    # Header style
+    header_fill = PatternFill(start_color="EB5D19", end_color="EB5D19", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF")
+
+    header_cells = []
+    for header in EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.fill = header_fill
+        cell.font = header_font
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    def append_rows(tickets):
+        for ticket in tickets:
+            ws.append(_xlsx_row(ticket))
+
+    # Write data, one fetched batch of tickets in memory at a time
+    result = await db.stream(export_tickets_query(tenant_id, start_date, end_date))
+    async for tickets in result.partitions():
+        await asyncio.to_thread(append_rows, tickets)
+
+    output = io.BytesIO()
+    await asyncio.to_thread(wb.save, output)
+    return output.getvalue()
+
+
+async def upload_export(key: str, content: bytes, media_type: str) -> str:
+    """
+    Upload an export file to S3 and return a presigned download URL.
+
+    boto3 calls are blocking, so they run in the default executor.
+    """
+    from app.api.v1.attachments import get_s3_client
+
+    def upload_sync():
+        client = get_s3_client()
+        client.put_object(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+            Body=content,
+            ContentType=media_type
+        )
+        return client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': settings.S3_BUCKET_NAME, 'Key': key},
+            ExpiresIn=EXPORT_JOB_TTL
+        )
+
+    return await asyncio.get_running_loop().run_in_executor(None, upload_sync)
+
+
+class ExportJobStore:
+    """
+    Export job records keyed by job id.
+
+    Each job is a Redis hash that expires after EXPORT_JOB_TTL. Without a
+    Redis client, records are kept in a process-local dict (single worker
+    deployments and tests).
+    """
+
+    def __init__(self, client=None, prefix: str = "cass:export-job:"):
+        """
+        Initialize the job store.
+
+        Args:
+            client: Optional redis.asyncio client
+            prefix: Key prefix for job records
+        """
+        self._client = client
+        self.prefix = prefix
+        self._local: Dict[str, Dict[str, str]] = {}
+
+    def init(self, redis_url: str):
+        """Connect the store to Redis (connections are opened lazily)."""
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(redis_url)
+
+    async def close(self):
+        """Close the Redis client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def save(self, job: Dict[str, Any]):
+        """Write the full job record; None values are stored as empty strings."""
+        record = {k: "" if v is None else str(v) for k, v in job.items()}
+        if self._client is None:
+            self._local[job["job_id"]] = record
+            return
+        key = self.prefix + job["job_id"]
+        await self._client.hset(key, mapping=record)
+        await self._client.expire(key, EXPORT_JOB_TTL)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """Return the job record, with empty fields as None, or None if unknown."""
+        if self._client is None:
+            record = self._local.get(job_id)
+        else:
+            raw = await self._client.hgetall(self.prefix + job_id)
+            record = {k.decode(): v.decode() for k, v in raw.items()} if raw else None
+        if record is None:
+            return None
+        return {k: v or None for k, v in record.items()}
+
+
+# Global export job store (connected in the application lifespan)
+export_jobs = ExportJobStore()
+
+
+async def create_xlsx_export_job(tenant_id: str) -> Dict[str, Any]:
+    """Record a new pending XLSX export job for a tenant and return it."""
+    job = {
+        "job_id": str(uuid.uuid4()),
+        "tenant_id": tenant_id,
+        "status": "pending",
+        "download_url": None,
+        "error": None,
+        "created_at": datetime.utcnow().isoformat(),
+    }
+    await export_jobs.save(job)
+    return job
+
+
+async def run_xlsx_export_job(
+    job: Dict[str, Any],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> None:
+    """
+    Background task building, uploading and recording one XLSX export.
+
+    Uses its own session instead of the request-scoped one. Failures are
+    recorded on the job rather than raised.
+    """
+    job = {**job, "status": "running"}
+    await export_jobs.save(job)
+
+    started = time.perf_counter()
+    try:
+        async with AsyncSessionLocal() as db:
+            content = await build_tickets_xlsx(db, job["tenant_id"], start_date, end_date)
+        key = f"exports/{job['tenant_id']}/{job['job_id']}/{export_filename('xlsx')}"
+        download_url = await upload_export(key, content, XLSX_MEDIA_TYPE)
+    except Exception as e:
+        logger.error(f"XLSX export job {job['job_id']} failed: {e}")
+        await export_jobs.save({**job, "status": "failed", "error": str(e)})
+        return
+
+    await export_jobs.save({**job, "status": "completed", "download_url": download_url})
+    logger.info(
+        f"XLSX export job {job['job_id']} completed in "
+        f"{time.perf_counter() - started:.2f}s ({len(content)} bytes)"
+    )
@@ -1,15 +1,18 @@
 """Webhook service for processing CSMS webhooks."""
+import asyncio
 import hashlib
 import hmac
 import logging
 from datetime import datetime
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import uuid
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dialect_insert
 from app.models.asset import Charger
 from app.models.csms import CsmsEventRef, FirmwareJobRef, FirmwareJobStatus
 from app.models.ticket import Ticket, TicketChannel, TicketCategory, TicketPriority, TicketStatus
@@ -25,6 +28,9 @@ from app.schemas.webhook import (
 )
 
 
+# Chargers whose batch events are processed at the same time (one session each)
+WEBHOOK_BATCH_CONCURRENCY = 16
+
 # System user email pattern for each tenant
 SYSTEM_USER_EMAIL_TEMPLATE = "system@cass.internal"
 
@@ -32,6 +38,12 @@ SYSTEM_USER_EMAIL_TEMPLATE = "system@cass.internal"
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _signing_key(secret: str) -> bytes:
+    """Webhook secret as HMAC key bytes, encoded once per configured secret."""
+    return secret.encode("utf-8")
+
+
 # Mapping of CSMS fault codes to ticket categories
 FAULT_CATEGORY_MAP = {
     "ConnectorLockFailure": TicketCategory.CONNECTOR,
@@ -74,6 +86,9 @@ class WebhookService:
 
         Each tenant has a dedicated system user for webhook-created tickets.
         The user is created on first use and cached for subsequent calls.
+        Concurrent sessions (batch charger groups, parallel webhooks) may
+        both miss the lookup, so creation is an INSERT ... ON CONFLICT DO
+        NOTHING on the unique email and the loser re-reads the winner's row.
 
         Args:
             tenant_id: The tenant ID
@@ -87,37 +102,36 @@ class WebhookService:
 
         # Look for existing system user
         system_email = f"system+{tenant_id[:8]}@cass.internal"
-        result = await self.db.execute(
-            select(User).where(
-                User.tenant_id == tenant_id,
-                User.email == system_email
-            )
-        )
-        system_user = result.scalar_one_or_none()
-
-        if system_user:
-            self._system_user_cache[tenant_id] = system_user.id
-            return system_user.id
-
-        # Create system user for this tenant
-        system_user = User(
-            id=str(uuid.uuid4()),
-            tenant_id=tenant_id,
-            email=system_email,
-            hashed_password="!SYSTEM_USER_NO_LOGIN!",  # Cannot be used for login
-            role=UserRole.ADMIN,  # System user has admin role for internal operations
-            full_name="CASS System",
-            is_active=True,
-            is_verified=True,
+        query = select(User.id).where(
+            User.tenant_id == tenant_id,
+            User.email == system_email
         )
+        system_user_id = await self.db.scalar(query)
+
+        if system_user_id is None:
+            # Create system user for this tenant
+            system_user_id = await self.db.scalar(
+                dialect_insert(self.db, User)
+                .values(
+                    id=str(uuid.uuid4()),
+                    tenant_id=tenant_id,
+                    email=system_email,
+                    hashed_password="!SYSTEM_USER_NO_LOGIN!",  # Cannot be used for login
+                    role=UserRole.ADMIN,  # System user has admin role for internal operations
+                    full_name="CASS System",
+                    is_active=True,
+                    is_verified=True,
+                )
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.id)
+            )
+            if system_user_id is None:
+                system_user_id = (await self.db.execute(query)).scalar_one()
+            else:
+                logger.info(f"Created system user for tenant {tenant_id}: {system_user_id}")
 
-        self.db.add(system_user)
-        await self.db.flush()
-
-        self._system_user_cache[tenant_id] = system_user.id
-        logger.info(f"Created system user for tenant {tenant_id}: {system_user.id}")
-
-        return system_user.id
+        self._system_user_cache[tenant_id] = system_user_id
+        return system_user_id
 
     @staticmethod
     def verify_signature(payload: bytes, signature: str, timestamp: Optional[str] = None) -> bool:
@@ -137,18 +151,14 @@ class WebhookService:
             return True
 
         try:
-            # Build the message to sign
+            # Sign "<timestamp>.<body>" (or just the body) by feeding the raw
+            # bytes to OpenSSL's HMAC-SHA256, without decoding the body or
+            # copying it into a new message string
+            mac = hmac.new(_signing_key(settings.CSMS_WEBHOOK_SECRET), digestmod=hashlib.sha256)
             if timestamp:
-                message = f"{timestamp}.{payload.decode('utf-8')}"
-            else:
-                message = payload.decode("utf-8")
-
-            # Calculate expected signature
-            expected_signature = hmac.new(
-                settings.CSMS_WEBHOOK_SECRET.encode("utf-8"),
-                message.encode("utf-8"),
-                hashlib.sha256
-            ).hexdigest()
+                mac.update(timestamp.encode("utf-8") + b".")
+            mac.update(payload)
+            expected_signature = mac.hexdigest()
 
             # Compare signatures (timing-safe comparison)
             # Handle both raw hex and prefixed formats (e.g., "sha256=...")
@@ -481,3 +491,39 @@ class WebhookService:
 async def get_webhook_service(db: AsyncSession) -> WebhookService:
     """Dependency for getting webhook service."""
     return WebhookService(db)
+
+
+async def process_webhook_batch(
+    events: Sequence[CSMSWebhookPayload]
+) -> List[Union[WebhookResponse, Exception]]:
+    """
+    Process the events of a batch webhook concurrently.
+
+    Events are grouped by charger: groups run concurrently, up to
+    WEBHOOK_BATCH_CONCURRENCY at a time, each in its own session, while one
+    charger's events run in batch order so its state changes stay ordered.
+
+    Returns:
+        One outcome per event, in order: the WebhookResponse, or the
+        exception that event raised
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, event in enumerate(events):
+        groups.setdefault(event.csms_charger_id, []).append(index)
+
+    outcomes: List[Union[WebhookResponse, Exception]] = [None] * len(events)
+    semaphore = asyncio.Semaphore(WEBHOOK_BATCH_CONCURRENCY)
+
+    async def process_group(indexes: List[int]):
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                service = WebhookService(db)
+                for index in indexes:
+                    try:
+                        outcomes[index] = await service.process_generic_webhook(events[index])
+                    except Exception as e:
+                        await db.rollback()
+                        outcomes[index] = e
+
+    await asyncio.gather(*(process_group(indexes) for indexes in groups.values()))
+    return outcomes
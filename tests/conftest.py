@@ -18,7 +18,7 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_probe_engine
 from app.core.security import get_password_hash, create_access_token
 from app.main import app
 from app.models.user import User, UserRole
@@ -83,13 +83,14 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(async_engine, db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client with database override."""
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_probe_engine] = lambda: async_engine
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -98,6 +99,35 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+# -----------------------------------------------------------------------------
+# Test Doubles
+# -----------------------------------------------------------------------------
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio hash commands used."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hset(self, key, mapping):
+        self.hashes[key] = {
+            k.encode(): v if isinstance(v, bytes) else str(v).encode()
+            for k, v in mapping.items()
+        }
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.ttls.pop(key, None)
+
+
 # -----------------------------------------------------------------------------
 # Data Factories
 # -----------------------------------------------------------------------------
@@ -505,6 +535,7 @@ async def test_sla_policy(db_session: AsyncSession, test_tenant: Tenant) -> SlaP
 
 # Export factories for use in tests
 __all__ = [
+    "FakeRedis",
     "TenantFactory",
     "UserFactory",
     "SiteFactory",
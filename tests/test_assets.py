@@ -0,0 +1,230 @@
+"""
+Tests for Site and Charger Asset Endpoints
+
+Tests cover:
+- Listing sites and chargers with filters and keyset pagination
+- Retrieving charger details
+- Tenant isolation on asset endpoints
+"""
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.tenant import Tenant
+from app.models.asset import Site
+from app.models.user import UserRole
+from tests.conftest import TenantFactory, SiteFactory, ChargerFactory, UserFactory
+
+
+# -----------------------------------------------------------------------------
+# Site Listing Tests
+# -----------------------------------------------------------------------------
+
+class TestSiteListing:
+    """Tests for listing sites."""
+
+    @pytest.mark.asyncio
+    async def test_list_sites_ordered_by_name(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test sites are returned ordered by name."""
+        for name in ["Charlie", "Alpha", "Bravo"]:
+            await SiteFactory.create(db_session, tenant_id=test_tenant.id, name=name)
+
+        response = await client.get("/api/v1/assets/sites", headers=auth_headers_admin)
+
+        assert response.status_code == 200
+        assert [s["name"] for s in response.json()["items"]] == ["Alpha", "Bravo", "Charlie"]
+
+    @pytest.mark.asyncio
+    async def test_list_sites_filter_by_is_active(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test filtering sites by active flag."""
+        await SiteFactory.create(db_session, tenant_id=test_tenant.id, name="Active")
+        inactive = await SiteFactory.create(db_session, tenant_id=test_tenant.id, name="Inactive")
+        inactive.is_active = False
+        await db_session.commit()
+
+        response = await client.get(
+            "/api/v1/assets/sites?is_active=false",
+            headers=auth_headers_admin
+        )
+        assert [s["name"] for s in response.json()["items"]] == ["Inactive"]
+
+        response = await client.get(
+            "/api/v1/assets/sites?is_active=true",
+            headers=auth_headers_admin
+        )
+        assert [s["name"] for s in response.json()["items"]] == ["Active"]
+
+    @pytest.mark.asyncio
+    async def test_list_sites_keyset_pagination(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test paging through sites with the next_cursor."""
+        for i in range(5):
+            await SiteFactory.create(db_session, tenant_id=test_tenant.id, name=f"Site {i}")
+
+        names = []
+        params = {"limit": 2}
+        for _ in range(3):
+            response = await client.get(
+                "/api/v1/assets/sites",
+                params=params,
+                headers=auth_headers_admin
+            )
+            assert response.status_code == 200
+            data = response.json()
+            names.extend(s["name"] for s in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params = {"limit": 2, **data["next_cursor"]}
+
+        assert names == [f"Site {i}" for i in range(5)]
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_sites_cursor_ties_on_name(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test sites sharing a name are split across pages by id."""
+        for _ in range(3):
+            await SiteFactory.create(db_session, tenant_id=test_tenant.id, name="Same")
+
+        first = await client.get(
+            "/api/v1/assets/sites?limit=2",
+            headers=auth_headers_admin
+        )
+        cursor = first.json()["next_cursor"]
+        second = await client.get(
+            "/api/v1/assets/sites",
+            params={"limit": 2, **cursor},
+            headers=auth_headers_admin
+        )
+
+        first_ids = [s["id"] for s in first.json()["items"]]
+        second_ids = [s["id"] for s in second.json()["items"]]
+        assert len(first_ids) == 2
+        assert len(second_ids) == 1
+        assert not set(first_ids) & set(second_ids)
+
+    @pytest.mark.asyncio
+    async def test_list_sites_partial_cursor_rejected(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict
+    ):
+        """Test after_name without after_id is rejected."""
+        response = await client.get(
+            "/api/v1/assets/sites?after_name=Alpha",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_list_sites_tenant_isolation(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_site: Site
+    ):
+        """Test sites from other tenants are not listed."""
+        other_tenant = await TenantFactory.create(db_session, name="Other Tenant")
+        await SiteFactory.create(db_session, tenant_id=other_tenant.id, name="Other Site")
+
+        response = await client.get("/api/v1/assets/sites", headers=auth_headers_admin)
+
+        assert response.status_code == 200
+        assert [s["id"] for s in response.json()["items"]] == [test_site.id]
+
+
+    @pytest.mark.asyncio
+    async def test_list_sites_alternating_tenants(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_site: Site
+    ):
+        """Test the cached statement is scoped to each caller's tenant."""
+        other_tenant = await TenantFactory.create(db_session, name="Other Tenant")
+        other_site = await SiteFactory.create(db_session, tenant_id=other_tenant.id, name="Other Site")
+        other_user = await UserFactory.create(db_session, tenant_id=other_tenant.id, role=UserRole.ADMIN)
+        other_headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': other_user.id})}"
+        }
+
+        for headers, expected_id in [
+            (auth_headers_admin, test_site.id),
+            (other_headers, other_site.id),
+            (auth_headers_admin, test_site.id),
+        ]:
+            response = await client.get("/api/v1/assets/sites", headers=headers)
+            assert [s["id"] for s in response.json()["items"]] == [expected_id]
+
+
+# -----------------------------------------------------------------------------
+# Charger Tests
+# -----------------------------------------------------------------------------
+
+class TestChargers:
+    """Tests for listing and retrieving chargers."""
+
+    @pytest.mark.asyncio
+    async def test_list_chargers_filter_by_site(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant,
+        test_site: Site
+    ):
+        """Test filtering chargers by site."""
+        other_site = await SiteFactory.create(db_session, tenant_id=test_tenant.id, name="Other")
+        await ChargerFactory.create(db_session, tenant_id=test_tenant.id, site_id=test_site.id, name="C1")
+        await ChargerFactory.create(db_session, tenant_id=test_tenant.id, site_id=other_site.id, name="C2")
+
+        response = await client.get(
+            f"/api/v1/assets/chargers?site_id={test_site.id}",
+            headers=auth_headers_admin
+        )
+        assert [c["name"] for c in response.json()["items"]] == ["C1"]
+
+        response = await client.get("/api/v1/assets/chargers", headers=auth_headers_admin)
+        assert [c["name"] for c in response.json()["items"]] == ["C1", "C2"]
+
+    @pytest.mark.asyncio
+    async def test_get_charger_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict
+    ):
+        """Test retrieving an unknown charger."""
+        response = await client.get(
+            f"/api/v1/assets/chargers/{uuid.uuid4()}",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
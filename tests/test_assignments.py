@@ -0,0 +1,179 @@
+"""
+Tests for Ticket Assignment Endpoints
+
+Tests cover:
+- Assigning tickets to users and vendors
+- Tenant scoping of the assignment insert
+- Publishing the assignment event
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1 import assignments
+from app.models.assignment import Assignment
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.services import event_publisher as event_publisher_module
+from app.services.event_publisher import AssignmentEventQueue, EventPublisher
+from tests.conftest import TenantFactory, SiteFactory, TicketFactory
+
+
+# -----------------------------------------------------------------------------
+# Assignment Tests
+# -----------------------------------------------------------------------------
+
+class TestAssignTicket:
+    """Tests for assigning tickets."""
+
+    @pytest.mark.asyncio
+    async def test_assign_to_user(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_ticket: Ticket,
+        admin_user: User,
+        engineer_user: User
+    ):
+        """Test assigning a ticket to an internal user."""
+        response = await client.post(
+            f"/api/v1/assignments/tickets/{test_ticket.id}/assign",
+            json={
+                "assignee_type": "user",
+                "assignee_user_id": engineer_user.id,
+                "due_at": "2026-01-15T09:00:00",
+                "notes": "Replace connector"
+            },
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["id"]
+        assert data["ticket_id"] == test_ticket.id
+        assert data["assignee_type"] == "user"
+        assert data["assignee_user_id"] == engineer_user.id
+        assert data["assigned_by"] == admin_user.id
+        assert data["due_at"] == "2026-01-15T09:00:00"
+        assert data["assigned_at"]
+
+    @pytest.mark.asyncio
+    async def test_assign_to_vendor(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_ticket: Ticket
+    ):
+        """Test assigning a ticket to an external vendor."""
+        response = await client.post(
+            f"/api/v1/assignments/tickets/{test_ticket.id}/assign",
+            json={
+                "assignee_type": "vendor",
+                "assignee_vendor_name": "ACME Field Service",
+                "assignee_vendor_contact": "dispatch@acme.test"
+            },
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["assignee_type"] == "vendor"
+        assert data["assignee_vendor_name"] == "ACME Field Service"
+        assert data["assignee_user_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_assign_unknown_ticket(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict
+    ):
+        """Test assigning an unknown ticket returns 404 and inserts nothing."""
+        response = await client.post(
+            "/api/v1/assignments/tickets/unknown/assign",
+            json={"assignee_type": "vendor", "assignee_vendor_name": "ACME"},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
+        assert await db_session.scalar(select(func.count()).select_from(Assignment)) == 0
+
+    @pytest.mark.asyncio
+    async def test_assign_other_tenant_ticket(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        admin_user: User
+    ):
+        """Test tickets of another tenant cannot be assigned."""
+        other_tenant = await TenantFactory.create(db_session, name="Other Tenant")
+        other_site = await SiteFactory.create(db_session, tenant_id=other_tenant.id)
+        other_ticket = await TicketFactory.create(
+            db_session,
+            tenant_id=other_tenant.id,
+            site_id=other_site.id,
+            created_by=admin_user.id
+        )
+
+        response = await client.post(
+            f"/api/v1/assignments/tickets/{other_ticket.id}/assign",
+            json={"assignee_type": "vendor", "assignee_vendor_name": "ACME"},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
+        assert await db_session.scalar(select(func.count()).select_from(Assignment)) == 0
+
+    @pytest.mark.asyncio
+    async def test_assignment_event_published(
+        self,
+        client: AsyncClient,
+        async_engine,
+        auth_headers_admin: dict,
+        test_ticket: Ticket,
+        monkeypatch
+    ):
+        """Test the queued assignment event is published with the loaded ticket."""
+        published = []
+
+        async def fake_publish(assignment, ticket, assigned_by_user_id=None):
+            published.append((assignment.id, ticket.id))
+
+        queue = AssignmentEventQueue()
+        monkeypatch.setattr(assignments, "assignment_event_queue", queue)
+        monkeypatch.setattr(
+            event_publisher_module, "AsyncSessionLocal", async_sessionmaker(async_engine)
+        )
+        monkeypatch.setattr(EventPublisher, "publish_assignment", staticmethod(fake_publish))
+
+        queue.start()
+        try:
+            response = await client.post(
+                f"/api/v1/assignments/tickets/{test_ticket.id}/assign",
+                json={"assignee_type": "vendor", "assignee_vendor_name": "ACME"},
+                headers=auth_headers_admin
+            )
+            await queue.join()
+        finally:
+            await queue.stop()
+
+        assert response.status_code == 201
+        assert published == [(response.json()["id"], test_ticket.id)]
+
+
+# -----------------------------------------------------------------------------
+# Assignment Event Queue Tests
+# -----------------------------------------------------------------------------
+
+class TestAssignmentEventQueue:
+    """Tests for the assignment event queue."""
+
+    def test_enqueue_drops_when_full(self):
+        """Test events are dropped instead of blocking when the queue is full."""
+        queue = AssignmentEventQueue(maxsize=1)
+
+        assert queue.enqueue(Assignment(id="a1"), "t1") is True
+        assert queue.enqueue(Assignment(id="a2"), "t2") is False
+        assert queue.get_stats()["queued"] == 1
@@ -0,0 +1,183 @@
+"""
+Tests for Ticket Attachments
+
+Tests cover:
+- Registering attachment metadata
+- Listing attachments for a ticket
+- Tenant isolation on attachment endpoints
+"""
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attachment import Attachment
+from app.models.ticket import Ticket
+from app.models.user import User
+from tests.conftest import TenantFactory, SiteFactory, UserFactory, TicketFactory
+
+
+async def create_attachment(
+    db: AsyncSession,
+    ticket: Ticket,
+    created_by: str,
+    file_name: str = "photo.jpg"
+) -> Attachment:
+    attachment = Attachment(
+        id=str(uuid.uuid4()),
+        tenant_id=ticket.tenant_id,
+        ticket_id=ticket.id,
+        file_name=file_name,
+        mime_type="image/jpeg",
+        file_size=1024,
+        storage_key=f"attachments/{ticket.tenant_id}/{file_name}",
+        created_by=created_by
+    )
+    db.add(attachment)
+    await db.commit()
+    await db.refresh(attachment)
+    return attachment
+
+
+# -----------------------------------------------------------------------------
+# Attachment Registration Tests
+# -----------------------------------------------------------------------------
+
+class TestAttachmentCreation:
+    """Tests for registering attachment metadata."""
+
+    @pytest.mark.asyncio
+    async def test_create_attachment_success(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_ticket: Ticket,
+        admin_user: User
+    ):
+        """Test registering an uploaded file against a ticket."""
+        payload = {
+            "file_name": "fault.jpg",
+            "mime_type": "image/jpeg",
+            "file_size": 2048,
+            "storage_key": "attachments/test/fault.jpg"
+        }
+
+        response = await client.post(
+            f"/api/v1/attachments/tickets/{test_ticket.id}/attachments",
+            json=payload,
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["ticket_id"] == test_ticket.id
+        assert data["file_name"] == "fault.jpg"
+        assert data["created_by"] == admin_user.id
+
+    @pytest.mark.asyncio
+    async def test_create_attachment_ticket_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict
+    ):
+        """Test registering an attachment against an unknown ticket."""
+        payload = {
+            "file_name": "fault.jpg",
+            "storage_key": "attachments/test/fault.jpg"
+        }
+
+        response = await client.post(
+            f"/api/v1/attachments/tickets/{uuid.uuid4()}/attachments",
+            json=payload,
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
+
+
+# -----------------------------------------------------------------------------
+# Attachment Listing Tests
+# -----------------------------------------------------------------------------
+
+class TestAttachmentListing:
+    """Tests for listing ticket attachments."""
+
+    @pytest.mark.asyncio
+    async def test_list_attachments(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_ticket: Ticket,
+        admin_user: User
+    ):
+        """Test listing returns every attachment on the ticket."""
+        for name in ["a.jpg", "b.jpg", "c.jpg"]:
+            await create_attachment(db_session, test_ticket, admin_user.id, file_name=name)
+
+        response = await client.get(
+            f"/api/v1/attachments/tickets/{test_ticket.id}/attachments",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert {a["file_name"] for a in data} == {"a.jpg", "b.jpg", "c.jpg"}
+
+    @pytest.mark.asyncio
+    async def test_list_attachments_empty(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_ticket: Ticket
+    ):
+        """Test a ticket without attachments returns an empty list, not 404."""
+        response = await client.get(
+            f"/api/v1/attachments/tickets/{test_ticket.id}/attachments",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_list_attachments_ticket_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict
+    ):
+        """Test listing attachments for an unknown ticket."""
+        response = await client.get(
+            f"/api/v1/attachments/tickets/{uuid.uuid4()}/attachments",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_list_attachments_tenant_isolation(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict
+    ):
+        """Test attachments on another tenant's ticket are not visible."""
+        other_tenant = await TenantFactory.create(db_session, name="Other Tenant")
+        other_site = await SiteFactory.create(db_session, tenant_id=other_tenant.id)
+        other_user = await UserFactory.create(db_session, tenant_id=other_tenant.id)
+        other_ticket = await TicketFactory.create(
+            db_session,
+            tenant_id=other_tenant.id,
+            site_id=other_site.id,
+            created_by=other_user.id
+        )
+        await create_attachment(db_session, other_ticket, other_user.id)
+
+        response = await client.get(
+            f"/api/v1/attachments/tickets/{other_ticket.id}/attachments",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
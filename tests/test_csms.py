@@ -0,0 +1,279 @@
+"""
+Tests for CSMS Integration Endpoints
+
+Tests cover:
+- Streaming charger events from CSMS as NDJSON
+- Single and bulk firmware job request creation
+"""
+import json
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.asset import Charger, Site
+from app.models.csms import FirmwareJobRef
+from app.models.tenant import Tenant
+from app.models.ticket import Ticket
+from app.main import app
+from app.api.v1.csms import get_csms_client
+from tests.conftest import ChargerFactory, SiteFactory, TenantFactory
+
+
+def override_csms(handler):
+    """Route CSMS calls through an in-process mock transport."""
+    mock_client = httpx.AsyncClient(
+        base_url="http://csms.test",
+        transport=httpx.MockTransport(handler)
+    )
+    app.dependency_overrides[get_csms_client] = lambda: mock_client
+    return mock_client
+
+
+# -----------------------------------------------------------------------------
+# Charger Event Tests
+# -----------------------------------------------------------------------------
+
+class TestChargerEvents:
+    """Tests for streaming charger events from CSMS."""
+
+    @pytest.mark.asyncio
+    async def test_events_streamed_as_ndjson(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_charger: Charger
+    ):
+        """Test each CSMS event is emitted as one JSON line."""
+        events = [
+            {
+                "event_id": f"EV-{i}",
+                "event_type": "StatusNotification",
+                "timestamp": "2025-01-01T00:00:00",
+                "data": {"connector": i, "power": 7.4}
+            }
+            for i in range(3)
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == f"/chargers/{test_charger.csms_charger_id}/events"
+            assert request.url.params["from"] == "2025-01-01T00:00:00"
+            return httpx.Response(200, json={"events": events})
+
+        override_csms(handler)
+        response = await client.get(
+            f"/api/v1/csms/chargers/{test_charger.id}/events?from_date=2025-01-01T00:00:00",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["event_id"] for line in lines] == ["EV-0", "EV-1", "EV-2"]
+        assert lines[0]["data"] == {"connector": 0, "power": 7.4}
+
+    @pytest.mark.asyncio
+    async def test_events_stream_cut_short_ends_with_error_line(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_charger: Charger
+    ):
+        """Test a CSMS body that breaks mid-array ends the stream with an error line."""
+        body = (
+            b'{"events": [{"event_id": "EV-0", "event_type": "StatusNotification", '
+            b'"timestamp": "2025-01-01T00:00:00", "data": {}}, {"event_id": '
+        )
+        override_csms(lambda request: httpx.Response(200, content=body))
+
+        response = await client.get(
+            f"/api/v1/csms/chargers/{test_charger.id}/events",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["event_id"] == "EV-0"
+        assert lines[-1] == {"error": "CSMS event stream aborted"}
+
+    @pytest.mark.asyncio
+    async def test_events_csms_error(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_charger: Charger
+    ):
+        """Test a CSMS error status maps to 502 before streaming."""
+        override_csms(lambda request: httpx.Response(503))
+
+        response = await client.get(
+            f"/api/v1/csms/chargers/{test_charger.id}/events",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 502
+
+    @pytest.mark.asyncio
+    async def test_events_charger_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict
+    ):
+        """Test events for an unknown charger."""
+        override_csms(lambda request: httpx.Response(200, json={"events": []}))
+
+        response = await client.get(
+            "/api/v1/csms/chargers/unknown/events",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
+
+
+# -----------------------------------------------------------------------------
+# Firmware Job Tests
+# -----------------------------------------------------------------------------
+
+class TestFirmwareJobs:
+    """Tests for firmware job request creation."""
+
+    @pytest.mark.asyncio
+    async def test_create_firmware_job(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_ticket: Ticket,
+        test_charger: Charger
+    ):
+        """Test creating a single firmware job reference."""
+        response = await client.post(
+            f"/api/v1/csms/tickets/{test_ticket.id}/firmware-jobs",
+            json={
+                "charger_id": test_charger.id,
+                "csms_job_id": "JOB-1",
+                "target_version": "2.0.0"
+            },
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["ticket_id"] == test_ticket.id
+        assert data["last_status"] == "requested"
+
+    @pytest.mark.asyncio
+    async def test_create_firmware_jobs_bulk(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant,
+        test_site: Site,
+        test_ticket: Ticket
+    ):
+        """Test creating firmware job references in bulk."""
+        chargers = [
+            await ChargerFactory.create(
+                db_session, tenant_id=test_tenant.id, site_id=test_site.id, name=f"C{i}"
+            )
+            for i in range(3)
+        ]
+
+        response = await client.post(
+            f"/api/v1/csms/tickets/{test_ticket.id}/firmware-jobs/bulk",
+            json=[
+                {
+                    "charger_id": charger.id,
+                    "csms_job_id": f"JOB-{i}",
+                    "target_version": "2.0.0",
+                    "current_version": "1.0.0"
+                }
+                for i, charger in enumerate(chargers)
+            ],
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [job["csms_job_id"] for job in data] == ["JOB-0", "JOB-1", "JOB-2"]
+        assert all(job["ticket_id"] == test_ticket.id for job in data)
+        assert all(job["last_status"] == "requested" for job in data)
+        assert all(job["id"] for job in data)
+
+        count = await db_session.scalar(
+            select(func.count()).select_from(FirmwareJobRef).where(
+                FirmwareJobRef.ticket_id == test_ticket.id
+            )
+        )
+        assert count == 3
+
+    @pytest.mark.asyncio
+    async def test_create_firmware_jobs_bulk_empty(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_ticket: Ticket
+    ):
+        """Test an empty bulk payload is rejected."""
+        response = await client.post(
+            f"/api/v1/csms/tickets/{test_ticket.id}/firmware-jobs/bulk",
+            json=[],
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_create_firmware_jobs_unknown_ticket(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_charger: Charger
+    ):
+        """Test firmware jobs cannot be attached to an unknown ticket."""
+        job = {"charger_id": test_charger.id, "csms_job_id": "JOB-1"}
+
+        response = await client.post(
+            "/api/v1/csms/tickets/unknown/firmware-jobs",
+            json=job,
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 404
+
+        response = await client.post(
+            "/api/v1/csms/tickets/unknown/firmware-jobs/bulk",
+            json=[job],
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_create_firmware_jobs_bulk_other_tenant_charger(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_ticket: Ticket,
+        test_charger: Charger
+    ):
+        """Test bulk jobs referencing another tenant's charger are rejected."""
+        other_tenant = await TenantFactory.create(db_session, name="Other Tenant")
+        other_site = await SiteFactory.create(db_session, tenant_id=other_tenant.id)
+        other_charger = await ChargerFactory.create(
+            db_session, tenant_id=other_tenant.id, site_id=other_site.id
+        )
+
+        response = await client.post(
+            f"/api/v1/csms/tickets/{test_ticket.id}/firmware-jobs/bulk",
+            json=[
+                {"charger_id": test_charger.id, "csms_job_id": "JOB-1"},
+                {"charger_id": other_charger.id, "csms_job_id": "JOB-2"}
+            ],
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 404
+        count = await db_session.scalar(select(func.count()).select_from(FirmwareJobRef))
+        assert count == 0
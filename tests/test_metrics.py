@@ -0,0 +1,359 @@
+"""
+Tests for Monitoring Endpoints
+
+Tests cover:
+- Prometheus payload caching
+- JSON statistics summary
+- Health, readiness and liveness probes
+- Application info
+- Redis response cache hit/miss/stale behaviour
+- Gzip compression of large responses
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.responses import ORJSONResponse
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.v1 import metrics
+from app.core.config import settings
+from app.core.database import get_probe_engine
+from app.core.response_cache import ResponseCache
+from app.main import app
+from tests.conftest import FakeRedis
+
+
+# -----------------------------------------------------------------------------
+# Prometheus Tests
+# -----------------------------------------------------------------------------
+
+class TestPrometheusMetrics:
+    """Tests for the Prometheus scrape endpoint."""
+
+    @pytest.fixture
+    def render_calls(self, monkeypatch):
+        """Count registry renders and reset the payload cache."""
+        calls = []
+
+        def fake_render():
+            calls.append(1)
+            yield b"cass_renders "
+            yield f"{len(calls)}\n".encode()
+
+        monkeypatch.setattr(metrics.metrics_collector, "iter_prometheus_metrics", fake_render)
+        monkeypatch.setattr(
+            metrics, "_prometheus_cache", {"body": None, "content_type": None, "ts": 0.0}
+        )
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_payload_reused_within_ttl(
+        self,
+        client: AsyncClient,
+        render_calls: list,
+        monkeypatch
+    ):
+        """Test scrapes within the TTL reuse one rendered payload."""
+        monkeypatch.setattr(settings, "METRICS_CACHE_TTL", 60.0)
+
+        first = await client.get("/api/v1/metrics")
+        second = await client.get("/api/v1/metrics")
+
+        assert first.status_code == 200
+        assert first.text == second.text == "cass_renders 1\n"
+        assert len(render_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_cache_renders_shortly_after_boot(
+        self,
+        client: AsyncClient,
+        render_calls: list,
+        monkeypatch
+    ):
+        """Test the first scrape renders even when the monotonic clock is below the TTL."""
+        monkeypatch.setattr(metrics, "time", SimpleNamespace(monotonic=lambda: 1.0))
+        monkeypatch.setattr(settings, "METRICS_CACHE_TTL", 5.0)
+
+        response = await client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        assert response.text == "cass_renders 1\n"
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(
+        self,
+        client: AsyncClient,
+        render_calls: list,
+        monkeypatch
+    ):
+        """Test a TTL of 0 streams a fresh render on every scrape."""
+        monkeypatch.setattr(settings, "METRICS_CACHE_TTL", 0)
+
+        await client.get("/api/v1/metrics")
+        response = await client.get("/api/v1/metrics")
+
+        assert response.text == "cass_renders 2\n"
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["cache-control"] == "no-cache, no-store, must-revalidate"
+        assert "content-length" not in response.headers
+        assert len(render_calls) == 2
+
+
+# -----------------------------------------------------------------------------
+# Statistics Tests
+# -----------------------------------------------------------------------------
+
+class TestStatsSummary:
+    """Tests for the JSON statistics summary."""
+
+    @pytest.mark.asyncio
+    async def test_stats_summary(self, client: AsyncClient):
+        """Test the stats summary is served as JSON with string status keys."""
+        await client.get("/api/v1/metrics/live")
+
+        response = await client.get("/api/v1/metrics/stats")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["requests"]["total"] >= 1
+        assert "200" in data["requests"]["by_status_code"]
+
+
+# -----------------------------------------------------------------------------
+# Probe Tests
+# -----------------------------------------------------------------------------
+
+class TestProbes:
+    """Tests for health, readiness and liveness probes."""
+
+    @pytest.mark.asyncio
+    async def test_health_details(self, client: AsyncClient):
+        """Test detailed health reports database connectivity."""
+        response = await client.get("/api/v1/metrics/health")
+
+        assert response.status_code in (200, 503)
+        assert response.json()["database"]["connection"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_readiness(self, client: AsyncClient):
+        """Test readiness probe with a reachable database."""
+        response = await client.get("/api/v1/metrics/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+
+    @pytest.mark.asyncio
+    async def test_readiness_database_down(self, client: AsyncClient):
+        """Test readiness probe reports 503 when the probe pool cannot connect."""
+        broken_engine = create_async_engine("sqlite+aiosqlite:////nonexistent/dir/db.sqlite")
+        app.dependency_overrides[get_probe_engine] = lambda: broken_engine
+
+        try:
+            response = await client.get("/api/v1/metrics/ready")
+        finally:
+            await broken_engine.dispose()
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
+
+    @pytest.mark.asyncio
+    async def test_liveness(self, client: AsyncClient):
+        """Test liveness probe."""
+        response = await client.get("/api/v1/metrics/live")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"status": "alive"}
+
+        response = await client.post("/api/v1/metrics/live")
+        assert response.status_code == 405
+
+    @pytest.mark.asyncio
+    async def test_app_info(self, client: AsyncClient):
+        """Test application info."""
+        response = await client.get("/api/v1/metrics/info")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "version" in data
+        assert "prometheus_metrics" in data["features"]
+
+
+# -----------------------------------------------------------------------------
+# Response Cache Tests
+# -----------------------------------------------------------------------------
+
+class TestResponseCache:
+    """Tests for the Redis-backed response cache."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self):
+        """Test the first call computes and the second is served from cache."""
+        cache = ResponseCache(client=FakeRedis())
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return ORJSONResponse(content={"value": len(calls)})
+
+        first = await cache.get_or_compute("k", compute, min_ttl=5, max_ttl=10)
+        second = await cache.get_or_compute("k", compute, min_ttl=5, max_ttl=10)
+
+        assert first.headers["X-Cache"] == "miss"
+        assert second.headers["X-Cache"] == "hit"
+        assert second.body == b'{"value":1}'
+        assert second.media_type == "application/json"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_served_when_compute_fails(self):
+        """Test the last good payload is served stale when compute raises."""
+        redis = FakeRedis()
+        cache = ResponseCache(client=redis, stale_seconds=60)
+
+        async def good():
+            return ORJSONResponse(content={"ok": True})
+
+        async def broken():
+            raise RuntimeError("collector down")
+
+        await cache.get_or_compute("k", good, min_ttl=1, max_ttl=1)
+        assert redis.ttls["cass:response-cache:k"] == 61
+        redis.hashes["cass:response-cache:k"][b"fresh_until"] = b"0"
+
+        response = await cache.get_or_compute("k", broken, min_ttl=1, max_ttl=1)
+
+        assert response.headers["X-Cache"] == "stale"
+        assert response.body == b'{"ok":true}'
+
+    @pytest.mark.asyncio
+    async def test_error_without_cached_entry_propagates(self):
+        """Test compute errors propagate when there is nothing to fall back to."""
+        cache = ResponseCache(client=FakeRedis())
+
+        async def broken():
+            raise RuntimeError("collector down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("k", broken, min_ttl=1, max_ttl=1)
+
+    @pytest.mark.asyncio
+    async def test_server_errors_not_cached(self):
+        """Test 5xx responses are returned but not stored."""
+        redis = FakeRedis()
+        cache = ResponseCache(client=redis)
+
+        async def unavailable():
+            return ORJSONResponse(content={"status": "unhealthy"}, status_code=503)
+
+        response = await cache.get_or_compute("k", unavailable, min_ttl=1, max_ttl=1)
+
+        assert response.status_code == 503
+        assert redis.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_without_redis_always_computes(self):
+        """Test the cache is a pass-through when Redis is not configured."""
+        cache = ResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return ORJSONResponse(content={})
+
+        await cache.get_or_compute("k", compute, min_ttl=5, max_ttl=5)
+        await cache.get_or_compute("k", compute, min_ttl=5, max_ttl=5)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_json_value_miss_then_hit(self):
+        """Test JSON values are returned as computed on a miss and decoded on a hit."""
+        cache = ResponseCache(client=FakeRedis())
+        value = [{"total": 3, "by_status": {"new": 3}}]
+
+        async def compute():
+            return value
+
+        first = await cache.get_or_compute_json("k", compute, min_ttl=5, max_ttl=5)
+        second = await cache.get_or_compute_json("k", compute, min_ttl=5, max_ttl=5)
+
+        assert first is value
+        assert second == value and second is not value
+
+    @pytest.mark.asyncio
+    async def test_json_value_without_redis_not_encoded(self):
+        """Test the JSON value is passed through untouched when Redis is not configured."""
+        value = {"total": 1}
+
+        async def compute():
+            return value
+
+        assert await ResponseCache().get_or_compute_json("k", compute, min_ttl=5, max_ttl=5) is value
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_back_off(self):
+        """Test Redis is bypassed for the backoff window after an error."""
+
+        class BrokenRedis(FakeRedis):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            async def hgetall(self, key):
+                self.calls += 1
+                raise ConnectionError("redis down")
+
+        redis = BrokenRedis()
+        cache = ResponseCache(client=redis, backoff_seconds=60)
+
+        async def compute():
+            return ORJSONResponse(content={})
+
+        first = await cache.get_or_compute("k", compute, min_ttl=5, max_ttl=5)
+        await cache.get_or_compute("k", compute, min_ttl=5, max_ttl=5)
+
+        assert first.headers["X-Cache"] == "miss"
+        assert redis.calls == 1
+        assert redis.hashes == {}
+
+
+# -----------------------------------------------------------------------------
+# Compression Tests
+# -----------------------------------------------------------------------------
+
+class TestCompression:
+    """Tests for gzip compression of large responses."""
+
+    @pytest.fixture
+    def large_payload(self, monkeypatch):
+        """Render a Prometheus payload above the compression threshold."""
+        body = b"cass_http_requests_total 1\n" * 200
+
+        def fake_render():
+            yield body
+
+        monkeypatch.setattr(metrics.metrics_collector, "iter_prometheus_metrics", fake_render)
+        monkeypatch.setattr(settings, "METRICS_CACHE_TTL", 0)
+        return body
+
+    @pytest.mark.asyncio
+    async def test_large_response_gzipped(self, client: AsyncClient, large_payload: bytes):
+        """Test responses above the threshold are gzip-encoded."""
+        response = await client.get("/api/v1/metrics", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == large_payload
+
+    @pytest.mark.asyncio
+    async def test_event_stream_not_gzipped(self, client: AsyncClient, large_payload: bytes):
+        """Test requests accepting an event stream are passed through uncompressed."""
+        response = await client.get(
+            "/api/v1/metrics",
+            headers={"Accept-Encoding": "gzip", "Accept": "text/event-stream"}
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.content == large_payload
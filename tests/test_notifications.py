@@ -0,0 +1,530 @@
+"""
+Tests for Notification Log Endpoints
+
+Tests cover:
+- Listing notification logs with enum filters
+- Retrieving a single notification log
+- Notification system status
+- User preference and tenant setting upserts
+- Resending failed notifications in the background
+- Statistics served from per-tenant daily counters
+- Logging of test notifications
+- Storage of enum columns as smallint codes
+- Monthly partition maintenance for notification logs
+"""
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1 import notifications as notifications_api
+from app.jobs.notification_partitions import partition_ddl, partition_months
+from app.models.notification import (
+    NotificationChannel,
+    NotificationEventType,
+    NotificationLog,
+    NotificationStatus,
+)
+from app.models.tenant import Tenant
+from app.schemas.notification import NotificationStatusResponse
+from app.services import notification_service as notification_service_module
+from app.services.notification_service import NotificationService
+
+
+async def create_logs(db: AsyncSession, tenant_id: str):
+    """Create a sent email log and a failed SMS log."""
+    service = NotificationService(db)
+    await service.log_notifications([
+        service.build_log_entry(
+            tenant_id=tenant_id,
+            event_type=NotificationEventType.TICKET_CREATED,
+            channel=NotificationChannel.EMAIL,
+            status=NotificationStatus.SENT,
+            recipient_email="ops@test.com"
+        ),
+        service.build_log_entry(
+            tenant_id=tenant_id,
+            event_type=NotificationEventType.SLA_BREACH,
+            channel=NotificationChannel.SMS,
+            status=NotificationStatus.FAILED,
+            recipient_phone="+15550000000",
+            error_message="Provider unavailable"
+        ),
+    ])
+
+
+# -----------------------------------------------------------------------------
+# Notification Log Tests
+# -----------------------------------------------------------------------------
+
+class TestNotificationLogs:
+    """Tests for listing and retrieving notification logs."""
+
+    @pytest.mark.asyncio
+    async def test_list_logs(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test listing all logs for the tenant."""
+        await create_logs(db_session, test_tenant.id)
+
+        response = await client.get("/api/v1/notifications/logs", headers=auth_headers_admin)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert {log["status"] for log in data["logs"]} == {"sent", "failed"}
+
+    @pytest.mark.asyncio
+    async def test_list_logs_filter_by_enums(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test filtering logs by status, channel and event type."""
+        await create_logs(db_session, test_tenant.id)
+
+        for params in (
+            {"status": "failed"},
+            {"channel": "sms"},
+            {"event_type": "sla_breach"},
+        ):
+            response = await client.get(
+                "/api/v1/notifications/logs",
+                params=params,
+                headers=auth_headers_admin
+            )
+            data = response.json()
+            assert data["total"] == 1
+            assert data["logs"][0]["event_type"] == "sla_breach"
+            assert data["logs"][0]["channel"] == "sms"
+            assert data["logs"][0]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_list_logs_total_across_pages(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test the total covers all matching logs, including past the last page."""
+        await create_logs(db_session, test_tenant.id)
+
+        first_page = await client.get(
+            "/api/v1/notifications/logs",
+            params={"limit": 1},
+            headers=auth_headers_admin
+        )
+        past_end = await client.get(
+            "/api/v1/notifications/logs",
+            params={"skip": 5},
+            headers=auth_headers_admin
+        )
+
+        assert first_page.json()["total"] == 2
+        assert len(first_page.json()["logs"]) == 1
+        assert past_end.json()["total"] == 2
+        assert past_end.json()["logs"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_log(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test retrieving a single log entry."""
+        await create_logs(db_session, test_tenant.id)
+        listing = await client.get(
+            "/api/v1/notifications/logs?status=sent",
+            headers=auth_headers_admin
+        )
+        log_id = listing.json()["logs"][0]["id"]
+
+        response = await client.get(
+            f"/api/v1/notifications/logs/{log_id}",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        assert response.json()["event_type"] == "ticket_created"
+
+    @pytest.mark.asyncio
+    async def test_enum_columns_stored_as_codes(
+        self,
+        db_session: AsyncSession,
+        test_tenant: Tenant
+    ):
+        """Test enum columns hold 1-based smallint codes."""
+        await create_logs(db_session, test_tenant.id)
+
+        result = await db_session.execute(
+            text("SELECT event_type, channel, status FROM notification_logs ORDER BY event_type")
+        )
+
+        assert result.all() == [(1, 1, 2), (5, 2, 4)]
+
+
+# -----------------------------------------------------------------------------
+# Notification Status Tests
+# -----------------------------------------------------------------------------
+
+class TestNotificationStatus:
+    """Tests for the notification system status."""
+
+    @pytest.mark.asyncio
+    async def test_status(self, client: AsyncClient, auth_headers_viewer: dict):
+        """Test the pre-serialized status payload matches the response schema."""
+        response = await client.get(
+            "/api/v1/notifications/status",
+            headers=auth_headers_viewer
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        NotificationStatusResponse.model_validate(response.json())
+
+    @pytest.mark.asyncio
+    async def test_status_requires_auth(self, client: AsyncClient):
+        """Test the status endpoint still requires authentication."""
+        response = await client.get("/api/v1/notifications/status")
+
+        assert response.status_code in (401, 403)
+
+
+# -----------------------------------------------------------------------------
+# Preference and Settings Tests
+# -----------------------------------------------------------------------------
+
+class TestNotificationPreferences:
+    """Tests for user preferences and tenant settings."""
+
+    @pytest.mark.asyncio
+    async def test_get_preferences_creates_defaults_once(
+        self,
+        client: AsyncClient,
+        auth_headers_engineer: dict
+    ):
+        """Test default preferences are created on first read and reused after."""
+        first = await client.get("/api/v1/notifications/preferences", headers=auth_headers_engineer)
+        second = await client.get("/api/v1/notifications/preferences", headers=auth_headers_engineer)
+
+        assert first.status_code == 200
+        assert first.json()["id"] == second.json()["id"]
+        assert first.json()["email_enabled"] is True
+
+    @pytest.mark.asyncio
+    async def test_update_preferences_upserts(
+        self,
+        client: AsyncClient,
+        auth_headers_engineer: dict
+    ):
+        """Test partial updates create the row and keep earlier changes."""
+        response = await client.patch(
+            "/api/v1/notifications/preferences",
+            json={"sms_enabled": False},
+            headers=auth_headers_engineer
+        )
+        assert response.status_code == 200
+        assert response.json()["sms_enabled"] is False
+        assert response.json()["email_enabled"] is True
+
+        response = await client.patch(
+            "/api/v1/notifications/preferences",
+            json={"email_enabled": False},
+            headers=auth_headers_engineer
+        )
+        data = response.json()
+        assert data["sms_enabled"] is False
+        assert data["email_enabled"] is False
+
+        response = await client.get("/api/v1/notifications/preferences", headers=auth_headers_engineer)
+        assert response.json()["id"] == data["id"]
+        assert response.json()["email_enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_update_tenant_settings_upserts(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test tenant settings are created by the first update and then read back."""
+        response = await client.patch(
+            "/api/v1/notifications/settings/tenant",
+            json={"max_notifications_per_hour": 25},
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 200
+        assert response.json()["tenant_id"] == test_tenant.id
+        assert response.json()["max_notifications_per_hour"] == 25
+
+        response = await client.get("/api/v1/notifications/settings/tenant", headers=auth_headers_admin)
+        assert response.json()["max_notifications_per_hour"] == 25
+
+
+# -----------------------------------------------------------------------------
+# Notification Statistics Tests
+# -----------------------------------------------------------------------------
+
+class TestNotificationStatistics:
+    """Tests for notification statistics."""
+
+    @pytest.mark.asyncio
+    async def test_statistics_counts(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test statistics aggregate logs by status, channel and event type."""
+        await create_logs(db_session, test_tenant.id)
+
+        response = await client.get(
+            "/api/v1/notifications/statistics",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_notifications"] == 2
+        assert data["by_status"]["sent"] == 1
+        assert data["by_status"]["failed"] == 1
+        assert data["by_status"]["pending"] == 0
+        assert data["by_channel"] == {"email": 1, "sms": 1, "in_app": 0}
+        assert data["by_event_type"]["sla_breach"] == 1
+        assert data["by_event_type"]["worklog_added"] == 0
+        assert data["success_rate_percentage"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_statistics_requires_admin(
+        self,
+        client: AsyncClient,
+        auth_headers_viewer: dict
+    ):
+        """Test non-admin users cannot view statistics."""
+        response = await client.get(
+            "/api/v1/notifications/statistics",
+            headers=auth_headers_viewer
+        )
+
+        assert response.status_code == 403
+
+
+# -----------------------------------------------------------------------------
+# Resend Tests
+# -----------------------------------------------------------------------------
+
+class TestResendNotification:
+    """Tests for resending failed notifications."""
+
+    @pytest.mark.asyncio
+    async def test_resend_delivered_in_background(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        async_engine,
+        auth_headers_admin: dict,
+        test_tenant: Tenant,
+        monkeypatch
+    ):
+        """Test the resend returns the pending entry and the background task sends it."""
+        sent = []
+
+        async def fake_send_sms(self, phone_number, message):
+            sent.append(phone_number)
+            return {"success": True, "message_id": "SM123", "provider": "twilio", "error": None}
+
+        monkeypatch.setattr(
+            notification_service_module, "AsyncSessionLocal",
+            async_sessionmaker(async_engine, expire_on_commit=False)
+        )
+        monkeypatch.setattr(NotificationService, "send_sms", fake_send_sms)
+        await create_logs(db_session, test_tenant.id)
+        failed_log = await db_session.scalar(
+            select(NotificationLog).where(NotificationLog.status == NotificationStatus.FAILED)
+        )
+
+        response = await client.post(
+            f"/api/v1/notifications/logs/{failed_log.id}/resend",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 202
+        assert response.json()["status"] == "pending"
+        assert sent == ["+15550000000"]
+
+        await db_session.refresh(failed_log)
+        assert failed_log.status == NotificationStatus.SENT
+        assert failed_log.retry_count == 1
+        assert failed_log.provider_message_id == "SM123"
+
+        stats = (await client.get(
+            "/api/v1/notifications/statistics",
+            headers=auth_headers_admin
+        )).json()
+        assert stats["by_status"]["sent"] == 2
+        assert stats["by_status"]["failed"] == 0
+        assert stats["by_status"]["pending"] == 0
+        assert stats["total_notifications"] == 2
+
+    @pytest.mark.asyncio
+    async def test_resend_only_failed(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant
+    ):
+        """Test notifications that did not fail cannot be resent."""
+        await create_logs(db_session, test_tenant.id)
+        sent_log = await db_session.scalar(
+            select(NotificationLog).where(NotificationLog.status == NotificationStatus.SENT)
+        )
+
+        response = await client.post(
+            f"/api/v1/notifications/logs/{sent_log.id}/resend",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_resend_error_marks_failed_again(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        async_engine,
+        auth_headers_admin: dict,
+        test_tenant: Tenant,
+        monkeypatch
+    ):
+        """Test a resend task that raises leaves the entry FAILED, not PENDING."""
+        async def broken_send_sms(self, phone_number, message):
+            raise RuntimeError("provider client crashed")
+
+        monkeypatch.setattr(
+            notification_service_module, "AsyncSessionLocal",
+            async_sessionmaker(async_engine, expire_on_commit=False)
+        )
+        monkeypatch.setattr(NotificationService, "send_sms", broken_send_sms)
+        await create_logs(db_session, test_tenant.id)
+        failed_log = await db_session.scalar(
+            select(NotificationLog).where(NotificationLog.status == NotificationStatus.FAILED)
+        )
+
+        response = await client.post(
+            f"/api/v1/notifications/logs/{failed_log.id}/resend",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 202
+        await db_session.refresh(failed_log)
+        assert failed_log.status == NotificationStatus.FAILED
+        assert failed_log.error_message == "provider client crashed"
+
+        stats = (await client.get(
+            "/api/v1/notifications/statistics",
+            headers=auth_headers_admin
+        )).json()
+        assert stats["by_status"]["failed"] == 1
+        assert stats["by_status"]["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_resend_stale_pending(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers_admin: dict,
+        test_tenant: Tenant,
+        monkeypatch
+    ):
+        """Test a PENDING entry can be resent only once its grace period has passed."""
+        monkeypatch.setattr(notifications_api, "resend_notification_log", AsyncMock())
+        await create_logs(db_session, test_tenant.id)
+        log = await db_session.scalar(
+            select(NotificationLog).where(NotificationLog.status == NotificationStatus.FAILED)
+        )
+        await NotificationService(db_session).set_log_status(log, NotificationStatus.PENDING)
+        log.resend_requested_at = datetime.utcnow()
+        await db_session.commit()
+
+        url = f"/api/v1/notifications/logs/{log.id}/resend"
+        assert (await client.post(url, headers=auth_headers_admin)).status_code == 400
+
+        log.resend_requested_at = datetime.utcnow() - notifications_api.RESEND_PENDING_GRACE * 2
+        await db_session.commit()
+        assert (await client.post(url, headers=auth_headers_admin)).status_code == 202
+
+
+# -----------------------------------------------------------------------------
+# Test Notification Tests
+# -----------------------------------------------------------------------------
+
+class TestSendTestNotification:
+    """Tests for sending test notifications."""
+
+    @pytest.mark.asyncio
+    async def test_failed_email_logged_with_smtp_provider(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        async_engine,
+        auth_headers_admin: dict,
+        monkeypatch
+    ):
+        """Test a failed test email is logged in the background against the smtp provider."""
+        async def fake_send_email(self, to, subject, body, html_body=None):
+            return {"success": False, "message_id": None, "error": "SMTP not configured"}
+
+        monkeypatch.setattr(
+            notification_service_module, "AsyncSessionLocal",
+            async_sessionmaker(async_engine, expire_on_commit=False)
+        )
+        monkeypatch.setattr(NotificationService, "send_email", fake_send_email)
+
+        response = await client.post(
+            "/api/v1/notifications/test",
+            json={"channel": "email", "recipient_email": "ops@example.com"},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        assert response.json()["success"] is False
+
+        log = await db_session.scalar(
+            select(NotificationLog).where(NotificationLog.recipient_email == "ops@example.com")
+        )
+        assert log.status == NotificationStatus.FAILED
+        assert log.provider == "smtp"
+        assert log.recipient_phone is None
+
+
+# -----------------------------------------------------------------------------
+# Partition Maintenance Tests
+# -----------------------------------------------------------------------------
+
+class TestNotificationPartitions:
+    """Tests for the notification log partition job."""
+
+    def test_partition_months_cross_year(self):
+        """Test upcoming partitions roll over into the next year."""
+        assert partition_months(date(2026, 11, 15)) == [(2026, 11), (2026, 12), (2027, 1)]
+
+    def test_partition_ddl_bounds(self):
+        """Test a December partition ends at January of the next year."""
+        ddl = partition_ddl(2026, 12)
+
+        assert "IF NOT EXISTS notification_logs_2026_12 " in ddl
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in ddl
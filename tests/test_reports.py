@@ -3,7 +3,11 @@ Tests for Report Generation and Snapshot Management
 
 Tests cover:
 - Real-time report summary generation
+- Daily ticket volume trends
+- Period statistics and distribution
+- Aggregates shared through the response cache
 - CSV export functionality
+- Background XLSX export jobs
 - Daily, weekly, and monthly snapshot generation
 - Snapshot retrieval and listing
 - Snapshot deletion with permissions
@@ -11,22 +15,30 @@ Tests cover:
 - SLA compliance rate calculation
 - Top sites by ticket count
 """
+import csv
+import io
+
 import pytest
 from datetime import datetime, date, timedelta
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCategory
 from app.models.report import ReportSnapshot, PeriodType
 from app.models.user import User, UserRole
 from app.models.tenant import Tenant
 from app.models.asset import Site
+from app.api.v1 import reports as reports_api
+from app.core.response_cache import ResponseCache
 from app.services.report_service import ReportService
+from app.services import ticket_export
+from app.services.ticket_export import ExportJobStore
 from tests.conftest import (
     TicketFactory,
     SiteFactory,
     ReportSnapshotFactory,
-    UserFactory
+    UserFactory,
+    FakeRedis
 )
 
 
@@ -166,6 +178,242 @@ class TestReportSummary:
         assert data["sla_breached"] == 1
         assert data["sla_compliance_rate"] == 0.75
 
+    @pytest.mark.asyncio
+    async def test_report_summary_breakdown_and_resolution_time(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test per-dimension counts and average resolution time over closed tickets."""
+        now = datetime.utcnow()
+        for hours in (2, 4):
+            ticket = await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id,
+                status=TicketStatus.CLOSED,
+                priority=TicketPriority.HIGH,
+                opened_at=now - timedelta(hours=hours)
+            )
+            ticket.closed_at = now
+        await db_session.commit()
+        await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id,
+            category=TicketCategory.NETWORK
+        )
+
+        response = await client.get(
+            "/api/v1/reports/summary",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["by_status"] == {"closed": 2, "new": 1}
+        assert data["by_priority"] == {"high": 2, "medium": 1}
+        assert data["by_category"] == {"hardware": 2, "network": 1}
+        assert data["avg_resolution_time_hours"] == 3.0
+
+
+# -----------------------------------------------------------------------------
+# Report Trends Tests
+# -----------------------------------------------------------------------------
+
+class TestReportTrends:
+    """Tests for daily ticket volume trends."""
+
+    @pytest.mark.asyncio
+    async def test_trends_densified_by_day(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test tickets are counted per day and empty days are filled with zero."""
+        today = date.today()
+        for created_at in (
+            datetime.combine(today, datetime.min.time()) + timedelta(hours=9),
+            datetime.combine(today, datetime.min.time()) + timedelta(hours=17),
+            datetime.combine(today - timedelta(days=2), datetime.min.time()) + timedelta(hours=12),
+        ):
+            ticket = await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id
+            )
+            ticket.created_at = created_at
+        await db_session.commit()
+
+        response = await client.get(
+            "/api/v1/reports/trends",
+            params={"start_date": str(today - timedelta(days=3)), "end_date": str(today)},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["labels"] == [str(today - timedelta(days=n)) for n in (3, 2, 1, 0)]
+        assert data["values"] == [0, 1, 0, 2]
+
+
+# -----------------------------------------------------------------------------
+# Report Stats and Distribution Tests
+# -----------------------------------------------------------------------------
+
+class TestReportStatsAndDistribution:
+    """Tests for period statistics and category/priority distribution."""
+
+    @pytest.mark.asyncio
+    async def test_stats_against_previous_period(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test current-period metrics and the trend against the previous period."""
+        today = date.today()
+        specs = [
+            (today, TicketStatus.CLOSED, True),
+            (today, TicketStatus.NEW, False),
+            (today - timedelta(days=10), TicketStatus.RESOLVED, False),
+        ]
+        for created_day, ticket_status, breached in specs:
+            ticket = await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id,
+                status=ticket_status,
+                sla_breached=breached
+            )
+            ticket.created_at = datetime.combine(created_day, datetime.min.time()) + timedelta(hours=12)
+        await db_session.commit()
+
+        response = await client.get(
+            "/api/v1/reports/stats",
+            params={"start_date": str(today - timedelta(days=6)), "end_date": str(today)},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_tickets"] == 2
+        assert data["resolved_count"] == 1
+        assert data["sla_breach_rate"] == 50.0
+        assert data["total_trend"] == 100.0
+        assert data["resolved_trend"] == 0
+
+    @pytest.mark.asyncio
+    async def test_distribution_percentages(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test distribution items are sorted by count with percentages of the total."""
+        for category in (TicketCategory.NETWORK, TicketCategory.NETWORK, TicketCategory.POWER, TicketCategory.POWER):
+            await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id,
+                category=category,
+                priority=TicketPriority.HIGH if category == TicketCategory.POWER else TicketPriority.LOW
+            )
+        await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id,
+            category=TicketCategory.NETWORK,
+            priority=TicketPriority.LOW
+        )
+
+        today = date.today()
+        response = await client.get(
+            "/api/v1/reports/distribution",
+            params={"start_date": str(today), "end_date": str(today)},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["by_category"] == [
+            {"name": "network", "count": 3, "percentage": 60.0},
+            {"name": "power", "count": 2, "percentage": 40.0},
+        ]
+        assert data["by_priority"][0] == {"name": "low", "count": 3, "percentage": 60.0}
+
+
+# -----------------------------------------------------------------------------
+# Report Aggregate Cache Tests
+# -----------------------------------------------------------------------------
+
+class TestReportAggregateCache:
+    """Tests for sharing cached ticket aggregates across report endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_summary_and_distribution_share_one_aggregate(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User,
+        monkeypatch
+    ):
+        """Test endpoints for the same range reuse the cached aggregate."""
+        monkeypatch.setattr(reports_api, "response_cache", ResponseCache(client=FakeRedis()))
+        calls = []
+        original = ReportService.summarize_ticket_windows
+
+        async def counting_summarize(self, *args, **kwargs):
+            calls.append(args)
+            return await original(self, *args, **kwargs)
+
+        monkeypatch.setattr(ReportService, "summarize_ticket_windows", counting_summarize)
+        await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id
+        )
+        today = str(date.today())
+
+        summary = await client.get(
+            "/api/v1/reports/summary",
+            params={"from_date": today, "to_date": today},
+            headers=auth_headers_admin
+        )
+        distribution = await client.get(
+            "/api/v1/reports/distribution",
+            params={"start_date": today, "end_date": today},
+            headers=auth_headers_admin
+        )
+
+        assert summary.json()["total_tickets"] == 1
+        assert distribution.json()["by_category"][0]["count"] == 1
+        assert len(calls) == 1
+
 
 # -----------------------------------------------------------------------------
 # CSV Export Tests
@@ -216,6 +464,99 @@ class TestCsvExport:
         assert "Status" in header
         assert "Priority" in header
 
+    @pytest.mark.asyncio
+    async def test_export_csv_streams_in_batches(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User,
+        monkeypatch
+    ):
+        """Test every ticket is written when the export spans several fetch batches."""
+        monkeypatch.setattr(ticket_export, "EXPORT_BATCH_SIZE", 2)
+        for i in range(5):
+            await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id,
+                title=f"Batch Ticket {i}"
+            )
+
+        response = await client.get(
+            "/api/v1/reports/export/csv",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        lines = response.text.strip().splitlines()
+        assert len(lines) == 6
+        assert sorted(line.split(",")[1] for line in lines[1:]) == [f"Batch Ticket {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_export_csv_quotes_special_characters(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test titles with commas, quotes and newlines parse back unchanged."""
+        title = 'Charger "A", bay 2\nno power'
+        await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id,
+            title=title
+        )
+
+        response = await client.get(
+            "/api/v1/reports/export/csv",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text, newline="")))
+        assert rows[0][1] == "Title"
+        assert len(rows) == 2
+        assert rows[1][1] == title
+        assert len(rows[1]) == 8
+
+    @pytest.mark.asyncio
+    async def test_export_csv_gzipped(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test the streamed CSV export is gzip-encoded for clients that accept it."""
+        for i in range(3):
+            await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id,
+                title=f"Gzip Ticket {i}"
+            )
+
+        response = await client.get(
+            "/api/v1/reports/export/csv",
+            headers={**auth_headers_admin, "Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.text.strip().splitlines()) == 4
+
     @pytest.mark.asyncio
     async def test_export_csv_with_date_filter(
         self,
@@ -262,6 +603,136 @@ class TestCsvExport:
         assert len(lines) == 1
 
 
+# -----------------------------------------------------------------------------
+# XLSX Export Job Tests
+# -----------------------------------------------------------------------------
+
+class TestXlsxExportJobs:
+    """Tests for background XLSX export jobs."""
+
+    @pytest.fixture
+    def job_store(self, monkeypatch, async_engine):
+        """Use a fresh Redis-backed job store and a job session on the test engine."""
+        store = ExportJobStore(client=FakeRedis())
+        monkeypatch.setattr(ticket_export, "export_jobs", store)
+        monkeypatch.setattr(reports_api, "export_jobs", store)
+        monkeypatch.setattr(reports_api, "xlsx_supported", lambda: True)
+        monkeypatch.setattr(
+            ticket_export, "AsyncSessionLocal",
+            async_sessionmaker(async_engine, expire_on_commit=False)
+        )
+        return store
+
+    @pytest.mark.asyncio
+    async def test_export_job_completes_with_download_url(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        test_tenant: Tenant,
+        job_store: ExportJobStore,
+        monkeypatch
+    ):
+        """Test the job is accepted at once and its poll returns the uploaded file URL."""
+        uploads = []
+
+        async def fake_build(db, tenant_id, start_date, end_date):
+            return f"xlsx:{tenant_id}:{start_date}".encode()
+
+        async def fake_upload(key, content, media_type):
+            uploads.append((key, content))
+            return f"https://s3.test/{key}"
+
+        monkeypatch.setattr(ticket_export, "build_tickets_xlsx", fake_build)
+        monkeypatch.setattr(ticket_export, "upload_export", fake_upload)
+
+        response = await client.post(
+            "/api/v1/reports/export/xlsx?start_date=2025-01-01",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "pending"
+        assert job["download_url"] is None
+
+        response = await client.get(
+            f"/api/v1/reports/export/xlsx/{job['job_id']}",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        key, content = uploads[0]
+        assert key.startswith(f"exports/{test_tenant.id}/{job['job_id']}/")
+        assert content == f"xlsx:{test_tenant.id}:2025-01-01".encode()
+        assert data["download_url"] == f"https://s3.test/{key}"
+
+    @pytest.mark.asyncio
+    async def test_export_job_failure_recorded(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        job_store: ExportJobStore,
+        monkeypatch
+    ):
+        """Test a failing export marks the job failed with the reason."""
+        async def failing_build(db, tenant_id, start_date, end_date):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(ticket_export, "build_tickets_xlsx", failing_build)
+
+        response = await client.post("/api/v1/reports/export/xlsx", headers=auth_headers_admin)
+        job_id = response.json()["job_id"]
+
+        response = await client.get(
+            f"/api/v1/reports/export/xlsx/{job_id}",
+            headers=auth_headers_admin
+        )
+
+        data = response.json()
+        assert data["status"] == "failed"
+        assert data["error"] == "disk full"
+        assert data["download_url"] is None
+
+    @pytest.mark.asyncio
+    async def test_export_job_other_tenant_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        job_store: ExportJobStore
+    ):
+        """Test jobs of another tenant, and unknown jobs, are not found."""
+        job = await ticket_export.create_xlsx_export_job("other-tenant")
+
+        response = await client.get(
+            f"/api/v1/reports/export/xlsx/{job['job_id']}",
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 404
+
+        response = await client.get(
+            "/api/v1/reports/export/xlsx/missing",
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_export_job_requires_openpyxl(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        job_store: ExportJobStore,
+        monkeypatch
+    ):
+        """Test no job is started when openpyxl is not installed."""
+        monkeypatch.setattr(reports_api, "xlsx_supported", lambda: False)
+
+        response = await client.post("/api/v1/reports/export/xlsx", headers=auth_headers_admin)
+
+        assert response.status_code == 501
+
+
 # -----------------------------------------------------------------------------
 # Snapshot Generation Tests
 # -----------------------------------------------------------------------------
@@ -474,6 +945,69 @@ class TestSnapshotRetrieval:
         for item in data["items"]:
             assert item["period_type"] == "week"
 
+    @pytest.mark.asyncio
+    async def test_list_snapshots_total_across_pages(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant
+    ):
+        """Test the total counts every match, on a partial page and past the last page."""
+        for _ in range(3):
+            await ReportSnapshotFactory.create(db_session, tenant_id=test_tenant.id)
+
+        response = await client.get(
+            "/api/v1/reports/snapshots?limit=2",
+            headers=auth_headers_admin
+        )
+        data = response.json()
+        assert data["total"] == 3
+        assert len(data["items"]) == 2
+
+        response = await client.get(
+            "/api/v1/reports/snapshots?skip=5&limit=2",
+            headers=auth_headers_admin
+        )
+        data = response.json()
+        assert data["total"] == 3
+        assert data["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_recent_snapshots_table_rows(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant
+    ):
+        """Test the recent snapshots table reads its metrics, defaulting missing ones to 0."""
+        full = await ReportSnapshotFactory.create(db_session, tenant_id=test_tenant.id)
+        sparse = await ReportSnapshotFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            metrics={"total_created": 2}
+        )
+
+        response = await client.get(
+            "/api/v1/reports/snapshots/recent?limit=5",
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        rows = {row["id"]: row for row in response.json()["snapshots"]}
+        assert rows[full.id] == {
+            "id": full.id,
+            "date": date.today().isoformat(),
+            "total": 10,
+            "resolved": 5,
+            "breached": 1,
+            "avgTime": 270,
+        }
+        assert rows[sparse.id]["total"] == 2
+        assert rows[sparse.id]["resolved"] == 0
+        assert rows[sparse.id]["avgTime"] == 0
+
     @pytest.mark.asyncio
     async def test_get_snapshot_by_id(
         self,
@@ -13,7 +13,7 @@ Tests cover:
 import pytest
 from datetime import datetime, timedelta
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
 
 from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCategory
@@ -22,7 +22,12 @@ from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.asset import Site
 from app.services.sla_service import SlaService
+from app.jobs import sla_batch as sla_batch_module
+from app.api.v1 import sla as sla_api
+from app.core.response_cache import ResponseCache
 from tests.conftest import (
+    FakeRedis,
+    TenantFactory,
     TicketFactory,
     SlaPolicyFactory,
     SlaMeasurementFactory,
@@ -213,6 +218,38 @@ class TestSlaPolicyRetrieval:
 
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_policy_list_cache_invalidated_on_write(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        monkeypatch
+    ):
+        """Test the cached policy list is dropped when a policy is created."""
+        monkeypatch.setattr(sla_api, "response_cache", ResponseCache(client=FakeRedis()))
+
+        response = await client.get("/api/v1/sla/policies", headers=auth_headers_admin)
+        assert response.headers["x-cache"] == "miss"
+        assert response.json()["total"] == 0
+
+        response = await client.get("/api/v1/sla/policies", headers=auth_headers_admin)
+        assert response.headers["x-cache"] == "hit"
+
+        await client.post(
+            "/api/v1/sla/policies",
+            json={
+                "category": "hardware",
+                "priority": "high",
+                "response_time_minutes": 30,
+                "resolution_time_minutes": 240
+            },
+            headers=auth_headers_admin
+        )
+
+        response = await client.get("/api/v1/sla/policies", headers=auth_headers_admin)
+        assert response.headers["x-cache"] == "miss"
+        assert response.json()["total"] == 1
+
 
 class TestSlaPolicyUpdate:
     """Tests for updating SLA policies."""
@@ -254,6 +291,18 @@ class TestSlaPolicyUpdate:
 
         assert response.status_code == 204
 
+        response = await client.get(
+            f"/api/v1/sla/policies/{test_sla_policy.id}",
+            headers=auth_headers_admin
+        )
+        assert response.json()["is_active"] is False
+
+        response = await client.delete(
+            "/api/v1/sla/policies/nonexistent-id",
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 404
+
 
 # -----------------------------------------------------------------------------
 # SLA Calculation Tests
@@ -795,6 +844,178 @@ class TestSlaApiEndpoints:
         # Should be breached after 1 hour with 15 min target
         assert data["sla_breached"] is True
 
+    @pytest.mark.asyncio
+    async def test_list_sla_measurements_streams_in_batches(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User,
+        monkeypatch
+    ):
+        """Test a page spanning several fetch batches is one valid JSON array."""
+        monkeypatch.setattr(sla_api, "MEASUREMENT_BATCH_SIZE", 2)
+        policy = await SlaPolicyFactory.create(db_session, tenant_id=test_tenant.id)
+        ticket_ids = []
+        for _ in range(5):
+            ticket = await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id
+            )
+            await SlaMeasurementFactory.create(db_session, ticket_id=ticket.id, policy_id=policy.id)
+            ticket_ids.append(ticket.id)
+
+        response = await client.get("/api/v1/sla/measurements", headers=auth_headers_admin)
+
+        assert response.status_code == 200
+        assert sorted(item["ticket_id"] for item in response.json()) == sorted(ticket_ids)
+
+        response = await client.get(
+            "/api/v1/sla/measurements?status=breached",
+            headers=auth_headers_admin
+        )
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_list_sla_measurements_cursor_pages(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test following X-Next-Cursor visits every measurement exactly once."""
+        policy = await SlaPolicyFactory.create(db_session, tenant_id=test_tenant.id)
+        measurement_ids = []
+        for _ in range(5):
+            ticket = await TicketFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                created_by=admin_user.id
+            )
+            measurement = await SlaMeasurementFactory.create(
+                db_session, ticket_id=ticket.id, policy_id=policy.id
+            )
+            measurement_ids.append(measurement.id)
+
+        seen = []
+        url = "/api/v1/sla/measurements?limit=2"
+        while True:
+            response = await client.get(url, headers=auth_headers_admin)
+            assert response.status_code == 200
+            seen.extend(item["id"] for item in response.json())
+            next_cursor = response.headers.get("x-next-cursor")
+            if next_cursor is None:
+                break
+            url = f"/api/v1/sla/measurements?limit=2&cursor={next_cursor}"
+
+        assert sorted(seen) == sorted(measurement_ids)
+        assert len(seen) == len(measurement_ids)
+
+        response = await client.get(
+            "/api/v1/sla/measurements?cursor=not-a-cursor",
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_ticket_sla_endpoints_other_tenant_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        test_site: Site,
+        admin_user: User
+    ):
+        """Test the ticket SLA endpoints return 404 for another tenant's ticket."""
+        other_tenant = await TenantFactory.create(db_session, name="Other Tenant")
+        ticket = await TicketFactory.create(
+            db_session,
+            tenant_id=other_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id
+        )
+
+        for method, path in [
+            ("GET", f"/api/v1/sla/tickets/{ticket.id}"),
+            ("GET", f"/api/v1/sla/tickets/{ticket.id}/breach"),
+            ("POST", f"/api/v1/sla/tickets/{ticket.id}/recalculate"),
+        ]:
+            response = await client.request(method, path, headers=auth_headers_admin)
+            assert response.status_code == 404, path
+
+    @pytest.mark.asyncio
+    async def test_batch_recalculate_selected_tickets(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        db_session: AsyncSession,
+        async_engine,
+        test_tenant: Tenant,
+        test_site: Site,
+        admin_user: User,
+        monkeypatch
+    ):
+        """Test recalculating selected tickets reports breaches and unknown IDs."""
+        # The in-memory test database is one shared connection, so per-ticket
+        # sessions must not interleave their transactions
+        monkeypatch.setattr(sla_batch_module, "SLA_RECALC_CONCURRENCY", 1)
+        monkeypatch.setattr(
+            sla_batch_module, "AsyncSessionLocal",
+            async_sessionmaker(async_engine, expire_on_commit=False)
+        )
+        await SlaPolicyFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            category="power",
+            priority="critical",
+            response_time_minutes=15,
+            resolution_time_minutes=120
+        )
+        late = await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id,
+            category=TicketCategory.POWER,
+            priority=TicketPriority.CRITICAL,
+            opened_at=datetime.utcnow() - timedelta(hours=1)
+        )
+        fresh = await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id,
+            category=TicketCategory.POWER,
+            priority=TicketPriority.CRITICAL,
+            opened_at=datetime.utcnow()
+        )
+
+        response = await client.post(
+            "/api/v1/sla/recalculate",
+            json={"ticket_ids": [late.id, "missing-ticket", fresh.id]},
+            headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_processed"] == 2
+        assert data["breached"] == 1
+        assert data["within_sla"] == 1
+        assert data["errors"] == ["Ticket not found: missing-ticket"]
+
+        measurements = await db_session.execute(
+            select(SlaMeasurement.ticket_id).where(SlaMeasurement.ticket_id.in_([late.id, fresh.id]))
+        )
+        assert sorted(measurements.scalars().all()) == sorted([late.id, fresh.id])
+
     @pytest.mark.asyncio
     async def test_get_sla_statistics(
         self,
@@ -830,9 +1051,18 @@ class TestSlaApiEndpoints:
                 db_session,
                 ticket_id=ticket.id,
                 policy_id=policy.id,
+                status=SlaStatus.BREACHED if i == 0 else SlaStatus.ACTIVE,
                 response_breached=(i == 0)
             )
 
+        # A ticket without an SLA measurement counts towards the total only
+        await TicketFactory.create(
+            db_session,
+            tenant_id=test_tenant.id,
+            site_id=test_site.id,
+            created_by=admin_user.id
+        )
+
         response = await client.get(
             "/api/v1/sla/statistics?days=30",
             headers=auth_headers_admin
@@ -840,8 +1070,12 @@ class TestSlaApiEndpoints:
 
         assert response.status_code == 200
         data = response.json()
-        assert "total_tickets" in data
-        assert "breach_rate_percentage" in data
+        assert data["total_tickets"] == 4
+        assert data["tickets_with_sla"] == 3
+        assert data["breached_count"] == 1
+        assert data["active_count"] == 2
+        assert data["met_count"] == 0
+        assert data["breach_rate_percentage"] == 33.33
 
     @pytest.mark.asyncio
     async def test_list_sla_measurements(
@@ -884,6 +1118,9 @@ class TestSlaApiEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 3
+        assert data[0]["policy_id"] == policy.id
+        assert data[0]["status"] == "active"
+        assert data[0]["response_breached"] is False
 
     @pytest.mark.asyncio
     async def test_filter_measurements_by_breach_status(
@@ -0,0 +1,141 @@
+"""
+Tests for the SSE Connection Manager
+
+Tests cover:
+- Heartbeat pings queued by the per-connection timer
+- Heartbeat cancellation on disconnect
+- Bounded per-connection message queue
+- Coalescing of queued events into stream chunks
+- SSE frame encoding
+- Token authentication cache
+"""
+import asyncio
+
+import pytest
+
+from app.api.v1 import sse as sse_api
+from app.core.sse import ConnectionManager, SSEConnection, SSEMessageQueue, SSE_PING, sse_pack
+from app.models.user import UserRole
+
+
+# -----------------------------------------------------------------------------
+# Heartbeat Tests
+# -----------------------------------------------------------------------------
+
+class TestSseHeartbeat:
+    """Tests for SSE keep-alive pings."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_queues_pings_until_disconnect(self):
+        """Test the heartbeat timer queues pings and stops on disconnect."""
+        manager = ConnectionManager()
+        connection = await manager.connect(user_id="user-1", tenant_id="tenant-1")
+        connection.stop_heartbeat()
+        connection.start_heartbeat(interval=0.01)
+
+        assert await asyncio.wait_for(connection.queue.get(), 1) == SSE_PING
+        assert await asyncio.wait_for(connection.queue.get(), 1) == SSE_PING
+
+        await manager.disconnect(connection)
+        while not connection.queue.empty():
+            connection.queue.get_nowait()
+        await asyncio.sleep(0.05)
+
+        assert connection.queue.empty()
+        assert manager.get_stats()["total_connections"] == 0
+
+
+# -----------------------------------------------------------------------------
+# Message Queue Tests
+# -----------------------------------------------------------------------------
+
+class TestSseMessageQueue:
+    """Tests for the per-connection SSE message buffer."""
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self):
+        """Test a waiting get() is woken by put_nowait()."""
+        queue = SSEMessageQueue()
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        queue.put_nowait(b"event: a\n\n")
+
+        assert await asyncio.wait_for(waiter, 1) == b"event: a\n\n"
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """Test a full queue drops its oldest message and counts it."""
+        queue = SSEMessageQueue(capacity=2)
+        for message in (b"a", b"b", b"c"):
+            queue.put_nowait(message)
+
+        assert queue.dropped == 1
+        assert [queue.get_nowait(), queue.get_nowait()] == [b"b", b"c"]
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+
+# -----------------------------------------------------------------------------
+# Event Generator Tests
+# -----------------------------------------------------------------------------
+
+class TestSseEventGenerator:
+    """Tests for the SSE stream generator."""
+
+    @pytest.mark.asyncio
+    async def test_burst_drained_into_capped_chunks(self, monkeypatch):
+        """Test queued events are joined into chunks of at most the drain limit."""
+        monkeypatch.setattr(sse_api, "SSE_DRAIN_MAX_MESSAGES", 3)
+        connection = SSEConnection(user_id="user-1", tenant_id="tenant-1")
+        events = [sse_pack("e", {"i": i}) for i in range(5)]
+        for event in events:
+            connection.queue.put_nowait(event)
+
+        stream = sse_api.event_generator(connection)
+        first = await stream.__anext__()
+        second = await stream.__anext__()
+        await stream.aclose()
+
+        assert first == b"".join(events[:3])
+        assert second == b"".join(events[3:])
+
+    def test_sse_pack_escapes_data(self):
+        """Test frames carry the data as escaped JSON."""
+        frame = sse_pack("connected", {"user_id": 'a"b'})
+
+        assert frame == b'event: connected\ndata: {"user_id":"a\\"b"}\n\n'
+
+
+# -----------------------------------------------------------------------------
+# Authentication Tests
+# -----------------------------------------------------------------------------
+
+class TestSseAuthentication:
+    """Tests for SSE token authentication."""
+
+    @pytest.mark.asyncio
+    async def test_token_cached_until_ttl(self, monkeypatch, db_session, admin_user, admin_token):
+        """Test an accepted token skips the user lookup until its cache entry expires."""
+        monkeypatch.setattr(sse_api, "_auth_cache", {})
+
+        user = await sse_api.get_user_from_token(admin_token, db_session)
+        assert user == (admin_user.id, admin_user.tenant_id, UserRole.ADMIN)
+
+        admin_user.is_active = False
+        await db_session.commit()
+
+        assert await sse_api.get_user_from_token(admin_token, db_session) == user
+
+        monkeypatch.setattr(sse_api, "SSE_AUTH_CACHE_SECONDS", 0.0)
+        sse_api._auth_cache.clear()
+        assert await sse_api.get_user_from_token(admin_token, db_session) is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_not_cached(self, monkeypatch, db_session):
+        """Test rejected tokens are not remembered."""
+        monkeypatch.setattr(sse_api, "_auth_cache", {})
+
+        assert await sse_api.get_user_from_token("not-a-jwt", db_session) is None
+        assert sse_api._auth_cache == {}
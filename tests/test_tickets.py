@@ -19,6 +19,9 @@ from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCatego
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.asset import Site, Charger
+from app.api.v1 import tickets
+from app.core.sse import connection_manager
+from app.services.event_publisher import TicketEventQueue
 from tests.conftest import TicketFactory, ChargerFactory
 
 
@@ -553,6 +556,44 @@ class TestTicketUpdate:
 
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_update_event_published_by_queue(
+        self,
+        client: AsyncClient,
+        auth_headers_admin: dict,
+        admin_user: User,
+        test_ticket: Ticket,
+        monkeypatch
+    ):
+        """Test the ticket_updated event is queued serialized and broadcast by the worker."""
+        published = []
+
+        async def fake_broadcast(tenant_id, event_type, data, exclude_user_id=None):
+            published.append((tenant_id, event_type, data, exclude_user_id))
+
+        queue = TicketEventQueue()
+        monkeypatch.setattr(tickets, "ticket_event_queue", queue)
+        monkeypatch.setattr(connection_manager, "broadcast_to_tenant", fake_broadcast)
+
+        queue.start()
+        try:
+            response = await client.patch(
+                f"/api/v1/tickets/{test_ticket.id}",
+                json={"title": "Queued Title"},
+                headers=auth_headers_admin
+            )
+            await queue.join()
+        finally:
+            await queue.stop()
+
+        assert response.status_code == 200
+        [(tenant_id, event_type, data, exclude_user_id)] = published
+        assert (tenant_id, event_type, exclude_user_id) == (
+            test_ticket.tenant_id, "ticket_updated", admin_user.id
+        )
+        assert data["ticket"]["title"] == "Queued Title"
+        assert data["updated_fields"] == {"title": "Queued Title"}
+
 
 # -----------------------------------------------------------------------------
 # Ticket Status Change Tests
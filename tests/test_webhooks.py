@@ -10,13 +10,14 @@ Tests cover:
 - Auto-ticket creation for critical faults
 - Error handling for invalid payloads
 """
+import asyncio
 import pytest
 import hashlib
 import hmac
 import json
 from datetime import datetime
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
 from unittest.mock import patch
 
@@ -25,8 +26,10 @@ from app.models.ticket import Ticket, TicketStatus, TicketChannel, TicketCategor
 from app.models.asset import Charger
 from app.models.tenant import Tenant
 from app.models.csms import FirmwareJobRef, FirmwareJobStatus
+from app.services import webhook_service as webhook_service_module
 from app.services.webhook_service import WebhookService
 from app.schemas.webhook import (
+    ChargerEventPayload,
     WebhookEventType,
     ChargerEventSeverity,
     FirmwareUpdateStatus
@@ -475,6 +478,17 @@ class TestFirmwareUpdateWebhook:
 class TestBatchWebhook:
     """Tests for batch webhook processing."""
 
+    @pytest.fixture(autouse=True)
+    def batch_sessions(self, async_engine, monkeypatch):
+        """Run batch events on the test database, one charger group at a time."""
+        # The in-memory test database is one shared connection, so the
+        # per-charger sessions must not interleave their transactions
+        monkeypatch.setattr(webhook_service_module, "WEBHOOK_BATCH_CONCURRENCY", 1)
+        monkeypatch.setattr(
+            webhook_service_module, "AsyncSessionLocal",
+            async_sessionmaker(async_engine, expire_on_commit=False)
+        )
+
     @pytest.mark.asyncio
     async def test_batch_webhook_multiple_events(
         self,
@@ -589,6 +603,43 @@ class TestBatchWebhook:
         # Should fail validation - events must have at least 1 item
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_concurrent_faults_share_system_user(
+        self,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+        test_site
+    ):
+        """Test concurrent charger groups of one tenant create one system user."""
+        chargers = [
+            await ChargerFactory.create(
+                db_session,
+                tenant_id=test_tenant.id,
+                site_id=test_site.id,
+                csms_charger_id=f"CSMS-BATCH-SYS-{i}"
+            )
+            for i in range(2)
+        ]
+
+        async def process_fault(charger):
+            async with webhook_service_module.AsyncSessionLocal() as db:
+                return await WebhookService(db).process_charger_event(ChargerEventPayload(
+                    event_id=f"evt_sys_{charger.csms_charger_id}",
+                    event_type="Fault",
+                    timestamp=datetime.utcnow(),
+                    csms_charger_id=charger.csms_charger_id,
+                    severity="critical",
+                    error_code="GroundFailure"
+                ))
+
+        results = await asyncio.gather(*(process_fault(charger) for charger in chargers))
+
+        assert all(r.success and r.ticket_id for r in results)
+        tickets = (await db_session.execute(
+            select(Ticket).where(Ticket.id.in_([r.ticket_id for r in results]))
+        )).scalars().all()
+        assert len({ticket.created_by for ticket in tickets}) == 1
+
 
 # -----------------------------------------------------------------------------
 # Webhook Health Check Tests